@@ -0,0 +1,21 @@
+"""
+ServiceNow incident monitor (shared core of Headless.py and Snowhead.py).
+
+Modules:
+    config      credentials, URLs, paths and settings (read as config.NAME)
+    logs        log() and the LiveLogManager behind Log.txt / Live.txt / the viewer
+    metrics     timers and counters served at /metrics
+    scheduler   adaptive poll cadence
+    web         mobile log viewer (HTTP + SSE)
+    memory      L2 memory (SQLite + alert patterns) and row watermarks
+    alerts      non-blocking alert sound
+    console     shift setup and prompts with a countdown
+    browser     Chrome launch (lean/full profile), SSO login, session reuse
+    supervisor  planned browser recycling (memory, cycles, scrape slowdown)
+    scraper     Tab 1 list scrape and the Table API ticket source
+    queues      monitored queues, their priority, cadence and counts
+    processor   Tab 2 updates, operator desk, worker pool
+    main        entry point: python -m snow_monitor [--headless | --headed]
+
+Importing the package is cheap: Selenium and playsound load on first use.
+"""
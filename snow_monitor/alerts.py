@@ -0,0 +1,72 @@
+"""
+Non-blocking alert sound.
+"""
+import os
+import time
+import threading
+import queue
+try:
+    import winsound  # Windows only: plays WAV straight from memory
+except ImportError:
+    winsound = None
+
+from . import config
+from .logs import log
+
+
+# ===================================================================
+# --- ALERT SOUND ---
+# ===================================================================
+class Notifier:
+    """
+    One long-lived player thread fed by a queue, so alerts never block the
+    monitor. Alerts arriving while one is pending or within NOTIFY_MIN_GAP
+    of the last sound are coalesced into a single play.
+    """
+    def __init__(self, sound_path, min_gap=config.NOTIFY_MIN_GAP):
+        self.sound_path = sound_path
+        self.min_gap = min_gap
+        self.pending = queue.Queue(maxsize=1)  # At most one queued play: extra alerts merge into it
+        self.last_played = 0.0
+        self.lock = threading.Lock()
+        self.thread = None
+        self.sound = None  # Cached on first play: ("wav", bytes) | ("file", path) | ("beep", None)
+
+    def notify(self):
+        """Queues a sound and returns immediately."""
+        with self.lock:
+            if self.thread is None:
+                self.thread = threading.Thread(target=self._player, name="notifier", daemon=True)
+                self.thread.start()
+        try: self.pending.put_nowait(time.time())
+        except queue.Full: pass  # A play is already pending for this burst
+
+    def _load(self):
+        clean_path = os.path.abspath(self.sound_path.strip())
+        if not os.path.exists(clean_path): return ("beep", None)
+        if winsound and clean_path.lower().endswith(".wav"):
+            with open(clean_path, "rb") as f:
+                return ("wav", f.read())
+        # playsound decodes MP3 itself; only the path lookup is cached
+        from playsound import playsound  # pip install playsound==1.2.2 (imported on the first alert)
+        return ("file", (playsound, clean_path))
+
+    def _player(self):
+        while True:
+            requested_at = self.pending.get()
+            if requested_at - self.last_played < self.min_gap: continue  # Same burst as the last sound
+            self.last_played = time.time()
+            try:
+                if self.sound is None: self.sound = self._load()
+                kind, data = self.sound
+                if kind == "wav": winsound.PlaySound(data, winsound.SND_MEMORY)
+                elif kind == "file": data[0](data[1])
+                else: print("\a")
+            except Exception as e:
+                log(f"   ⚠️ Sound playback error: {e}")
+
+notifier = Notifier(config.SOUND_PATH)
+
+def play_notification():
+    """Queues the alert sound without blocking (see Notifier)."""
+    notifier.notify()
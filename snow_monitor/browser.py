@@ -0,0 +1,231 @@
+"""
+Chrome launch, SSO login and session persistence.
+"""
+import os
+import json
+import time
+import subprocess
+from urllib.parse import urlsplit
+
+from . import config
+from . import selenium_api as sel
+from .logs import log
+from .metrics import metrics
+
+
+# ===================================================================
+# --- BROWSER INITIALIZATION ---
+# ===================================================================
+class LoginError(Exception):
+    """SSO login did not reach the dashboard (the browser has been closed)."""
+
+# Every authenticated ServiceNow UI page defines the session token g_ck; the SSO login page does not
+SESSION_CHECK_JS = "return !!window.g_ck;"
+# g_ck outlives the server session on a page that is never reloaded: ask the server (one-row Table API
+# read with the page's session). Returns the HTTP status, 0 when Tab 1 is not on a logged-in page
+SESSION_PING_JS = """
+if (!window.g_ck) return 0;
+const xhr = new XMLHttpRequest();
+xhr.open('GET', arguments[0], false);
+xhr.setRequestHeader('Accept', 'application/json');
+xhr.setRequestHeader('X-UserToken', window.g_ck);
+try { xhr.send(); } catch (e) { return 0; }
+return xhr.status;
+"""
+LOGIN_PAGE_IDS = ("btnSetPopup", "corporateOpener", "UsernameInputTxtCorporate")
+
+def is_session_valid(driver):
+    """Cheap health check (one small request): browser responds and the server still knows Tab 1's session."""
+    ping_url = urlsplit(config.BASE_URL).path.rstrip("/") + "/api/now/table/sys_user?sysparm_limit=1&sysparm_fields=sys_id"
+    try:
+        driver.switch_to.window(driver.window_handles[0])
+        return driver.execute_script(SESSION_PING_JS, ping_url) == 200
+    except sel.WebDriverException:
+        return False
+
+def has_session(driver):
+    """Wait condition: the current page is a logged-in ServiceNow page (False while still on SSO or navigating)."""
+    try:
+        return bool(driver.execute_script(SESSION_CHECK_JS))
+    except sel.WebDriverException:
+        return False
+
+def save_session_cookies(driver):
+    """Stores the logged-in session cookies so the next launch can skip SSO."""
+    if not config.COOKIE_FILE_PATH: return
+    try:
+        cookie_dir = os.path.dirname(config.COOKIE_FILE_PATH)
+        if cookie_dir and not os.path.exists(cookie_dir): os.makedirs(cookie_dir)
+        with open(config.COOKIE_FILE_PATH, "w", encoding="utf-8") as f:
+            json.dump(driver.get_cookies(), f)
+    except Exception as e:
+        log(f"      ⚠️ Error saving session cookies: {e}")
+
+def restore_session(driver):
+    """Loads saved cookies (the profile brings its own) and checks if the instance still knows us."""
+    if config.COOKIE_FILE_PATH and os.path.exists(config.COOKIE_FILE_PATH):
+        try:
+            with open(config.COOKIE_FILE_PATH, "r", encoding="utf-8") as f:
+                cookies = json.load(f)
+            driver.get(f"{config.BASE_URL}/robots.txt")  # Cookies can only be set on a page of the same domain
+            for cookie in cookies:
+                try: driver.add_cookie(cookie)
+                except: pass
+        except: pass
+
+    driver.get(config.LOGIN_URL)
+
+    def _decided(d):
+        if d.execute_script(SESSION_CHECK_JS): return "valid"
+        if any(d.find_elements(sel.By.ID, el_id) for el_id in LOGIN_PAGE_IDS): return "login"
+        return False
+    try:
+        return sel.WebDriverWait(driver, config.SESSION_CHECK_TIMEOUT, poll_frequency=config.LOGIN_POLL_INTERVAL).until(_decided) == "valid"
+    except sel.WebDriverException:
+        return False
+
+# Lean profile: nothing the scraper reads needs the background services of a desktop browser
+LEAN_FLAGS = [
+    "--disable-extensions",
+    "--disable-background-networking",
+    "--disable-component-update",
+    "--disable-default-apps",
+    "--disable-sync",
+    "--disable-notifications",
+    "--disable-features=Translate,OptimizationHints,MediaRouter,AutofillServerCommunication",
+    "--metrics-recording-only",
+    "--no-first-run",
+    "--no-default-browser-check",
+    "--mute-audio",
+]
+
+def chrome_options():
+    """Chrome options for config.BROWSER_PROFILE ("lean" or "full")."""
+    opts = sel.Options()
+    if config.HEADLESS: opts.add_argument("--headless=new")
+    opts.add_argument("--disable-gpu")
+    opts.add_argument("--no-sandbox")
+    opts.add_argument("--silent")
+    opts.add_argument("--log-level=3")
+    opts.add_experimental_option("excludeSwitches", ["enable-automation", "enable-logging"])
+    if config.BROWSER_PROFILE != "lean":
+        opts.add_argument("--window-size=1920,1080")
+        return opts
+
+    # driver.get returns at DOMContentLoaded; every step already waits for the element it needs
+    opts.page_load_strategy = "eager"
+    opts.add_argument(f"--window-size={config.LEAN_WINDOW_SIZE}")
+    for flag in LEAN_FLAGS: opts.add_argument(flag)
+    if config.LEAN_RENDERER_HEAP_MB: opts.add_argument(f"--js-flags=--max-old-space-size={config.LEAN_RENDERER_HEAP_MB}")
+    if config.LEAN_RENDERER_PROCESSES: opts.add_argument(f"--renderer-process-limit={config.LEAN_RENDERER_PROCESSES}")
+    opts.add_experimental_option("prefs", {
+        "profile.managed_default_content_settings.images": 2,
+        "profile.default_content_setting_values.notifications": 2,
+    })
+    return opts
+
+def block_heavy_requests(driver):
+    """Lean profile: the current tab stops fetching LEAN_BLOCKED_URLS (stylesheets, fonts, images)."""
+    if config.BROWSER_PROFILE != "lean" or not config.LEAN_BLOCKED_URLS: return
+    try:
+        driver.execute_cdp_cmd("Network.enable", {})
+        driver.execute_cdp_cmd("Network.setBlockedURLs", {"urls": list(config.LEAN_BLOCKED_URLS)})
+    except Exception as e:
+        log(f"      ⚠️ Request blocking unavailable, loading pages in full: {e.__class__.__name__}")
+
+def open_work_tab(driver):
+    """Opens Tab 2 (ticket forms) with the same request blocking as Tab 1, then returns to Tab 1."""
+    driver.execute_script("window.open('about:blank', 'tab2');")
+    driver.switch_to.window(driver.window_handles[1])
+    block_heavy_requests(driver)
+    driver.switch_to.window(driver.window_handles[0])
+
+def ready_for_polling(driver):
+    """Logged in: blocking starts now (the SSO pages keep their styles) and Tab 2 is opened."""
+    block_heavy_requests(driver)
+    open_work_tab(driver)
+
+def click_when_ready(wait, locator):
+    """Clicks the element as soon as it is clickable and nothing overlays it."""
+    def _click(driver):
+        el = sel.EC.element_to_be_clickable(locator)(driver)
+        if not el: return False
+        el.click()  # ElementClickInterceptedException is ignored by the wait -> retried
+        return True
+    wait.until(_click)
+
+@metrics.timed("initialize_driver")
+def initialize_driver(use_profile=True):
+    timings = []  # (step, seconds) for the startup breakdown
+    step_start = time.perf_counter()
+
+    def step_done(name):
+        nonlocal step_start
+        now = time.perf_counter()
+        timings.append((name, now - step_start))
+        step_start = now
+
+    mode = "Headless Mode" if config.HEADLESS else "Headed Mode - visible browser window"
+    log(f"🚀 Launching Chrome ({mode}, {config.BROWSER_PROFILE} profile)")
+    opts = chrome_options()
+    if use_profile and config.PERSIST_SESSION and config.CHROME_PROFILE_DIR:
+        opts.add_argument(f"--user-data-dir={os.path.abspath(config.CHROME_PROFILE_DIR)}")
+
+    # chromedriver's log goes to devnull via the Service: swapping sys.stderr races with pool workers launching
+    driver = sel.webdriver.Chrome(options=opts, service=sel.Service(log_output=subprocess.DEVNULL))
+
+    wait = sel.WebDriverWait(driver, 20)
+    step_done("launch")
+
+    # Login waits poll fast and retry clicks that land on a still-fading overlay
+    login_wait = sel.WebDriverWait(driver, config.LOGIN_TIMEOUT, poll_frequency=config.LOGIN_POLL_INTERVAL,
+                               ignored_exceptions=(sel.StaleElementReferenceException, sel.ElementClickInterceptedException))
+
+    if config.PERSIST_SESSION:
+        restored = restore_session(driver)
+        step_done("session check")
+        if restored:
+            log("✅ Reused saved session (SSO login skipped).")
+            ready_for_polling(driver)
+            log("    ⏱️  Startup: " + " | ".join(f"{name} {secs:.1f}s" for name, secs in timings) +
+                f" | total {sum(secs for _, secs in timings):.1f}s")
+            return driver, wait
+
+    log("🔐 Logging in (Background)")
+    driver.get(config.LOGIN_URL)
+    step_done("login page")
+
+    try:
+        # The cookie popup does not always show: take whichever appears first
+        first = login_wait.until(sel.EC.any_of(
+            sel.EC.element_to_be_clickable((sel.By.ID, "btnSetPopup")),
+            sel.EC.element_to_be_clickable((sel.By.ID, "corporateOpener"))))
+        if first.get_attribute("id") == "btnSetPopup":
+            click_when_ready(login_wait, (sel.By.ID, "btnSetPopup"))
+            login_wait.until(sel.EC.invisibility_of_element_located((sel.By.ID, "btnSetPopup")))
+            step_done("popup")
+
+        click_when_ready(login_wait, (sel.By.ID, "corporateOpener"))
+        step_done("corporate form")
+
+        login_wait.until(sel.EC.element_to_be_clickable((sel.By.ID, "UsernameInputTxtCorporate"))).send_keys(config.USER)
+        login_wait.until(sel.EC.element_to_be_clickable((sel.By.ID, "PasswordInputCorporate"))).send_keys(config.PASSWORD)
+        step_done("credentials")
+
+        click_when_ready(login_wait, (sel.By.ID, "btnLoginCorporate"))
+        # Not the URL: LOGIN_URL (nav_to.do?uri=%2F$pa_dashboard.do) already contains the dashboard's name
+        login_wait.until(has_session)
+        step_done("dashboard")
+        log("✅ Logged in successfully.")
+        if config.PERSIST_SESSION: save_session_cookies(driver)
+        ready_for_polling(driver)
+        log("    ⏱️  Startup: " + " | ".join(f"{name} {secs:.1f}s" for name, secs in timings) +
+            f" | total {sum(secs for _, secs in timings):.1f}s")
+
+    except Exception as e:
+        log(f"❌ Login Failed after '{timings[-1][0]}' step. Error: {e}")
+        try: driver.quit()
+        except: pass
+        raise LoginError(f"login failed after '{timings[-1][0]}' step") from e
+
+    return driver, wait
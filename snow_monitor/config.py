@@ -0,0 +1,124 @@
+"""
+Monitor configuration: credentials, URLs, file paths and tuning settings.
+
+Functions read these as `config.NAME` at call time, so the entry point (and
+the tools) can override them after import. Objects take theirs when they are
+built (constructor defaults), so the singletons created on import keep the
+import-time values: poll_scheduler (POLL_INTERVAL, POLL_SHIFT_PROFILES),
+log_manager (LOG_*, LIVE_WINDOW_SECONDS), notifier (SOUND_PATH,
+NOTIFY_MIN_GAP), metrics (METRICS_WINDOW) and the viewer (LOG_BUFFER_SIZE,
+WEB_KEEPALIVE_TIMEOUT, WEB_SERVER_MAX_WORKERS). Set those here, or on the
+object itself (e.g. poll_scheduler.base, log_manager.update_paths()).
+"""
+import os
+
+
+# ===================================================================
+# --- ✍️ CONFIGURATION (PLACEHOLDERS — REPLACE BEFORE USE) ---
+# ===================================================================
+
+# Credentials (replace with secure retrieval in production)
+USER = "USER_USERNAME"
+PASSWORD = "USER_PASSWORD"
+
+# --- ServiceNow URLs ---
+BASE_URL = "SNOW_BASE_URL"  # e.g. "https://yourinstance.service-now.com"
+LOGIN_URL = f"{BASE_URL}/nav_to.do?uri=%2F$pa_dashboard.do"
+URL_NEW_STATE_LIST = "SNOW_URL_NEW_STATE_LIST"  # e.g. "https://yourinstance.service-now.com/incident_list.do?sysparm_query=state%3D1%5Eassignment_group.name%3DYour%20Group"
+
+# --- File Paths (PLACEHOLDERS - Set to valid paths before running) ---
+SOUND_PATH = r"PATH_TO_NOTIFICATION_SOUND"          # e.g. r"C:\path\to\sound.mp3"
+REOPEN_FILE_PATH = r"PATH_TO_REOPEN_FILE"          # e.g. r"C:\path\to\Reopen.txt"
+WATERMARK_FILE_PATH = os.path.join(os.path.dirname(REOPEN_FILE_PATH), "Watermarks.json")  # Kept next to Reopen.txt
+L2_DB_PATH = os.path.join(os.path.dirname(REOPEN_FILE_PATH), "L2Memory.db")  # Indexed L2 memory (imports Reopen.txt)
+# Session persistence (contain live session cookies - keep them in a private folder)
+CHROME_PROFILE_DIR = os.path.join(os.path.dirname(REOPEN_FILE_PATH), "ChromeProfile")  # None = fresh profile per launch
+COOKIE_FILE_PATH = os.path.join(os.path.dirname(REOPEN_FILE_PATH), "Cookies.json")    # None = don't save cookies
+
+# Default paths (will be overwritten by user choice in runtime)
+LOG_FILE_PATH = r"PATH_TO_LOG_FILE"                # e.g. r"C:\path\to\Log.txt"
+LIVE_FILE_PATH = r"PATH_TO_LIVE_FILE"              # e.g. r"C:\path\to\Live.txt"
+
+# --- Settings ---
+HEADLESS = True            # Chrome without a window (the --headed / --headless flags override this)
+POLL_INTERVAL = 5          # Target seconds from the start of one check to the start of the next
+BULK_SCRAPE = True  # Read the whole incident list in one execute_script round trip
+LOGIN_TIMEOUT = 20         # Max seconds to wait for any single login step
+LOGIN_POLL_INTERVAL = 0.1  # How often login waits re-check the page
+PERSIST_SESSION = True     # Reuse the Chrome profile / saved cookies and skip SSO while the session is alive
+SESSION_CHECK_TIMEOUT = 5  # Max seconds to decide whether a restored session is still logged in
+SAVE_TIMEOUT = 15          # Max seconds to wait for a form save to be confirmed
+SAVE_POLL_INTERVAL = 0.1   # How often the save confirmation is re-checked
+SAVE_RETRIES = 1           # Extra attempts (form reloaded) when a save is not confirmed
+INCREMENTAL_POLLING = True  # Only hand new or changed rows to the processor
+NOTIFY_MIN_GAP = 10         # Seconds: alerts closer together than this play the sound only once
+L2_EXPIRY_DAYS = 90         # Forget L2 decisions not refreshed for this many days (0 = keep forever)
+L2_PATTERN_MODE = "suggest"  # Match new tickets to learned alert patterns: "off", "suggest" or "auto"
+L2_PATTERN_SIMILARITY = 0.7  # Min token overlap (Jaccard) for a fuzzy pattern match
+L2_PATTERN_MIN_HITS = 2      # "auto" only applies patterns seen on at least this many tickets...
+L2_PATTERN_AGREEMENT = 0.9   # ...that got the same state at least this often
+L2_PATTERN_AUTO_SIMILARITY = 1.0  # ...and match this closely (1.0 = same signature; fuzzy matches are only suggested)
+DECOUPLED_PROMPTS = True    # Operator prompts run on their own thread; polling continues while waiting
+WORKER_POOL_SIZE = 0        # Extra browser sessions updating L2 fast-process tickets in parallel (0 = off)
+WATERMARK_RECHECK = 600     # Seconds before an unchanged row is handed over again anyway
+
+# --- Browser Profile ---
+BROWSER_PROFILE = "lean"    # "lean": scraper-only Chrome (below) | "full": stock Chrome at 1920x1080
+LEAN_WINDOW_SIZE = "1280,800"  # Smaller viewport, less to lay out and rasterize
+LEAN_BLOCKED_URLS = [       # Not fetched once logged in (the SSO pages keep their styles); [] = block nothing
+    "*.css*", "*.woff*", "*.ttf*", "*.otf*", "*.eot*",
+    "*.png*", "*.jpg*", "*.jpeg*", "*.gif*", "*.svg*", "*.ico*", "*.webp*",
+]
+LEAN_RENDERER_HEAP_MB = 512  # JS heap cap per renderer process (0 = Chrome default)
+LEAN_RENDERER_PROCESSES = 2  # Max renderer processes (0 = Chrome default)
+
+# --- Browser Recycling ---
+RECYCLE_MAX_CYCLES = 2000     # Swap in a fresh browser after this many cycles on one Chrome (0 = off)...
+RECYCLE_MAX_RSS_MB = 1500     # ...when Chrome's processes use more memory than this (needs psutil; 0 = off)...
+RECYCLE_LATENCY_FACTOR = 2.0  # ...or when the list scrape got this many times slower than after launch (0 = off)
+RECYCLE_LATENCY_WINDOW = 20   # Cycles in the after-launch baseline and in the recent median compared with it
+
+# --- Poll Scheduling ---
+POLL_MIN_INTERVAL = 2       # Cadence right after new tickets show up...
+POLL_BURST_CYCLES = 3       # ...for this many cycles
+POLL_MAX_INTERVAL = 20      # Slowest cadence during long idle periods
+POLL_IDLE_CYCLES = 12       # Quiet cycles (no new tickets) before backing off
+POLL_IDLE_BACKOFF = 1.5     # Interval multiplier per further quiet cycle
+POLL_JITTER = 0.1           # +/- fraction of random spread on every interval
+# Shift-hour profiles: (start "HH:MM", end "HH:MM", base interval). Overrides POLL_INTERVAL
+# while active; ranges may wrap midnight, e.g. [("22:00", "06:00", 10)]
+POLL_SHIFT_PROFILES = []
+# Visual Formatting Settings
+LINE_LENGTH = 92  # Width of the divider lines
+LOG_BUFFER_SIZE = 100  # Number of recent logs to keep in memory
+LOG_QUEUE_SIZE = 10000    # Max lines waiting for the background log writer
+LOG_FLUSH_LINES = 200     # Flush Log.txt/Live.txt after this many lines...
+LOG_FLUSH_INTERVAL = 1.0  # ...or after this many seconds, whichever comes first
+LOG_MAX_BYTES = 20 * 1024 * 1024  # Rotate Log.txt once it passes this size (0 = no size limit)
+LOG_ROTATE_HOURS = 24             # ...or once its first line is this old (0 = no age limit)
+LOG_ARCHIVE_KEEP = 30             # Compressed segments (Log-<date>.txt.gz) to keep (0 = keep all)
+LIVE_WINDOW_SECONDS = 180         # Live.txt holds only the last 3 minutes of lines (0 = append forever)
+WEB_SERVER_PORT = 8000  # Port for mobile log viewer
+SSE_HEARTBEAT = 15      # Seconds between keep-alive comments on idle /api/stream connections
+WEB_SERVER_MAX_WORKERS = 32   # Concurrent viewer connections (each open /api/stream holds one)
+WEB_KEEPALIVE_TIMEOUT = 15    # Seconds an idle keep-alive connection may hold a worker
+GZIP_MIN_BYTES = 512          # Smaller responses are sent uncompressed
+METRICS_WINDOW = 500          # Recent samples per timer kept for the /metrics percentiles
+
+# --- Queues ---
+# More lists checked by the same browser and session. Empty = just URL_NEW_STATE_LIST, as before.
+# Each queue: "name", "query" (encoded query), and optionally "table" (default "incident"), "priority"
+# (lower = checked and processed first), "interval" (seconds between checks, None = every cycle) and
+# "process" (True: tickets go through the L1 workflow, incidents only; False: count only, the default for
+# other tables). Without a processing queue, URL_NEW_STATE_LIST is processed as the "New" queue.
+QUEUES = [
+    # {"name": "Network L1", "query": "state=1^assignment_group.name=Network L1", "priority": 1},
+    # {"name": "Network RITM", "table": "sc_req_item", "query": "active=true^assignment_group.name=Network L1",
+    #  "priority": 3, "interval": 60},
+]
+
+# --- Ticket Source ---
+TICKET_SOURCE = "browser"  # "browser" (render the list in Tab 1), "inpage" (keep it loaded, fetch changes) or "rest" (Table API)
+REST_AUTH = "basic"        # "basic" (USER/PASSWORD) or "session" (reuse the browser login cookies)
+REST_PAGE_SIZE = 500       # Records per Table API page
+REST_TIMEOUT = 15          # Seconds per Table API request
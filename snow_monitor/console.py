@@ -0,0 +1,151 @@
+"""
+Console helpers: headers, shift configuration and prompts with a countdown.
+"""
+import os
+import sys
+import time
+import selectors
+try:
+    import msvcrt  # Windows console input
+except ImportError:
+    msvcrt = None
+    import termios
+    import tty
+
+from . import config
+from .logs import log
+from .metrics import metrics
+
+
+# ===================================================================
+# --- HELPERS ---
+# ===================================================================
+def print_centered_header(text, char="-"):
+    """Prints a centered header starting at the beginning of the line."""
+    border = char * config.LINE_LENGTH
+
+    # Calculate padding to center text within the line length
+    padding = (config.LINE_LENGTH - len(text)) // 2
+    centered_text = (" " * padding) + text
+
+    log(border)
+    log(centered_text)
+    log(border)
+
+def get_shift_users():
+    """Asks user for shift members at startup."""
+    users = ["Default User"]
+    print_centered_header("👥 SHIFT CONFIGURATION 👥", char="-")
+    print(f"\n    1. {users[0]} (Default)")
+
+    try:
+        count_str = input("    👉 How many additional employees? (0 for none): ").strip()
+        count = int(count_str) if count_str.isdigit() else 0
+        for i in range(count):
+            name = input(f"    👉 Enter Name for Employee {i+2}: ").strip()
+            if name: users.append(name)
+    except: pass
+    log(f"    ✅ Active Shift Users: {users}\n")
+    return users
+
+class PosixKeys:
+    """Unbuffered, no-echo stdin on POSIX; waits block in select() instead of polling."""
+    def __enter__(self):
+        self.fd = sys.stdin.fileno()
+        self.saved = None
+        if os.isatty(self.fd):
+            self.saved = termios.tcgetattr(self.fd)
+            tty.setcbreak(self.fd)                    # Key by key, we echo ourselves
+            termios.tcflush(self.fd, termios.TCIFLUSH)  # Clear buffer
+        self.selector = selectors.DefaultSelector()
+        self.selector.register(self.fd, selectors.EVENT_READ)
+        return self
+
+    def wait(self, seconds):
+        return bool(self.selector.select(seconds))
+
+    def read(self):
+        data = os.read(self.fd, 1024)
+        return data.decode("utf-8", errors="ignore") if data else None  # None = stdin closed
+
+    def __exit__(self, *exc):
+        self.selector.close()
+        if self.saved is not None:
+            termios.tcsetattr(self.fd, termios.TCSADRAIN, self.saved)
+
+class WindowsKeys:
+    """Console input on Windows; waits block on the console input handle instead of polling."""
+    WAIT_OBJECT_0 = 0
+
+    def __enter__(self):
+        import ctypes
+        self.kernel32 = ctypes.windll.kernel32
+        self.handle = self.kernel32.GetStdHandle(-10)  # STD_INPUT_HANDLE
+        while msvcrt.kbhit(): msvcrt.getwch()  # Clear buffer
+        return self
+
+    def wait(self, seconds):
+        deadline = time.monotonic() + seconds
+        while True:
+            if msvcrt.kbhit(): return True
+            left = deadline - time.monotonic()
+            if left <= 0: return False
+            if self.kernel32.WaitForSingleObject(self.handle, int(left * 1000)) != self.WAIT_OBJECT_0:
+                return False
+            if not msvcrt.kbhit():
+                # Woken by a non-character event (focus, mouse, key-up): drop it so the wait can block again
+                self.kernel32.FlushConsoleInputBuffer(self.handle)
+
+    def read(self):
+        chars = []
+        while msvcrt.kbhit(): chars.append(msvcrt.getwch())
+        return "".join(chars)
+
+    def __exit__(self, *exc):
+        pass
+
+def get_input_with_timeout(prompt, timeout=60):
+    """Waits for input with a countdown timer on the same line (redrawn once per second)."""
+    deadline = time.monotonic() + timeout
+    input_chars = []
+
+    def draw(remaining):
+        sys.stdout.write(f"\r    Clock: [{remaining:02d}s] {prompt} {''.join(input_chars)}")
+        sys.stdout.flush()
+
+    with (WindowsKeys() if msvcrt else PosixKeys()) as keys:
+        print("") # New line
+        shown = None
+        while True:
+            left = deadline - time.monotonic()
+            remaining = int(left)
+            if remaining != shown:
+                draw(remaining)
+                shown = remaining
+
+            if left <= 0:
+                log(f"    ⌛ Timeout! Skipping ticket.")
+                metrics.incr("timed_out")
+                return "S"
+
+            # Sleep until a key arrives or the countdown ticks over
+            if not keys.wait(max(0.01, left - remaining if left > remaining else 1.0)):
+                continue
+
+            data = keys.read()
+            if data is None:
+                print("")
+                return "S"  # stdin closed: treat like a timeout
+            for char in data:
+                if char in ('\r', '\n'):
+                    print("")
+                    return "".join(input_chars)
+                elif char in ('\b', '\x7f'):
+                    if input_chars:
+                        input_chars.pop()
+                        sys.stdout.write(f"\r    {' ' * 100}")
+                        draw(remaining)
+                elif char.isprintable():
+                    input_chars.append(char)
+                    sys.stdout.write(char)
+                    sys.stdout.flush()
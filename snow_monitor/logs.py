@@ -0,0 +1,353 @@
+"""
+Logging: console + in-memory viewer buffer + Log.txt/Live.txt on a background writer.
+"""
+import os
+import re
+import sys
+import time
+import gzip
+import shutil
+import threading
+import queue
+import atexit
+from collections import deque
+from itertools import islice
+
+from . import config
+
+
+# ===================================================================
+# --- LIVE LOG MANAGER (APPEND MODE) ---
+# ===================================================================
+class LogArchiver:
+    """
+    Background gzip for rotated Log.txt segments, plus retention: only the
+    newest `keep` archives of each log are kept. Segments left uncompressed
+    by an earlier crash are picked up on the next pass.
+    """
+    _STOP = object()
+
+    def __init__(self, keep=config.LOG_ARCHIVE_KEEP):
+        self.keep = keep
+        self.jobs = queue.Queue()
+        self.thread = None
+        self.lock = threading.Lock()
+
+    @staticmethod
+    def segment_pattern(log_path):
+        stem, ext = os.path.splitext(os.path.basename(log_path))
+        return re.compile(re.escape(stem) + r"-\d{8}-\d{6}(-\d+)?" + re.escape(ext) + r"(\.gz)?$")
+
+    def submit(self, segment_path, log_path):
+        with self.lock:
+            if self.thread is None:
+                self.thread = threading.Thread(target=self._run, name="log-archiver", daemon=True)
+                self.thread.start()
+        self.jobs.put((segment_path, log_path))
+
+    def close(self, timeout=30):
+        if self.thread is None: return
+        self.jobs.put(self._STOP)
+        self.thread.join(timeout=timeout)
+
+    def _run(self):
+        while True:
+            job = self.jobs.get()
+            if job is self._STOP: return
+            segment_path, log_path = job
+            try:
+                self._compress(segment_path)
+                self._sweep(log_path)
+            except Exception as e:
+                sys.stderr.write(f"⚠️ Log archive error ({segment_path}): {e}\n")
+
+    @staticmethod
+    def _compress(path):
+        if not os.path.exists(path): return
+        tmp_path = path + ".gz.tmp"
+        with open(path, "rb") as src, gzip.open(tmp_path, "wb", compresslevel=6) as dst:
+            shutil.copyfileobj(src, dst, 1024 * 1024)
+        os.replace(tmp_path, path + ".gz")
+        os.remove(path)
+
+    def _sweep(self, log_path):
+        log_dir = os.path.dirname(log_path) or "."
+        pattern = self.segment_pattern(log_path)
+        names = sorted(n for n in os.listdir(log_dir) if pattern.match(n))
+        for name in names:
+            if not name.endswith(".gz"): self._compress(os.path.join(log_dir, name))
+        if self.keep <= 0: return
+        archives = [os.path.join(log_dir, n) for n in os.listdir(log_dir) if pattern.match(n) and n.endswith(".gz")]
+        archives.sort(key=lambda p: (os.path.getmtime(p), p))  # Oldest first
+        for archive in archives[:-self.keep]:
+            try: os.remove(archive)
+            except OSError: pass
+
+class LiveLogManager:
+    """
+    1. Mobile Buffer: RAM (Fastest) for the Web Server.
+    2. Log.txt: Append Mode (Historical History), rotated by size/age into
+       gzipped Log-<date>.txt.gz segments.
+    3. Live.txt: Rolling window of the last LIVE_WINDOW_SECONDS of lines.
+
+    File writes run on a background writer thread that keeps both files
+    open and flushes in batches, so add() is just an enqueue. Rotation and
+    the Live.txt rewrite happen on that thread; compression on the archiver.
+    """
+    _STOP = object()
+    _PATHS = object()
+
+    def __init__(self, log_file, live_file, buffer_size=100, queue_size=config.LOG_QUEUE_SIZE,
+                 flush_lines=config.LOG_FLUSH_LINES, flush_interval=config.LOG_FLUSH_INTERVAL,
+                 max_bytes=config.LOG_MAX_BYTES, rotate_hours=config.LOG_ROTATE_HOURS, live_window=config.LIVE_WINDOW_SECONDS):
+        self.log_file = log_file
+        self.live_file = live_file
+        self.flush_lines = flush_lines
+        self.flush_interval = flush_interval
+        self.max_bytes = max_bytes
+        self.rotate_secs = rotate_hours * 3600
+        self.live_window = live_window
+        self.archiver = LogArchiver()
+
+        # Buffers
+        self.buffer = deque(maxlen=buffer_size) # For Mobile Web: (seq, message)
+        self.seq = 0  # Monotonic sequence number of the last buffered line
+        self.lock = threading.Lock()
+        self.new_lines = threading.Condition(self.lock)  # Wakes /api/stream subscribers
+
+        # Background writer (owns the open file handles)
+        self.queue = queue.Queue(maxsize=queue_size)
+        self._handles = {}
+        self._log_state = {}  # Log.txt path -> [bytes written, segment start epoch, next rotation attempt]
+        self._live_lines = deque(maxlen=queue_size)  # (epoch, line) currently in Live.txt
+        self._live_started = set()  # Live.txt paths already emptied this run
+        self._closed = False
+        self._writer = threading.Thread(target=self._writer_loop, name="log-writer", daemon=True)
+        self._writer.start()
+
+    def update_paths(self, new_log_path, new_live_path):
+        """Updates paths dynamically based on user input"""
+        self.log_file = new_log_path
+        self.live_file = new_live_path
+        # Queued in order, so lines logged before the switch still go to the old files
+        self.queue.put((self._PATHS, new_log_path, new_live_path))
+
+    def add(self, message):
+        time_str = time.strftime("[%Y-%m-%d %H:%M:%S]")
+        full_line = f"{time_str} {message}\n"
+
+        with self.lock:
+            # --- 1. Update Mobile Web Buffer ---
+            self.seq += 1
+            self.buffer.append((self.seq, message))
+            self.new_lines.notify_all()
+
+        # --- 2. Hand Log.txt / Live.txt lines to the writer thread ---
+        if not self._closed:
+            self.queue.put(full_line)  # Only blocks if the writer is LOG_QUEUE_SIZE lines behind
+
+    def get_all(self):
+        """Get all logs for mobile viewer."""
+        with self.lock:
+            return "\n".join(message for _, message in self.buffer)
+
+    def get_since(self, since):
+        """
+        Returns (last_seq, reset, messages newer than `since`).
+        reset is True when the caller has to start over: first request,
+        lines it never saw already fell out of the buffer, or the script restarted.
+        """
+        with self.lock:
+            if not self.buffer:
+                return self.seq, since != self.seq, []
+            first_seq = self.buffer[0][0]
+            if since <= 0 or since < first_seq - 1 or since > self.seq:
+                return self.seq, True, [message for _, message in self.buffer]
+            # Sequence numbers are contiguous, so skip straight to the first new line
+            return self.seq, False, [message for _, message in islice(self.buffer, since - first_seq + 1, None)]
+
+    def wait_since(self, since, timeout):
+        """Blocks until there is a line newer than `since` (or timeout), then returns get_since(since)."""
+        with self.new_lines:
+            self.new_lines.wait_for(lambda: self.seq != since, timeout=timeout)
+        return self.get_since(since)
+
+    def close(self):
+        """Flushes pending lines, fsyncs both files and stops the writer (and finishes pending archives)."""
+        if self._closed: return
+        self._closed = True
+        self.queue.put(self._STOP)
+        self._writer.join(timeout=10)
+        self.archiver.close()
+
+    # --- Writer thread ---
+    def _writer_loop(self):
+        paths = (self.log_file, self.live_file)
+        unflushed = 0
+        last_flush = time.monotonic()
+
+        while True:
+            try: item = self.queue.get(timeout=self.flush_interval)
+            except queue.Empty: item = None
+
+            # Drain whatever else is already queued into one batch
+            batch = []
+            stop = False
+            while item is not None:
+                if item is self._STOP:
+                    stop = True
+                    break
+                if isinstance(item, tuple):
+                    # Path switch: finish the old files before moving on
+                    self._write(paths, batch)
+                    self._flush()
+                    batch, unflushed = [], 0
+                    paths = item[1:]
+                    self._live_lines.clear()
+                else:
+                    batch.append(item)
+                    if len(batch) >= self.flush_lines: break
+                try: item = self.queue.get_nowait()
+                except queue.Empty: item = None
+
+            if batch:
+                self._write(paths, batch)
+                unflushed += len(batch)
+
+            now = time.monotonic()
+            if unflushed and (stop or unflushed >= self.flush_lines or now - last_flush >= self.flush_interval):
+                self._flush()
+                unflushed = 0
+                last_flush = now
+            elif not unflushed:
+                last_flush = now
+
+            if stop:
+                self._close_handles(fsync=True)
+                return
+            self._trim_live(paths[1])
+
+    def _handle(self, path, mode="a"):
+        f = self._handles.get(path)
+        if f is None:
+            log_dir = os.path.dirname(path)
+            if log_dir and not os.path.exists(log_dir): os.makedirs(log_dir)
+            f = open(path, mode, encoding="utf-8")
+            self._handles[path] = f
+        return f
+
+    def _write(self, paths, batch):
+        if not batch: return
+        text = "".join(batch)
+        log_path, live_path = paths
+        # Close files we switched away from
+        for path in [p for p in self._handles if p not in paths]:
+            try: self._handles.pop(path).close()
+            except: pass
+        try:
+            state = self._log_state.get(log_path) or self._seed_log_state(log_path)
+            self._handle(log_path).write(text)
+            self._after_log_write(log_path, state, text)
+        except:
+            try: self._handles.pop(log_path).close()
+            except: pass
+        if live_path == log_path: return
+        try:
+            if self.live_window:
+                # Live.txt starts empty each run (the viewer buffer does too)
+                mode = "a" if live_path in self._live_started else "w"
+                self._live_started.add(live_path)
+                self._handle(live_path, mode).write(text)
+                now = time.time()
+                self._live_lines.extend((now, line) for line in batch)
+            else:
+                self._handle(live_path).write(text)
+        except:
+            try: self._handles.pop(live_path).close()
+            except: pass
+
+    # --- Log.txt rotation ---
+    @staticmethod
+    def _segment_start(path):
+        """Epoch of the first line's [YYYY-mm-dd HH:MM:SS] stamp (now for a new/unreadable file)."""
+        try:
+            with open(path, "r", encoding="utf-8", errors="replace") as f:
+                first = f.readline()
+            return time.mktime(time.strptime(first[1:20], "%Y-%m-%d %H:%M:%S"))
+        except Exception:
+            return time.time()
+
+    def _seed_log_state(self, path):
+        """[bytes, segment start, retry after] for a segment, sized before anything is buffered into it."""
+        try: size = os.path.getsize(path)
+        except OSError: size = 0
+        state = self._log_state[path] = [size, self._segment_start(path), 0.0]
+        return state
+
+    def _after_log_write(self, path, state, text):
+        state[0] += len(text.encode("utf-8"))
+        now = time.time()
+        too_big = self.max_bytes and state[0] >= self.max_bytes
+        too_old = self.rotate_secs and now - state[1] >= self.rotate_secs
+        if (too_big or too_old) and now >= state[2]:
+            self._rotate(path, state)
+
+    def _rotate(self, path, state):
+        """Renames Log.txt to Log-<segment start>.txt and queues it for compression."""
+        stem, ext = os.path.splitext(path)
+        base = f"{stem}-{time.strftime('%Y%m%d-%H%M%S', time.localtime(state[1]))}"
+        target, n = base + ext, 1
+        while os.path.exists(target) or os.path.exists(target + ".gz"):
+            target, n = f"{base}-{n}{ext}", n + 1
+        try:
+            f = self._handles.pop(path, None)
+            if f: f.close()
+            os.rename(path, target)
+        except OSError as e:
+            # Locked (e.g. OneDrive syncing it): keep appending and try again in a minute
+            state[2] = time.time() + 60
+            sys.stderr.write(f"⚠️ Log rotation postponed: {e}\n")
+            return
+        del self._log_state[path]
+        self.archiver.submit(target, path)
+
+    # --- Live.txt rolling window ---
+    def _trim_live(self, live_path):
+        """Rewrites Live.txt without lines older than the window (once they are a quarter-window stale)."""
+        if not self.live_window or not self._live_lines: return
+        now = time.time()
+        if now - self._live_lines[0][0] < self.live_window * 1.25: return
+        while self._live_lines and now - self._live_lines[0][0] > self.live_window:
+            self._live_lines.popleft()
+        tmp_path = live_path + ".tmp"
+        try:
+            f = self._handles.pop(live_path, None)
+            if f: f.close()
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                f.writelines(line for _, line in self._live_lines)
+            os.replace(tmp_path, live_path)
+        except OSError:
+            pass  # Locked right now: keep appending, the next trim rewrites it
+
+    def _flush(self):
+        for path, f in list(self._handles.items()):
+            try: f.flush()
+            except: self._handles.pop(path, None)
+
+    def _close_handles(self, fsync=False):
+        for f in self._handles.values():
+            try:
+                f.flush()
+                if fsync: os.fsync(f.fileno())
+                f.close()
+            except: pass
+        self._handles.clear()
+
+# Global log manager (Initialized with defaults, updated in Main)
+log_manager = LiveLogManager(config.LOG_FILE_PATH, config.LIVE_FILE_PATH, config.LOG_BUFFER_SIZE)
+atexit.register(log_manager.close)
+
+def log(message):
+    """Prints to console (clean, no timestamp) and saves to file with timestamp."""
+    print(message)
+    log_manager.add(message)
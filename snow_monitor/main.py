@@ -0,0 +1,262 @@
+"""
+Entry point: startup prompts and the polling loop. One cycle is run_cycle(),
+which tools/bench_e2e.py drives against the simulator.
+
+    python -m snow_monitor [--headless | --headed]
+"""
+import sys
+import argparse
+import time
+
+from . import config
+from . import selenium_api as sel
+from .browser import LoginError, initialize_driver, is_session_valid
+from .console import print_centered_header, get_shift_users
+from .logs import log, log_manager
+from .memory import L2Store, WatermarkStore
+from .metrics import metrics
+from .queues import queue_scheduler
+from .processor import process_ticket_in_tab2, open_and_update, OperatorDesk, BrowserWorkerPool
+from .scheduler import poll_scheduler
+from .scraper import make_ticket_source
+from .supervisor import browser_supervisor
+from .web import start_web_server, get_local_ip
+
+
+# ===================================================================
+# --- MAIN LOOP ---
+# ===================================================================
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(prog="snow_monitor", description="ServiceNow incident monitor")
+    mode = parser.add_mutually_exclusive_group()
+    mode.add_argument("--headless", dest="headless", action="store_true", default=None,
+                      help="run Chrome without a window (default: config.HEADLESS)")
+    mode.add_argument("--headed", dest="headless", action="store_false",
+                      help="show the Chrome window")
+    return parser.parse_args(argv)
+
+def start_browser(ticket_source, use_profile=True):
+    """Launches and logs in Chrome, and points the supervisor and the ticket source at it."""
+    driver, wait = initialize_driver(use_profile)
+    browser_supervisor.adopt()
+    if config.REST_AUTH == "session": ticket_source.attach_session(driver)
+    return driver, wait
+
+def check_browser(driver, wait, ticket_source):
+    """
+    Between cycles: swaps in a replacement the supervisor warmed up, then
+    checks the session. Returns the (driver, wait) to poll with, or None
+    after closing a dead browser or expired session (start a new one).
+    """
+    # Planned recycle: the replacement warmed up while this browser kept polling
+    swapped = browser_supervisor.swap(driver)
+    if swapped:
+        driver, wait = swapped
+        if config.REST_AUTH == "session": ticket_source.attach_session(driver)
+
+    # Health check: a dead browser or expired session goes back through initialize_driver
+    if not is_session_valid(driver):
+        log("\n⚠️ Session expired or browser not responding")
+        log("🔄 Restarting session")
+        metrics.incr("restarts")
+        try: driver.quit()
+        except: pass
+        return None
+    return driver, wait
+
+def run_cycle(driver, wait, ticket_source, l2_memory, shift_users, watermarks=None, operator_desk=None, pool=None):
+    """One poll cycle: apply operator decisions, fetch the queues, process what changed. Returns the seconds to sleep."""
+    poll_scheduler.start_cycle()
+    metrics.incr("cycles")
+    print_centered_header("♻️   Checking for New Tickets (Cycle) ♻️", char="-")
+
+    # Apply decisions the operator made since the last cycle
+    if operator_desk:
+        for ticket_data, decision, waited in operator_desk.drain():
+            if not decision: continue
+            ticket_num = ticket_data['ticket']
+            log(f"    ✍️  Applying operator decision: {ticket_num} -> {decision['name']}")
+            saved = open_and_update(driver, wait, ticket_num, decision['value'], decision['name'], decision['assignee'])
+            # Marked when it was queued: unmark so the next cycle fast-processes it from L2
+            if not saved and watermarks: watermarks.forget(ticket_num)
+            l2_memory.upsert(ticket_num, decision['value'], decision['name'], ticket_data['desc'], decision['assignee'])
+
+    fetch_start = time.perf_counter()
+    l1_data_list = queue_scheduler.fetch(ticket_source, driver, wait)
+    fetch_secs = time.perf_counter() - fetch_start
+    time_now = time.strftime("%H:%M:%S")
+
+    if l1_data_list is None:
+        log(f"    ⚠️ Ticket list could not be read, keeping last cycle's state - {time_now}")
+    elif l1_data_list:
+        to_process = l1_data_list
+        if watermarks:
+            to_process, skipped = watermarks.changed_rows(l1_data_list)
+            log(f"    🎯 Active Tickets Found: {len(l1_data_list)} ({len(to_process)} new/changed, {skipped} unchanged skipped) - {time_now}")
+        else:
+            log(f"    🎯 Active Tickets Found: {len(l1_data_list)} - {time_now}")
+
+        if operator_desk:
+            to_process = [t for t in to_process if not operator_desk.is_waiting(t['ticket'])]
+            if operator_desk.depth():
+                log(f"    🧑‍💻 Operator Queue: {operator_desk.depth()} waiting for a decision")
+
+        # L2 fast-process tickets go to the worker pool while Tab 2 handles the rest
+        pooled = []
+        pool_start = time.perf_counter()
+        if pool:
+            pooled = [t for t in to_process if t['ticket'] in l2_memory]
+            to_process = [t for t in to_process if t['ticket'] not in l2_memory]
+            for ticket_obj in pooled: pool.submit(ticket_obj, l2_memory[ticket_obj['ticket']])
+
+        for ticket_obj in to_process:
+            result, handled = process_ticket_in_tab2(driver, wait, ticket_obj, l2_memory, shift_users, operator_desk)
+            if result:
+                ticket_num = ticket_obj['ticket']
+                l2_memory.upsert(ticket_num, result['value'], result['name'], ticket_obj['desc'], result['assignee'],
+                                 learn=not result.get('auto'))
+            if watermarks and handled: watermarks.mark(ticket_obj)
+
+        if pooled:
+            tab2_secs = time.perf_counter() - pool_start
+            results = pool.wait()
+            wall = time.perf_counter() - pool_start
+            sequential = tab2_secs + sum(secs for _, _, secs in results)
+            done = sum(1 for _, ok, _ in results if ok)
+            log(f"    🧵 Worker Pool: {done}/{len(results)} updated, cycle took {wall:.1f}s "
+                f"(one-by-one ~{sequential:.1f}s, saved ~{max(0.0, sequential - wall):.1f}s)")
+            if watermarks:
+                updated = {ticket for ticket, ok, _ in results if ok}
+                for ticket_obj in pooled:
+                    if ticket_obj['ticket'] in updated: watermarks.mark(ticket_obj)
+    else:
+        log(f"    (No tickets found) - {time_now}")
+
+    # A degraded queue's tickets are unknown, not gone: keep their marks and queued decisions
+    listed = queue_scheduler.last_known(l1_data_list)
+    if operator_desk: operator_desk.retain(listed)
+    if watermarks:
+        if listed is not None: watermarks.retain(listed)
+        watermarks.save()
+
+    # Only the browser sources say anything about how the browser is aging
+    browser_supervisor.end_cycle(driver, fetch_secs if ticket_source.name != "rest" else None)
+    return poll_scheduler.finish_cycle(l1_data_list)
+
+def main(argv=None):
+    args = parse_args(argv)
+    if args.headless is not None: config.HEADLESS = args.headless
+
+    # STEP 1: Ask to Enable Web Server
+    print("")
+    print("=" * config.LINE_LENGTH)
+    print("                    📱 WEB SERVER STARTED - MOBILE LOG VIEWER  📱")
+    print("=" * config.LINE_LENGTH)
+    print(f"   👉 Local Network: http://{get_local_ip()}:{config.WEB_SERVER_PORT}")
+    print(f"   💡 Ensure mobile & laptop are on SAME WiFi")
+    print("=" * config.LINE_LENGTH)
+    print("")
+
+    while True:
+        enable_choice = input("📱 WEB SERVER Live Log Monitor - Need to Enable or Not (Y/N): ").strip().upper()
+        if enable_choice in ['Y', 'N']:
+            break
+        print("    ❌ Invalid input. Please enter Y or N")
+
+    if enable_choice == 'Y':
+        log("📱 WEB SERVER: Enabled ✅")
+        start_web_server()
+        time.sleep(3)  # Give server time to start
+    else:
+        log("📱 WEB SERVER: Disabled ❌")
+
+    print("")
+
+    # STEP 2: Ask about OneDrive Usage
+    print_centered_header("ONEDRIVE USAGE")
+    while True:
+        drive_choice = input("    👉 Company Onedrive Using (Y/N): ").strip().upper()
+        if drive_choice in ['Y', 'N']:
+            break
+        print("    ❌ Invalid input. Please enter Y or N")
+
+    # Set Dynamic Paths based on Choice (placeholders remain)
+    if drive_choice == 'Y':
+        final_log_path = r"PATH_TO_ONEDRIVE_LOG_FILE"   # e.g. r"C:\Users\<User>\OneDrive - Org\Documents\Snow\Log.txt"
+        final_live_path = r"PATH_TO_ONEDRIVE_LIVE_FILE" # e.g. r"C:\Users\<User>\OneDrive - Org\Documents\Snow\Live.txt"
+        log(f"    📂 Using OneDrive Paths: {final_log_path}")
+    else:
+        final_log_path = r"PATH_TO_LOCAL_LOG_FILE"      # e.g. r"C:\Users\<User>\Downloads\Log.txt"
+        final_live_path = r"PATH_TO_LOCAL_LIVE_FILE"    # e.g. r"C:\Users\<User>\Downloads\Live.txt"
+        log(f"    📂 Using Local Downloads Paths: {final_log_path}")
+
+    # Update the global log manager with the selected paths
+    log_manager.update_paths(final_log_path, final_live_path)
+
+    print("")
+
+    # STEP 3: Ask for shift configuration
+    shift_users = get_shift_users()
+
+    if not config.USER or not config.PASSWORD:
+        log("❌ Error: Credentials missing in Configuration section.")
+        return
+
+    driver = None
+    login_failed = False
+    l2_memory = L2Store(config.L2_DB_PATH, legacy_path=config.REOPEN_FILE_PATH)
+    log(f"    🧠 L2 Memory: {len(l2_memory)} tickets ({l2_memory.imported} imported from Reopen.txt, {l2_memory.expired} expired)")
+    ticket_source = make_ticket_source()
+    watermarks = WatermarkStore(config.WATERMARK_FILE_PATH) if config.INCREMENTAL_POLLING else None
+    log(f"    📡 Ticket Source: {ticket_source.name}")
+    queue_scheduler.load()
+    if len(queue_scheduler.queues) > 1:
+        log("    📋 Queues: " + ", ".join(f"{q.name} ({'process' if q.process else 'count'}, every "
+                                       f"{q.interval or config.POLL_INTERVAL}s)" for q in queue_scheduler.queues))
+    pool = BrowserWorkerPool(config.WORKER_POOL_SIZE).start() if config.WORKER_POOL_SIZE > 0 else None
+    operator_desk = OperatorDesk(shift_users) if config.DECOUPLED_PROMPTS else None
+
+    while True:
+        try:
+            if driver is None: driver, wait = start_browser(ticket_source)
+
+            while True:
+                session = check_browser(driver, wait, ticket_source)
+                if session is None:
+                    driver = None
+                    break
+                driver, wait = session
+                time.sleep(run_cycle(driver, wait, ticket_source, l2_memory, shift_users, watermarks, operator_desk, pool))
+
+        except sel.WebDriverException as e:
+            log(f"\n⚠️ Browser Connection Lost: {e}")
+            log("🔄 Restarting session")
+            metrics.incr("restarts")
+            try: driver.quit()
+            except: pass
+            driver = None
+            time.sleep(5)
+
+        except KeyboardInterrupt:
+            log("\n🛑 Stopped by User.")
+            break
+
+        except LoginError:
+            log("🛑 Stopping: could not log in.")
+            login_failed = True
+            break
+
+        except Exception as e:
+            log(f"\n❌ Unexpected Error: {e}")
+            time.sleep(5)
+
+    browser_supervisor.close()
+    if pool: pool.close()
+    ticket_source.close()
+    l2_memory.close()
+    if driver: driver.quit()
+    if login_failed: sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
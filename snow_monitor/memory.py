@@ -0,0 +1,333 @@
+"""
+Ticket memory: L2 decisions (SQLite) with alert-pattern matching, and row watermarks.
+"""
+import os
+import re
+import json
+import math
+import time
+import hashlib
+import sqlite3
+import threading
+from collections import Counter, defaultdict
+
+from . import config
+from .logs import log
+
+
+# ===================================================================
+# --- L2 MEMORY & WATERMARKS ---
+# ===================================================================
+# Bracketed indices ([Index:7001], [ID:11]) are dropped; words are compounds joined by . _ : / or -
+SIGNATURE_BRACKETS = re.compile(r"\[[^\]]*\]")
+SIGNATURE_WORDS = re.compile(r"[a-z0-9]+(?:[._:/-][a-z0-9]+)*")
+SIGNATURE_SPLIT = re.compile(r"[._:/-]")
+DIGIT_RUN = re.compile(r"[0-9]+")
+SIGNATURE_VERSION = "2"  # Bump when description_signature changes: stored signatures are recomputed
+
+def description_signature(desc):
+    """Normalizes a short description to its alert pattern, e.g. 'monitor critical alert cpu overload memoryused'."""
+    text = SIGNATURE_BRACKETS.sub(" ", (desc or "").lower())
+    tokens = []
+    for word in SIGNATURE_WORDS.findall(text):
+        # Host / IP / port shaped: SITE05-RTR01, Gi1/0/24, 10.0.0.1, core-1.corp.net
+        if "." in word or len(DIGIT_RUN.findall(word)) > 1: continue
+        # 'Link-Down' -> 'link down'; bare numbers are counters and indices, 'ipv6' or 'l2' stay
+        tokens.extend(t for t in SIGNATURE_SPLIT.split(word) if t and not t.isdigit())
+    return " ".join(tokens)
+
+class PatternMatcher:
+    """
+    Second-level L2 lookup on description signatures. Exact signatures are a
+    dict hit; fuzzy matches use a token inverted index with a prefix filter
+    (only the rarest query tokens are probed), then exact Jaccard on the few
+    candidates, so lookups stay well under a millisecond.
+    """
+    def __init__(self, min_similarity=config.L2_PATTERN_SIMILARITY):
+        self.min_similarity = min_similarity
+        self.states = {}                # signature -> Counter{(value, name): tickets}
+        self.token_sets = {}            # signature -> frozenset of tokens
+        self.postings = defaultdict(set)  # token -> signatures containing it
+
+    def learn(self, signature, value, name, count=1):
+        if not signature: return
+        if signature not in self.states:
+            self.states[signature] = Counter()
+            tokens = frozenset(signature.split())
+            self.token_sets[signature] = tokens
+            for token in tokens: self.postings[token].add(signature)
+        self.states[signature][(value, name)] += count
+
+    def forget(self, signature, value, name, count=1):
+        """Takes back what learn() added (a ticket's decision was replaced)."""
+        counts = self.states.get(signature)
+        if not counts: return
+        counts[(value, name)] -= count
+        if counts[(value, name)] <= 0: del counts[(value, name)]
+        if not counts:
+            del self.states[signature]
+            for token in self.token_sets.pop(signature):
+                self.postings[token].discard(signature)
+                if not self.postings[token]: del self.postings[token]
+
+    def match(self, desc):
+        """Returns {'value', 'name', 'hits', 'agreement', 'similarity', 'signature'} or None."""
+        signature = description_signature(desc)
+        if not signature: return None
+        similarity = 1.0
+        if signature not in self.states:
+            signature, similarity = self._fuzzy(frozenset(signature.split()))
+            if signature is None: return None
+
+        counts = self.states[signature]
+        (value, name), best = counts.most_common(1)[0]
+        hits = sum(counts.values())
+        return {'value': value, 'name': name, 'hits': hits, 'agreement': best / hits,
+                'similarity': similarity, 'signature': signature}
+
+    def _fuzzy(self, query):
+        # A match needs Jaccard >= t, so it must share one of the first (n - ceil(t*n) + 1) rarest tokens
+        ranked = sorted(query, key=lambda t: len(self.postings.get(t, ())))
+        prefix = len(ranked) - math.ceil(self.min_similarity * len(ranked)) + 1
+        candidates = set()
+        for token in ranked[:prefix]: candidates |= self.postings.get(token, set())
+
+        best_sig, best_sim = None, 0.0
+        for sig in candidates:
+            tokens = self.token_sets[sig]
+            overlap = len(query & tokens)
+            sim = overlap / (len(query) + len(tokens) - overlap)
+            if sim > best_sim: best_sig, best_sim = sig, sim
+        return (best_sig, best_sim) if best_sim >= self.min_similarity else (None, 0.0)
+
+class L2Store:
+    """
+    L2 memory in SQLite (WAL mode): indexed lookup by ticket, upsert and expiry,
+    without loading everything at startup. Supports `in`, `[]` and `[]=` like
+    the old dict, so the processors are unchanged.
+
+    Lines appended to the legacy pipe-delimited Reopen.txt are imported
+    incrementally (the byte offset already imported is remembered).
+
+    Each row also stores its description signature, which feeds the
+    PatternMatcher behind match_pattern().
+    """
+    def __init__(self, path, legacy_path=None, expiry_days=config.L2_EXPIRY_DAYS):
+        db_dir = os.path.dirname(path)
+        if db_dir and not os.path.exists(db_dir): os.makedirs(db_dir)
+        self.lock = threading.Lock()
+        self.conn = sqlite3.connect(path, check_same_thread=False, isolation_level=None)
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("PRAGMA synchronous=NORMAL")
+        self.conn.execute("""CREATE TABLE IF NOT EXISTS l2 (
+            ticket TEXT PRIMARY KEY, value TEXT NOT NULL, name TEXT NOT NULL,
+            assignee TEXT, short_desc TEXT, updated_at REAL NOT NULL)""")
+        self.conn.execute("CREATE INDEX IF NOT EXISTS l2_updated_at ON l2(updated_at)")
+        self.conn.execute("CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT)")
+        if "signature" not in [col[1] for col in self.conn.execute("PRAGMA table_info(l2)")]:
+            self.conn.execute("ALTER TABLE l2 ADD COLUMN signature TEXT")
+        self._create_pattern_counts()
+
+        self.imported = self.import_legacy(legacy_path) if legacy_path else 0
+        self.expired = self.expire(expiry_days) if expiry_days else 0
+        self.patterns = self._build_patterns()
+
+    # --- dict-style access used by the processors ---
+    def get(self, ticket):
+        with self.lock:
+            row = self.conn.execute("SELECT value, name, assignee FROM l2 WHERE ticket = ?", (ticket,)).fetchone()
+        return {'value': row[0], 'name': row[1], 'assignee': row[2]} if row else None
+
+    def __contains__(self, ticket):
+        return self.get(ticket) is not None
+
+    def __getitem__(self, ticket):
+        mem = self.get(ticket)
+        if mem is None: raise KeyError(ticket)
+        return mem
+
+    def __setitem__(self, ticket, decision):
+        self.upsert(ticket, decision['value'], decision['name'], assignee=decision.get('assignee'))
+
+    def __len__(self):
+        with self.lock:
+            return self.conn.execute("SELECT COUNT(*) FROM l2").fetchone()[0]
+
+    # --- store operations ---
+    def upsert(self, ticket, value, name, short_desc=None, assignee=None, learn=True):
+        """
+        Stores a ticket's decision. Patterns learn each ticket once, with its
+        latest decision, as _build_patterns() counts them after a restart.
+        learn=False (a decision applied from a pattern) keeps the row out of
+        the patterns, so they are only taught by the operator.
+        """
+        signature = description_signature(short_desc) if short_desc else None
+        if not learn: signature = ""  # '' is never grouped into a pattern nor backfilled
+        with self.lock:
+            old = self.conn.execute("SELECT signature, value, name FROM l2 WHERE ticket = ?", (ticket,)).fetchone()
+            self.conn.execute(
+                """INSERT INTO l2 (ticket, value, name, assignee, short_desc, updated_at, signature)
+                   VALUES (?, ?, ?, ?, ?, ?, ?)
+                   ON CONFLICT(ticket) DO UPDATE SET value = excluded.value, name = excluded.name,
+                   assignee = excluded.assignee, short_desc = COALESCE(excluded.short_desc, l2.short_desc),
+                   updated_at = excluded.updated_at, signature = COALESCE(excluded.signature, l2.signature)""",
+                (ticket, value, name, assignee, short_desc, time.time(), signature))
+            if old and old[0]: self.patterns.forget(*old)
+            current = old[0] if signature is None and old else signature  # COALESCE above
+            if current: self.patterns.learn(current, value, name)
+
+    def match_pattern(self, short_desc):
+        """Second-level lookup for tickets not in L2 memory (see PatternMatcher.match)."""
+        return self.patterns.match(short_desc)
+
+    def _create_pattern_counts(self):
+        # Tickets per (signature, value, name), kept by triggers on every write to l2 (upsert, import,
+        # expiry, backfill), so opening the store reads one row per pattern instead of grouping all tickets
+        if not self.conn.execute("SELECT 1 FROM sqlite_master WHERE name = 'l2_patterns'").fetchone():
+            self.conn.execute("DELETE FROM meta WHERE key = 'signature_version'")  # Counted by _build_patterns()
+        self.conn.execute("""CREATE TABLE IF NOT EXISTS l2_patterns (
+            signature TEXT NOT NULL, value TEXT NOT NULL, name TEXT NOT NULL, tickets INTEGER NOT NULL,
+            PRIMARY KEY (signature, value, name)) WITHOUT ROWID""")
+        add = """INSERT INTO l2_patterns SELECT NEW.signature, NEW.value, NEW.name, 1 WHERE NEW.signature != ''
+                 ON CONFLICT (signature, value, name) DO UPDATE SET tickets = tickets + 1;"""
+        remove = """UPDATE l2_patterns SET tickets = tickets - 1
+                    WHERE signature = OLD.signature AND value = OLD.value AND name = OLD.name;
+                    DELETE FROM l2_patterns
+                    WHERE signature = OLD.signature AND value = OLD.value AND name = OLD.name AND tickets <= 0;"""
+        self.conn.execute(f"CREATE TRIGGER IF NOT EXISTS l2_patterns_insert AFTER INSERT ON l2 BEGIN {add} END")
+        self.conn.execute(f"CREATE TRIGGER IF NOT EXISTS l2_patterns_delete AFTER DELETE ON l2 BEGIN {remove} END")
+        self.conn.execute("CREATE TRIGGER IF NOT EXISTS l2_patterns_update AFTER UPDATE OF signature, value, name "
+                          f"ON l2 BEGIN {remove} {add} END")
+
+    def _build_patterns(self):
+        # Backfill signatures for rows stored before the column existed, or by an older description_signature()
+        with self.lock:
+            row = self.conn.execute("SELECT value FROM meta WHERE key = 'signature_version'").fetchone()
+            self.conn.execute("BEGIN")
+            recount = not row or row[0] != SIGNATURE_VERSION
+            if recount:
+                self.conn.execute("UPDATE l2 SET signature = NULL WHERE signature != ''")  # '' stays: not learnable
+                self.conn.execute("INSERT OR REPLACE INTO meta VALUES ('signature_version', ?)", (SIGNATURE_VERSION,))
+            missing = self.conn.execute(
+                "SELECT ticket, short_desc FROM l2 WHERE signature IS NULL AND short_desc IS NOT NULL").fetchall()
+            self.conn.executemany("UPDATE l2 SET signature = ? WHERE ticket = ?",
+                                  [(description_signature(desc), ticket) for ticket, desc in missing])
+            if recount:
+                self.conn.execute("DELETE FROM l2_patterns")
+                self.conn.execute("INSERT INTO l2_patterns SELECT signature, value, name, COUNT(*) FROM l2 "
+                                  "WHERE signature != '' GROUP BY signature, value, name")
+            self.conn.execute("COMMIT")
+            groups = self.conn.execute("SELECT signature, value, name, tickets FROM l2_patterns").fetchall()
+
+        matcher = PatternMatcher()
+        for signature, value, name, count in groups: matcher.learn(signature, value, name, count)
+        return matcher
+
+    def expire(self, max_age_days):
+        """Deletes decisions older than max_age_days; returns how many."""
+        cutoff = time.time() - max_age_days * 86400
+        with self.lock:
+            return self.conn.execute("DELETE FROM l2 WHERE updated_at < ?", (cutoff,)).rowcount
+
+    def import_legacy(self, legacy_path):
+        """Imports new lines of ticket|name|value|desc from Reopen.txt (later duplicates win)."""
+        if not os.path.exists(legacy_path): return 0
+        with self.lock:
+            row = self.conn.execute("SELECT value FROM meta WHERE key = 'legacy_offset'").fetchone()
+        offset = int(row[0]) if row else 0
+        if os.path.getsize(legacy_path) < offset: offset = 0  # File was replaced: read it again
+
+        rows = []
+        now = time.time()
+        try:
+            with open(legacy_path, "rb") as f:
+                f.seek(offset)
+                for raw in f:
+                    if not raw.endswith(b"\n"): break  # Half-written last line: pick it up next time
+                    offset += len(raw)
+                    parts = raw.decode("utf-8", errors="replace").strip().split('|')
+                    if len(parts) >= 3:
+                        desc = parts[3].strip() if len(parts) > 3 else None
+                        rows.append((parts[0].strip(), parts[2].strip(), parts[1].strip(), None, desc, now,
+                                     description_signature(desc) if desc else None))
+        except Exception as e:
+            log(f"      ⚠️ Error reading {legacy_path}: {e}")
+            return 0
+
+        with self.lock:
+            self.conn.execute("BEGIN")
+            # An upsert, not INSERT OR REPLACE: REPLACE's implicit delete skips the l2_patterns triggers
+            self.conn.executemany(
+                """INSERT INTO l2 (ticket, value, name, assignee, short_desc, updated_at, signature)
+                   VALUES (?, ?, ?, ?, ?, ?, ?)
+                   ON CONFLICT(ticket) DO UPDATE SET value = excluded.value, name = excluded.name,
+                   assignee = excluded.assignee, short_desc = excluded.short_desc,
+                   updated_at = excluded.updated_at, signature = excluded.signature""", rows)
+            self.conn.execute("INSERT OR REPLACE INTO meta VALUES ('legacy_offset', ?)", (str(offset),))
+            self.conn.execute("COMMIT")
+        return len(rows)
+
+    def close(self):
+        with self.lock:
+            self.conn.close()
+
+class WatermarkStore:
+    """
+    Remembers a fingerprint per ticket (sys_updated_on when the source has it,
+    plus the row values) so unchanged rows are not re-processed every cycle.
+    Persisted as JSON so a restart does not reprocess the whole queue.
+    """
+    def __init__(self, path, recheck_after=config.WATERMARK_RECHECK):
+        self.path = path
+        self.recheck_after = recheck_after
+        self.marks = {}  # ticket -> [fingerprint, marked_at]
+        self.dirty = False
+        if os.path.exists(path):
+            try:
+                with open(path, "r", encoding="utf-8") as f:
+                    self.marks = json.load(f)
+            except: self.marks = {}
+
+    @staticmethod
+    def fingerprint(row):
+        raw = "|".join(f"{k}={row[k]}" for k in sorted(row))
+        return hashlib.sha1(raw.encode("utf-8")).hexdigest()
+
+    def changed_rows(self, rows):
+        """Returns (rows that are new, changed or due a re-check, count of skipped rows)."""
+        now = time.time()
+        changed = []
+        for row in rows:
+            mark = self.marks.get(row['ticket'])
+            if mark and mark[0] == self.fingerprint(row) and now - mark[1] < self.recheck_after:
+                continue
+            changed.append(row)
+        return changed, len(rows) - len(changed)
+
+    def mark(self, row):
+        self.marks[row['ticket']] = [self.fingerprint(row), time.time()]
+        self.dirty = True
+
+    def forget(self, ticket):
+        """Drops a ticket's mark so the next cycle processes it again."""
+        if self.marks.pop(ticket, None) is not None: self.dirty = True
+
+    def retain(self, rows):
+        """Forgets tickets that left the list, so they are processed again if they come back."""
+        current = {row['ticket'] for row in rows}
+        for ticket in [t for t in self.marks if t not in current]:
+            del self.marks[ticket]
+            self.dirty = True
+
+    def save(self):
+        if not self.dirty: return
+        try:
+            log_dir = os.path.dirname(self.path)
+            if log_dir and not os.path.exists(log_dir): os.makedirs(log_dir)
+            tmp_path = self.path + ".tmp"
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump(self.marks, f)
+            os.replace(tmp_path, self.path)
+            self.dirty = False
+        except Exception as e:
+            log(f"      ⚠️ Error saving watermarks: {e}")
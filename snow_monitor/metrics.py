@@ -0,0 +1,102 @@
+"""
+Cycle timing instrumentation (rolling timer histograms + counters) served at /metrics.
+"""
+import time
+import threading
+from collections import deque, Counter
+from contextlib import contextmanager
+from functools import wraps
+
+from . import config
+
+
+# ===================================================================
+# --- METRICS (CYCLE TIMINGS & COUNTERS) ---
+# ===================================================================
+class Metrics:
+    """
+    Lightweight instrumentation: named timers keep their last METRICS_WINDOW
+    samples (for percentiles) plus lifetime count/sum, next to plain counters.
+    Served by the web server at /metrics as JSON or Prometheus text.
+    """
+    QUANTILES = (0.5, 0.9, 0.99)
+    COUNTERS = ("cycles", "restarts", "recycles", "tickets_seen", "auto_updated", "skipped", "timed_out", "saves", "save_failures")
+
+    def __init__(self, window=config.METRICS_WINDOW):
+        self.window = window
+        self.timings = {}  # name -> [deque of recent seconds, lifetime count, lifetime sum]
+        self.counters = Counter(dict.fromkeys(self.COUNTERS, 0))  # Exported from the start, even at zero
+        self.lock = threading.Lock()
+        self.started = time.time()
+
+    def observe(self, name, secs):
+        with self.lock:
+            entry = self.timings.get(name)
+            if entry is None:
+                entry = self.timings[name] = [deque(maxlen=self.window), 0, 0.0]
+            entry[0].append(secs)
+            entry[1] += 1
+            entry[2] += secs
+
+    def incr(self, name, n=1):
+        with self.lock:
+            self.counters[name] += n
+
+    @contextmanager
+    def timer(self, name):
+        start = time.perf_counter()
+        try: yield
+        finally: self.observe(name, time.perf_counter() - start)
+
+    def timed(self, name):
+        """Decorator form of timer()."""
+        def decorate(func):
+            @wraps(func)
+            def wrapper(*args, **kwargs):
+                with self.timer(name):
+                    return func(*args, **kwargs)
+            return wrapper
+        return decorate
+
+    @staticmethod
+    def _quantile(ordered, q):
+        return ordered[min(len(ordered) - 1, int(q * len(ordered)))]
+
+    def snapshot(self):
+        """Counters and per-timer stats (percentiles over the recent window) as a dict."""
+        with self.lock:
+            counters = dict(self.counters)
+            timings = {name: (sorted(recent), count, total) for name, (recent, count, total) in self.timings.items()}
+        stats = {}
+        for name, (ordered, count, total) in sorted(timings.items()):
+            entry = {"count": count, "sum": round(total, 4), "avg": round(total / count, 4) if count else 0.0}
+            if ordered:
+                for q in self.QUANTILES:
+                    entry[f"p{int(q * 100)}"] = round(self._quantile(ordered, q), 4)
+                entry["max"] = round(ordered[-1], 4)
+            stats[name] = entry
+        return {"uptime": round(time.time() - self.started, 1), "counters": counters, "timings": stats}
+
+    def prometheus(self, extra_gauges=None):
+        """Prometheus text exposition format (timers as summaries)."""
+        snap = self.snapshot()
+        lines = ["# TYPE snow_uptime_seconds gauge", f"snow_uptime_seconds {snap['uptime']}"]
+        for name, value in sorted(snap["counters"].items()):
+            lines.append(f"# TYPE snow_{name}_total counter")
+            lines.append(f"snow_{name}_total {value}")
+        for name, value in sorted((extra_gauges or {}).items()):
+            lines.append(f"# TYPE snow_{name} gauge")
+            lines.append(f"snow_{name} {value}")
+        if snap["timings"]:
+            lines.append("# TYPE snow_duration_seconds summary")
+        for name, entry in snap["timings"].items():
+            for q in self.QUANTILES:
+                key = f"p{int(q * 100)}"
+                if key in entry:
+                    lines.append(f'snow_duration_seconds{{op="{name}",quantile="{q}"}} {entry[key]}')
+            lines.append(f'snow_duration_seconds_sum{{op="{name}"}} {entry["sum"]}')
+            lines.append(f'snow_duration_seconds_count{{op="{name}"}} {entry["count"]}')
+        return "\n".join(lines) + "\n"
+
+# Global metrics registry (timers wrap the scraper, processor and login; counters are bumped in the main loop)
+metrics = Metrics()
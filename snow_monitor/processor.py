@@ -0,0 +1,422 @@
+"""
+Tab 2: operator prompts, ticket updates, the operator desk and the worker pool.
+"""
+import time
+import threading
+import queue
+
+from . import config
+from . import selenium_api as sel
+from .alerts import play_notification
+from .browser import initialize_driver, open_work_tab
+from .console import get_input_with_timeout
+from .logs import log
+from .metrics import metrics
+
+
+# ===================================================================
+# --- TAB 2: PROCESSOR ---
+# ===================================================================
+@metrics.timed("operator_prompt")
+def ask_operator(ticket, shift_users, needs_assignee, suggestion=None):
+    """Console prompts (with timer) for assignee and state. Returns the decision dict or None if skipped."""
+    val_map = {'1': '4', '2': '22', '3': '21'}
+    name_map = {'1': 'WIP', '2': 'Pending Tasks', '3': 'Pending Vendor'}
+    suggested = next((k for k, v in val_map.items() if suggestion and v == suggestion['value']), None)
+
+    selected_assignee = None
+    if needs_assignee:
+        print("\n    👤 Need Assignee:")
+        for idx, user in enumerate(shift_users): print(f"    [{idx+1}] {user}")
+        print("    [S] Skip")
+
+        while True:
+            u_choice_str = get_input_with_timeout(f"👉 Select User (1-{len(shift_users)}), or [S]kip: ", timeout=60)
+
+            if u_choice_str is None or u_choice_str.strip().upper() == 'S':
+                log("    ⏭️  Skipped assignment. Skipping ticket.")
+                metrics.incr("skipped")
+                return None
+
+            try:
+                u_choice = int(u_choice_str.strip())
+                if 1 <= u_choice <= len(shift_users):
+                    selected_assignee = shift_users[u_choice-1]
+                    break
+            except: pass
+
+    print(f"    Select State for {ticket}:")
+    print("    [1] Work in Progress (4)")
+    print("    [2] Pending Tasks (22)")
+    print("    [3] Pending Vendor (21)")
+    print("    [S] Skip")
+    if suggested: print(f"    💡 Suggested from past tickets: [{suggested}] {name_map[suggested]} (press Enter to accept)")
+
+    while True:
+        choice = get_input_with_timeout("👉 Choice: ", timeout=60)
+        if choice is None: choice = 'S'
+        choice = choice.strip().upper()
+        if not choice and suggested: choice = suggested
+        if choice in ['1', '2', '3', 'S']: break
+
+    if choice == 'S':
+        log("    ⏭️  Skipped.")
+        metrics.incr("skipped")
+        return None
+
+    target_val = val_map[choice]
+    state_name = name_map[choice]
+    return {'value': target_val, 'name': state_name, 'assignee': selected_assignee}
+
+@metrics.timed("process_ticket")
+def process_ticket_in_tab2(driver, wait, ticket_data, l2_memory, shift_users, operator_desk=None):
+    """
+    Returns (decision to remember or None, handled). `handled` is False when
+    the ticket still needs work: an update that did not save or an error, so
+    it is not watermarked and the next cycle tries again.
+    """
+    ticket = ticket_data['ticket']
+    short_desc = ticket_data['desc']
+    assigned_to_val = ticket_data['assigned']
+    reopen_count = ticket_data['reopen']
+
+    # Define the custom dividers (Full Width, No Indent)
+    DIVIDER_STR = "-" * config.LINE_LENGTH
+    EQUAL_STR   = "=" * config.LINE_LENGTH
+
+    # --- 1. FAST CHECKS ---
+    with metrics.timer("process.l2_lookup"):
+        mem = l2_memory.get(ticket)
+    if mem:
+        log(DIVIDER_STR)
+        log(f"    🔄 Fast-Processing: {ticket} - {short_desc}")
+        log(f"    🧠 Found in L2 Memory! Opening to auto-update: {mem['name']}")
+        ok = open_and_update(driver, wait, ticket, mem['value'], mem['name'], assignee=None)
+        if ok: metrics.incr("auto_updated")
+        log(DIVIDER_STR + "\n")
+        return None, ok
+
+    # --- 2. LOGIC CHECK ---
+    needs_attention = False
+    reason = ""
+
+    if not assigned_to_val or "(empty)" in assigned_to_val:
+        needs_attention = True; reason = "Assigned To is Empty"
+    elif reopen_count > 0:
+        needs_attention = True; reason = f"Reopen Count is {reopen_count}"
+
+    if not needs_attention:
+        return None, True
+
+    # --- 3. OPEN PAGE (Background) ---
+    with metrics.timer("process.tab_switch"):
+        if len(driver.window_handles) < 2: open_work_tab(driver)
+        driver.switch_to.window(driver.window_handles[1])
+
+    url = f"{config.BASE_URL}/incident.do?sysparm_query=number={ticket}"
+
+    try:
+        with metrics.timer("process.page_load"):
+            driver.get(url)
+            try: wait.until(sel.EC.frame_to_be_available_and_switch_to_it((sel.By.ID, "gsft_main")))
+            except: pass
+            wait.until(sel.EC.presence_of_element_located((sel.By.ID, "sys_readonly.incident.number")))
+
+        if short_desc == "No Description" or not short_desc:
+            try: short_desc = driver.find_element(sel.By.ID, "incident.short_description").get_attribute("value")
+            except: pass
+
+        # --- ALERT USER (Pretty Output) ---
+        log("\n" + EQUAL_STR)
+        log(f"    🚨 ACTION REQUIRED: {ticket}")
+        log(f"    📄 Desc: {short_desc}")
+        log(f"    ⚠️  Reason: {reason}")
+        log(EQUAL_STR)
+
+        state_el = driver.find_element(sel.By.ID, "incident.state")
+        current_state = state_el.get_attribute("value")
+        if current_state in ['6', '7', '8']:
+            log("    ⏭️  Ticket Closed. Skipping.")
+            metrics.incr("skipped")
+            return None, True
+
+        needs_assignee = not assigned_to_val or "(empty)" in assigned_to_val
+
+        # --- 4. PATTERN MATCH (same alert text under a new INC number) ---
+        with metrics.timer("process.l2_lookup"):
+            suggestion = l2_memory.match_pattern(short_desc) if config.L2_PATTERN_MODE != "off" else None
+        if suggestion:
+            log(f"    🧩 Pattern Match: {suggestion['name']} (seen on {suggestion['hits']} tickets, "
+                f"{suggestion['agreement']:.0%} agree, {suggestion['similarity']:.0%} similar)")
+            if (config.L2_PATTERN_MODE == "auto" and not needs_assignee and suggestion['hits'] >= config.L2_PATTERN_MIN_HITS
+                    and suggestion['agreement'] >= config.L2_PATTERN_AGREEMENT
+                    and suggestion['similarity'] >= config.L2_PATTERN_AUTO_SIMILARITY):
+                log("    🤖 Auto-applying learned pattern")
+                # 'auto': remembered for this ticket, but not taught back to the pattern
+                decision = {'value': suggestion['value'], 'name': suggestion['name'], 'assignee': None, 'auto': True}
+                saved = save_decision(driver, wait, ticket, state_el, decision)
+                if saved: metrics.incr("auto_updated")
+                return decision, saved
+
+        play_notification()
+
+        if operator_desk:
+            # Decision is made on the operator thread; the main loop applies it next cycle
+            operator_desk.submit(ticket_data, short_desc, needs_assignee, suggestion)
+            return None, True
+
+        # --- 5. CONSOLE INTERACTION (WITH TIMER) ---
+        decision = ask_operator(ticket, shift_users, needs_assignee, suggestion)
+        if not decision: return None, True
+
+        saved = save_decision(driver, wait, ticket, state_el, decision)
+        # Decision is remembered either way: an unsaved ticket stays in the list and is fast-processed next cycle
+        return decision, saved
+
+    except Exception as e:
+        log(f"    ❌ Error processing ticket: {e}")
+        return None, False
+
+def save_decision(driver, wait, ticket, state_el, decision):
+    """Saves a decision on the already open form, retrying through open_and_update if needed."""
+    if update_logic(driver, state_el, decision['value'], decision['name'], assignee=decision['assignee']): return True
+    if not config.SAVE_RETRIES: return False
+    log("    🔁 Retrying save")
+    return open_and_update(driver, wait, ticket, decision['value'], decision['name'], decision['assignee'],
+                           retries=config.SAVE_RETRIES - 1)
+
+@metrics.timed("open_and_update")
+def open_and_update(driver, wait, ticket, value, name, assignee, retries=None):
+    """Opens the ticket in Tab 2 and saves it; reloads and retries (SAVE_RETRIES by default) if the save is not confirmed."""
+    if retries is None: retries = config.SAVE_RETRIES
+    with metrics.timer("process.tab_switch"):
+        if len(driver.window_handles) < 2: open_work_tab(driver)
+        driver.switch_to.window(driver.window_handles[1])
+
+    for attempt in range(1 + retries):
+        if attempt: log(f"    🔁 Retrying save ({attempt}/{retries})")
+        try:
+            with metrics.timer("process.page_load"):
+                driver.get(f"{config.BASE_URL}/incident.do?sysparm_query=number={ticket}")
+                try: wait.until(sel.EC.frame_to_be_available_and_switch_to_it((sel.By.ID, "gsft_main")))
+                except: pass
+                wait.until(sel.EC.presence_of_element_located((sel.By.ID, "sys_readonly.incident.number")))
+            state_el = driver.find_element(sel.By.ID, "incident.state")
+            # Queued decisions and L2 replays can be minutes old: never reopen a ticket closed since
+            if state_el.get_attribute("value") in ['6', '7', '8']:
+                log(f"    ⏭️  {ticket} was closed in the meantime. Skipping.")
+                metrics.incr("skipped")
+                return False
+            if update_logic(driver, state_el, value, name, assignee): return True
+        except Exception as e:
+            log(f"    ❌ Could not open {ticket}: {e.__class__.__name__}")
+    return False
+
+def save_confirmed(driver, state_el, value):
+    """Wait condition: the form reloaded after gsftSubmit and shows the new state (False while pending)."""
+    try:
+        state_el.is_enabled()  # Old form still attached -> save not finished yet
+        return False
+    except sel.StaleElementReferenceException:
+        pass
+    errors = driver.find_elements(sel.By.CSS_SELECTOR, ".outputmsg_error, .notification-error")
+    if any(e.is_displayed() for e in errors):
+        raise RuntimeError(errors[0].text.strip() or "form reported an error")
+    new_state = driver.find_elements(sel.By.ID, "incident.state")
+    return bool(new_state) and new_state[0].get_attribute("value") == value
+
+@metrics.timed("update_logic")
+def update_logic(driver, state_el, value, name, assignee):
+    """Sets state (and assignee), saves, and waits for the save to be confirmed. Returns True on success."""
+    save_wait = sel.WebDriverWait(driver, config.SAVE_TIMEOUT, poll_frequency=config.SAVE_POLL_INTERVAL)
+    try:
+        driver.execute_script("arguments[0].value = arguments[1];", state_el, value)
+        if assignee:
+            try:
+                assign_input = driver.find_element(sel.By.ID, "sys_display.incident.assigned_to")
+                assign_input.clear()
+                assign_input.send_keys(assignee)
+                assign_input.send_keys("\t")
+                # Reference lookup resolves on blur: wait for the hidden sys_id to be filled
+                save_wait.until(lambda d: d.find_element(sel.By.ID, "incident.assigned_to").get_attribute("value"))
+            except:
+                log(f"    ⚠️ Assignee '{assignee}' not resolved, saving without confirmation of it")
+
+        log(f"    💾 Saving {name}")
+        start = time.perf_counter()
+        driver.execute_script("gsftSubmit(document.getElementById('sysverb_update_and_stay'));")
+        save_wait.until(lambda d: save_confirmed(d, state_el, value))
+        metrics.observe("update.save", time.perf_counter() - start)
+        log(f"    ✅ Update Successful. ({time.perf_counter() - start:.1f}s)")
+        metrics.incr("saves")
+        return True
+    except Exception as e:
+        reason = f"not confirmed within {config.SAVE_TIMEOUT}s" if isinstance(e, sel.TimeoutException) else e
+        log(f"    ❌ Update Failed: {reason}")
+        metrics.incr("save_failures")
+        return False
+
+# ===================================================================
+# --- OPERATOR DESK (PROMPTS OFF THE POLLING LOOP) ---
+# ===================================================================
+class OperatorDesk:
+    """
+    Serves console prompts one by one on their own thread, so detection keeps
+    running while the operator decides. Tickets needing input are queued with
+    their scraped context; finished decisions are collected by the main loop
+    with drain() and applied in Tab 2.
+    """
+    def __init__(self, shift_users):
+        self.shift_users = shift_users
+        self.pending = queue.Queue()
+        self.done = queue.Queue()
+        self.waiting = set()  # Queued, being prompted, or decided but not yet applied
+        self.dropped = set()  # Left the list before the operator got to them
+        self.lock = threading.Lock()
+        threading.Thread(target=self._serve, name="operator-desk", daemon=True).start()
+
+    def is_waiting(self, ticket):
+        with self.lock:
+            return ticket in self.waiting
+
+    def depth(self):
+        with self.lock:
+            return len(self.waiting)
+
+    def submit(self, ticket_data, short_desc, needs_assignee, suggestion=None):
+        ticket = ticket_data['ticket']
+        with self.lock:
+            if ticket in self.waiting: return
+            self.waiting.add(ticket)
+            self.dropped.discard(ticket)
+        self.pending.put({'ticket_data': ticket_data, 'desc': short_desc, 'needs_assignee': needs_assignee,
+                          'suggestion': suggestion, 'queued_at': time.time()})
+        log(f"    📥 Queued for operator decision (queue depth: {self.depth()})")
+
+    def retain(self, rows):
+        """Queued tickets no longer in the list are dropped instead of prompted (rows is None: list not read, keep all)."""
+        if rows is None: return
+        current = {row['ticket'] for row in rows}
+        with self.lock:
+            self.dropped.update(t for t in self.waiting if t not in current)
+            self.dropped -= current  # Back in the list before its prompt came up
+
+    def drain(self):
+        """Returns [(ticket_data, decision or None, waited_seconds)] decided since the last call.
+
+        Decisions for tickets that left the list while the operator was deciding come back as None.
+        """
+        finished = []
+        while True:
+            try: finished.append(self.done.get_nowait())
+            except queue.Empty: break
+        with self.lock:
+            for i, (ticket_data, decision, waited) in enumerate(finished):
+                ticket = ticket_data['ticket']
+                self.waiting.discard(ticket)
+                if ticket in self.dropped:
+                    self.dropped.discard(ticket)
+                    if decision:
+                        log(f"    ⏭️  {ticket} left the queue before its decision was applied. Skipping.")
+                        finished[i] = (ticket_data, None, waited)
+        return finished
+
+    def _serve(self):
+        while True:
+            item = self.pending.get()
+            ticket = item['ticket_data']['ticket']
+            waited = time.time() - item['queued_at']
+            with self.lock:
+                is_dropped = ticket in self.dropped
+            if is_dropped:
+                log(f"    ⏭️  {ticket} left the queue after {waited:.0f}s, before a decision. Skipping.")
+                self.done.put((item['ticket_data'], None, waited))
+                continue
+
+            log("\n" + "=" * config.LINE_LENGTH)
+            log(f"    🧑‍💻 DECISION NEEDED: {ticket} - {item['desc']}")
+            log(f"    ⏳ Waited {waited:.0f}s in queue, {self.pending.qsize()} more behind it")
+            log("=" * config.LINE_LENGTH)
+            try:
+                decision = ask_operator(ticket, self.shift_users, item['needs_assignee'], item['suggestion'])
+            except Exception as e:
+                log(f"    ❌ Operator prompt failed: {e}")
+                decision = None
+            waited = time.time() - item['queued_at']
+            log(f"    ⏱️  {ticket} decided after {waited:.0f}s: {decision['name'] if decision else 'Skipped'}")
+            self.done.put((item['ticket_data'], decision, waited))
+
+# ===================================================================
+# --- WORKER POOL (PARALLEL FAST-PROCESSING) ---
+# ===================================================================
+class BrowserWorkerPool:
+    """
+    N extra browser sessions, each on its own thread, taking L2 fast-process
+    tickets from a queue and running open_and_update at the same time.
+    Tickets that need console input still go through Tab 2 one at a time.
+    """
+    def __init__(self, size):
+        self.size = size
+        self.jobs = queue.Queue()
+        self.results = []  # (ticket, ok, seconds) for the current batch
+        self.results_lock = threading.Lock()
+        self.threads = []
+
+    def start(self):
+        log(f"    🧵 Starting {self.size} worker browser(s)")
+        for idx in range(self.size):
+            t = threading.Thread(target=self._worker, args=(idx + 1,), name=f"worker-{idx + 1}", daemon=True)
+            t.start()
+            self.threads.append(t)
+        return self
+
+    def _new_driver(self, idx):
+        # Own profile-less Chrome (a profile dir can't be shared); saved cookies usually skip SSO
+        try:
+            return initialize_driver(use_profile=False)
+        except Exception as e:
+            log(f"    ❌ [W{idx}] Worker browser failed to start: {e}")
+            return None, None
+
+    def _worker(self, idx):
+        driver, wait = self._new_driver(idx)
+        while True:
+            job = self.jobs.get()
+            if job is None:
+                self.jobs.task_done()
+                break
+            ticket, desc, mem = job
+            start = time.perf_counter()
+            ok = False
+            try:
+                if driver is None: driver, wait = self._new_driver(idx)
+                if driver is not None:
+                    log(f"    🔄 [W{idx}] Fast-Processing: {ticket} - {desc} -> {mem['name']}")
+                    ok = open_and_update(driver, wait, ticket, mem['value'], mem['name'], assignee=None)
+                    if ok: metrics.incr("auto_updated")
+            except sel.WebDriverException as e:
+                log(f"    ⚠️ [W{idx}] Browser lost on {ticket}: {e.__class__.__name__}")
+                try: driver.quit()
+                except: pass
+                driver = None
+            finally:
+                with self.results_lock:
+                    self.results.append((ticket, ok, time.perf_counter() - start))
+                self.jobs.task_done()
+        if driver:
+            try: driver.quit()
+            except: pass
+
+    def submit(self, ticket_data, mem):
+        self.jobs.put((ticket_data['ticket'], ticket_data['desc'], mem))
+
+    def wait(self):
+        """Blocks until every submitted ticket is done; returns and clears the (ticket, ok, seconds) results."""
+        self.jobs.join()
+        with self.results_lock:
+            results, self.results = self.results, []
+        return results
+
+    def close(self):
+        for _ in self.threads: self.jobs.put(None)
+        for t in self.threads: t.join(timeout=30)
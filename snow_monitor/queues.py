@@ -0,0 +1,148 @@
+"""
+Monitored queues: which lists are checked each cycle, and what was seen on them.
+"""
+import re
+import time
+import threading
+from urllib.parse import urlencode
+
+from . import config
+from . import selenium_api as sel
+from .logs import log
+from .scraper import unique_tickets
+
+
+# ===================================================================
+# --- QUEUES ---
+# ===================================================================
+class TicketQueue:
+    """One monitored list: its filter, priority, cadence and what was last seen on it."""
+    def __init__(self, name, query="", table="incident", priority=5, interval=None, process=None, list_url=None):
+        self.name = name
+        self.table = table
+        self.list_url = list_url or f"{config.BASE_URL}/{table}_list.do?" + urlencode({"sysparm_query": query})
+        self.priority = priority
+        self.interval = interval  # Seconds between checks; None = every cycle
+        self.process = table == "incident" if process is None else process
+        self.rows = []       # Tickets from the last check (processing queues)
+        self.seen = None     # Numbers / sys_ids from the last check (None until the first one)
+        self.count = None
+        self.arrived = 0     # New since the check before
+        self.checked = None  # Epoch of the last successful check
+        self.next_due = 0.0
+        self.error = None
+
+    @property
+    def slug(self):
+        return re.sub(r"[^a-z0-9]+", "_", self.name.lower()).strip("_")
+
+class QueueScheduler:
+    """
+    Runs every configured queue through the one poll cycle and one browser.
+    Each cycle checks the queues that are due, highest priority (lowest
+    number) first: processing queues feed the L1 workflow with their merged
+    tickets, count-only queues (e.g. RITMs) report how many items sit on
+    them and how many arrived. Intervals are checked at cycle boundaries, so
+    no queue is checked more often than the poll cadence.
+    """
+    def __init__(self):
+        self.queues = []
+        self.summary = None  # Last per-queue counts line logged
+        self.lock = threading.Lock()
+
+    def load(self, specs=None):
+        """QUEUES from config (or `specs`); just the New-state list when none are set."""
+        queues = []
+        for spec in (config.QUEUES if specs is None else specs):
+            queue = TicketQueue(**spec)
+            if queue.process and queue.table != "incident":
+                log(f"    ⚠️ Queue '{queue.name}': only incidents can be processed, watching its count instead")
+                queue.process = False
+            queues.append(queue)
+        if not any(q.process for q in queues):
+            queues.append(TicketQueue("New", list_url=config.URL_NEW_STATE_LIST, priority=0))
+        with self.lock:
+            self.queues = sorted(queues, key=lambda q: q.priority)
+        return self
+
+    def fetch(self, source, driver, wait):
+        """
+        Checks the due queues. Returns the tickets of the processing queues
+        that were read, merged (cached when not due). A processing queue whose
+        last check failed is degraded: it is left out until it reads again,
+        and last_known() keeps its tickets. None when no processing queue
+        could be read.
+        """
+        now = time.time()
+        for queue in self.queues:
+            if queue.interval and now < queue.next_due: continue
+            try:
+                if queue.process:
+                    rows = source.fetch(driver, wait, queue.list_url)
+                    if rows is None: raise RuntimeError("list could not be read")
+                    queue.rows = rows
+                    found = [t['ticket'] for t in rows]
+                else:
+                    found = source.keys(driver, wait, queue.list_url)
+            except sel.WebDriverException:
+                raise  # Browser trouble: the main loop restarts it
+            except Exception as e:
+                if queue.error is None:
+                    degraded = " (degraded: its tickets are held, the other queues are still processed)" if queue.process else ""
+                    log(f"      ⚠️ Queue '{queue.name}' check failed: {e}{degraded}")
+                with self.lock: queue.error = str(e) or e.__class__.__name__
+                queue.next_due = now + (queue.interval or 0)
+                continue
+            if queue.error is not None and queue.process: log(f"      ✅ Queue '{queue.name}' readable again")
+            self._record(queue, found, now)
+            queue.next_due = now + (queue.interval or 0)
+        self._log_counts()
+        read = [q for q in self.queues if q.process and q.error is None]
+        if not read: return None
+        return unique_tickets(t for q in read for t in q.rows)
+
+    def last_known(self, rows):
+        """
+        `rows` (from fetch) plus the cached tickets of degraded processing
+        queues, for the retain() calls: those tickets are unknown, not gone.
+        None while a degraded queue has never been read.
+        """
+        if rows is None: return None
+        degraded = [q for q in self.queues if q.process and q.error is not None]
+        if any(q.seen is None for q in degraded): return None
+        return [*rows, *(t for q in degraded for t in q.rows)]
+
+    def _record(self, queue, found, now):
+        current = set(found)
+        arrived = current - queue.seen if queue.seen is not None else set()
+        with self.lock:
+            queue.seen = current
+            queue.count = len(current)
+            queue.arrived = len(arrived)
+            queue.checked = now
+            queue.error = None
+        if arrived and not queue.process:
+            log(f"    📥 {queue.name}: {len(arrived)} new ({queue.count} waiting)")
+
+    def _log_counts(self):
+        if len(self.queues) < 2: return
+        summary = " | ".join(f"{q.name} {q.count if q.count is not None else '?'}" for q in self.queues)
+        if summary != self.summary:
+            log(f"    📋 Queues: {summary}")
+            self.summary = summary
+
+    def stats(self):
+        """Per-queue counts for the viewer and /api/queues."""
+        now = time.time()
+        with self.lock:
+            return [{"name": q.name, "table": q.table, "process": q.process, "priority": q.priority,
+                     "interval": q.interval, "count": q.count, "arrived": q.arrived, "error": q.error,
+                     "checked_ago": round(now - q.checked, 1) if q.checked else None}
+                    for q in self.queues]
+
+    def gauges(self):
+        """Per-queue counts as Prometheus gauges."""
+        with self.lock:
+            return {f"queue_{q.slug}_count": q.count for q in self.queues if q.count is not None}
+
+queue_scheduler = QueueScheduler()
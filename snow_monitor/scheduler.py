@@ -0,0 +1,128 @@
+"""
+Adaptive poll cadence for the main loop.
+"""
+import math
+import time
+import random
+import threading
+from collections import deque
+
+from . import config
+from .logs import log
+from .metrics import metrics
+
+
+# ===================================================================
+# --- POLL SCHEDULER ---
+# ===================================================================
+class PollScheduler:
+    """
+    Paces the main loop on a start-to-start cadence: the time a cycle spent
+    scraping and processing is taken off the sleep. Polls faster for a few
+    cycles after new tickets appear, backs off after a long quiet spell and
+    spreads every interval by POLL_JITTER so checks don't fall into lockstep.
+    """
+    def __init__(self, base=config.POLL_INTERVAL, profiles=config.POLL_SHIFT_PROFILES):
+        self.base = base
+        self.profiles = [(self._minutes(a), self._minutes(b), secs) for a, b, secs in profiles]
+        self.known = None       # Ticket numbers seen last cycle (None until the first cycle)
+        self.idle_cycles = 0
+        self.burst_left = 0
+        self.mode = "normal"
+        self.interval = base
+        self.cycle_start = None
+        self.cycle_duration = None  # Set by finish_cycle; None while a cycle is running or was cut short
+        self.last_start = None
+        self.cycles = 0
+        self.samples = deque(maxlen=120)  # (start-to-start period, cycle duration)
+        self.lock = threading.Lock()
+
+    @staticmethod
+    def _minutes(hhmm):
+        hours, minutes = hhmm.split(":")
+        return int(hours) * 60 + int(minutes)
+
+    def base_interval(self, now=None):
+        """POLL_INTERVAL, or the interval of the shift profile active right now."""
+        t = time.localtime(now)
+        minute = t.tm_hour * 60 + t.tm_min
+        for start, end, secs in self.profiles:
+            inside = start <= minute < end if start <= end else (minute >= start or minute < end)
+            if inside: return secs
+        return self.base
+
+    def start_cycle(self):
+        now = time.perf_counter()
+        with self.lock:
+            if self.last_start is not None and self.cycle_duration is not None:
+                self.samples.append((now - self.last_start, self.cycle_duration))
+            self.last_start = now
+            self.cycle_start = now
+            self.cycle_duration = None
+
+    def finish_cycle(self, tickets):
+        """Returns the seconds to sleep before the next cycle starts. `tickets` is None when the list could not be read."""
+        duration = time.perf_counter() - self.cycle_start
+        new_count = 0
+        if tickets is not None:  # A failed read says nothing about arrivals: keep last cycle's list
+            current = {t['ticket'] for t in tickets}
+            arrived = current - (self.known or set())
+            metrics.incr("tickets_seen", len(arrived))
+            new_count = len(arrived) if self.known is not None else 0  # The first list is not a burst
+            self.known = current
+
+        base = self.base_interval()
+        if new_count:
+            self.idle_cycles = 0
+            self.burst_left = config.POLL_BURST_CYCLES
+        else:
+            self.idle_cycles += 1
+
+        if self.burst_left:
+            self.burst_left -= 1
+            mode, interval = "burst", min(base, config.POLL_MIN_INTERVAL)
+        elif self.idle_cycles > config.POLL_IDLE_CYCLES:
+            ceiling = max(base, config.POLL_MAX_INTERVAL)
+            steps = self.idle_cycles - config.POLL_IDLE_CYCLES
+            if config.POLL_IDLE_BACKOFF > 1:  # Past the ceiling more steps change nothing, they only overflow the power
+                steps = min(steps, math.ceil(math.log(ceiling / base, config.POLL_IDLE_BACKOFF)))
+            mode, interval = "idle", min(ceiling, base * config.POLL_IDLE_BACKOFF ** steps)
+        else:
+            mode, interval = "normal", base
+        interval *= 1 + random.uniform(-config.POLL_JITTER, config.POLL_JITTER)
+
+        if mode != self.mode:
+            labels = {"burst": "⚡ new tickets, polling faster", "idle": "💤 queue quiet, backing off",
+                      "normal": "back to normal cadence"}
+            log(f"    ⏲️  Poll cadence: {labels[mode]} (~{interval:.1f}s)")
+        with self.lock:
+            self.mode = mode
+            self.interval = interval
+            self.cycle_duration = duration
+            self.cycles += 1
+        metrics.observe("cycle", duration)
+        return max(0.0, interval - duration)
+
+    def stats(self):
+        """Cycle timing for /api/stats. A ticket that appears at a random moment waits
+        on average half a period for the next check, plus one cycle to be seen."""
+        with self.lock:
+            samples = list(self.samples)
+            stats = {"cycles": self.cycles, "mode": self.mode, "interval": round(self.interval, 2),
+                     "idle_cycles": self.idle_cycles}
+        if samples:
+            periods = sorted(p for p, _ in samples)
+            durations = [d for _, d in samples]
+            avg_period = sum(periods) / len(periods)
+            avg_cycle = sum(durations) / len(durations)
+            stats.update({
+                "avg_period": round(avg_period, 2),
+                "max_period": round(periods[-1], 2),
+                "avg_cycle": round(avg_cycle, 2),
+                "max_cycle": round(max(durations), 2),
+                "avg_detection_latency": round(avg_period / 2 + avg_cycle, 2),
+                "max_detection_latency": round(periods[-1] + max(durations), 2),
+            })
+        return stats
+
+poll_scheduler = PollScheduler()
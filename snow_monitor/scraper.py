@@ -0,0 +1,422 @@
+"""
+Ticket sources: the New-state list scraped in Tab 1, refreshed in place, or read from the Table API.
+"""
+import json
+import base64
+import threading
+import http.client
+from urllib.parse import urlsplit, parse_qs, urlencode
+
+from . import config
+from . import selenium_api as sel
+from .logs import log
+from .metrics import metrics
+
+
+# ===================================================================
+# --- TAB 1: SCRAPER ---
+# ===================================================================
+# Collects header labels and every row's cell text from the list in a single
+# round trip. Returns a JSON string: [[header, ...], [[cell, ...], ...]]
+BULK_SCRAPE_JS = """
+const headers = Array.from(document.querySelectorAll('table thead th'), th => th.innerText.trim());
+const rows = Array.from(document.querySelectorAll('.list2_body tr'),
+    tr => Array.from(tr.querySelectorAll('td'), td => td.innerText.trim()));
+return JSON.stringify([headers, rows]);
+"""
+
+# In-page refresh (Tab 1 keeps a list loaded): fetches a list's JSONv2 export from inside the page and
+# diffs it against the copy kept in the page since the last poll (one copy per export URL). Returns only
+# the changed rows as [number, short description, assigned to, reopen count, updated], the numbers that
+# left the list and `full` when the page had no copy (everything was sent), {reload: true} if Tab 1 is not
+# on a logged-in list page, or {error: ...}.
+INPAGE_REFRESH_JS = """
+const [url, reset, done] = arguments;
+if (!window.g_ck || !document.querySelector('.list2_body')) { done({reload: true}); return; }
+window.__snowRows = window.__snowRows || {};
+const full = reset || !window.__snowRows[url];
+if (full) window.__snowRows[url] = new Map();
+const known = window.__snowRows[url];
+fetch(url, {credentials: 'same-origin', headers: {'Accept': 'application/json', 'X-UserToken': window.g_ck}})
+  .then(r => r.ok ? r.json() : Promise.reject('HTTP ' + r.status))
+  .then(data => {
+    const changed = [], seen = new Set();
+    for (const rec of data.records || []) {
+      const row = ['number', 'short_description', 'assigned_to', 'reopen_count', 'sys_updated_on']
+        .map(f => rec[f] == null ? '' : String(rec[f]).trim());
+      if (!row[0].startsWith('INC') || seen.has(row[0])) continue;
+      seen.add(row[0]);
+      const sig = row.join('\\u0001');
+      if (known.get(row[0]) !== sig) { known.set(row[0], sig); changed.push(row); }
+    }
+    const removed = [...known.keys()].filter(num => !seen.has(num));
+    removed.forEach(num => known.delete(num));
+    done({changed: changed, removed: removed, full: full, total: seen.size});
+  })
+  .catch(err => done({error: String(err)}));
+"""
+
+# Count-only queues: the sys_ids on a list (JSONv2 getKeys), read from whatever logged-in page Tab 1 shows
+QUEUE_KEYS_JS = """
+const [url, done] = arguments;
+if (!window.g_ck) { done({reload: true}); return; }
+fetch(url, {credentials: 'same-origin', headers: {'Accept': 'application/json', 'X-UserToken': window.g_ck}})
+  .then(r => r.ok ? r.json() : Promise.reject('HTTP ' + r.status))
+  .then(data => done({keys: data.records || []}))
+  .catch(err => done({error: String(err)}));
+"""
+
+def map_list_columns(header_texts):
+    """Maps the list header labels to the column indexes we read."""
+    col_map = {"Number": -1, "Short description": -1, "Reopen count": -1, "Assigned to": -1}
+
+    for i, txt in enumerate(header_texts):
+        txt = txt.strip().lower()
+        if "number" in txt: col_map["Number"] = i
+        elif "short description" in txt: col_map["Short description"] = i
+        elif "reopen count" in txt: col_map["Reopen count"] = i
+        elif "assigned to" in txt: col_map["Assigned to"] = i
+    return col_map
+
+def row_cells_to_ticket(cells, col_map):
+    """Builds the ticket dict from a row's cell texts (None if not an incident row)."""
+    t_num = cells[col_map["Number"]].strip() if len(cells) > col_map["Number"] else ""
+    if not t_num.startswith("INC"): return None
+
+    short_desc = "No Description"
+    if col_map["Short description"] != -1 and len(cells) > col_map["Short description"]:
+        short_desc = cells[col_map["Short description"]].strip()
+
+    assigned_to = ""
+    if col_map["Assigned to"] != -1 and len(cells) > col_map["Assigned to"]:
+        assigned_to = cells[col_map["Assigned to"]].strip()
+
+    reopen_count = 0
+    if col_map["Reopen count"] != -1 and len(cells) > col_map["Reopen count"]:
+        try: reopen_count = int(cells[col_map["Reopen count"]].strip())
+        except: reopen_count = 0
+
+    return {"ticket": t_num, "desc": short_desc, "assigned": assigned_to, "reopen": reopen_count}
+
+def extract_rows_bulk(driver):
+    """Bulk path: one execute_script call for the header map and all rows."""
+    header_texts, rows = json.loads(driver.execute_script(BULK_SCRAPE_JS))
+    col_map = map_list_columns(header_texts)
+    if col_map["Number"] == -1: return []
+
+    scraped_tickets = []
+    for cells in rows:
+        item = row_cells_to_ticket(cells, col_map)
+        if item: scraped_tickets.append(item)
+    return scraped_tickets
+
+def extract_rows_per_cell(driver):
+    """Legacy path: one WebDriver call per row and per cell read."""
+    headers = driver.find_elements(sel.By.XPATH, "//table//thead//th")
+    col_map = map_list_columns([h.text for h in headers])
+    if col_map["Number"] == -1: return []
+
+    scraped_tickets = []
+    rows = driver.find_elements(sel.By.CSS_SELECTOR, ".list2_body tr")
+    for row in rows:
+        try:
+            cells = row.find_elements(sel.By.TAG_NAME, "td")
+            texts = [""] * len(cells)  # Only the mapped columns are read
+            for idx in col_map.values():
+                if 0 <= idx < len(cells): texts[idx] = cells[idx].text
+            item = row_cells_to_ticket(texts, col_map)
+            if item: scraped_tickets.append(item)
+        except: pass
+    return scraped_tickets
+
+def unique_tickets(tickets):
+    """First row per ticket number, in list order."""
+    seen = set()
+    unique = []
+    for item in tickets:
+        if item['ticket'] not in seen:
+            unique.append(item)
+            seen.add(item['ticket'])
+    return unique
+
+@metrics.timed("scrape")
+def scrape_l1_incidents_detailed(driver, wait, list_url=None):
+    """Tickets on the list, or None if the list could not be read (an empty list is [])."""
+    with metrics.timer("scrape.tab_switch"):
+        driver.switch_to.window(driver.window_handles[0])
+    with metrics.timer("scrape.page_load"):
+        driver.get(list_url or config.URL_NEW_STATE_LIST)
+        try: loaded = bool(wait.until(sel.EC.presence_of_element_located((sel.By.CLASS_NAME, "list2_body"))))
+        except: loaded = False
+    if not loaded:
+        log("      ⚠️ List page did not load")
+        return None
+
+    try:
+        with metrics.timer("scrape.extract"):  # Header mapping + row extraction
+            if config.BULK_SCRAPE:
+                scraped_tickets = extract_rows_bulk(driver)
+            else:
+                scraped_tickets = extract_rows_per_cell(driver)
+
+    except Exception as e:
+        if "stale element" not in str(e).lower():
+            log(f"      ⚠️ Error scraping L1: {e}")
+        return None
+
+    return unique_tickets(scraped_tickets)
+
+# ===================================================================
+# --- TICKET SOURCES (TAB 1 SCRAPER, IN-PAGE REFRESH OR TABLE API) ---
+# ===================================================================
+def load_list_page(driver, wait, list_url=None):
+    """Puts Tab 1 back on a list page (the anchor for in-page fetches)."""
+    with metrics.timer("scrape.page_load"):
+        driver.get(list_url or config.URL_NEW_STATE_LIST)
+        wait.until(sel.EC.presence_of_element_located((sel.By.CLASS_NAME, "list2_body")))
+
+def jsonv2_url(list_url, **params):
+    """The JSONv2 export of a list URL, as a same-origin path for an in-page fetch."""
+    path = urlsplit(list_url).path
+    return f"{path}?JSONv2&" + urlencode(dict(params, sysparm_query=list_url_query(list_url)))
+
+@metrics.timed("queue_keys")
+def fetch_keys_in_page(driver, wait, list_url):
+    """sys_ids on a list, fetched from inside Tab 1 with the browser's own session."""
+    driver.switch_to.window(driver.window_handles[0])
+    url = jsonv2_url(list_url, sysparm_action="getKeys")
+    result = driver.execute_async_script(QUEUE_KEYS_JS, url) or {}
+    if result.get("reload"):
+        load_list_page(driver, wait)
+        result = driver.execute_async_script(QUEUE_KEYS_JS, url) or {}
+    if "keys" not in result:
+        raise RuntimeError(result.get("error") or "no logged-in page in Tab 1")
+    return result["keys"]
+
+class BrowserTicketSource:
+    """Reads a list (the New-state list by default) by rendering it in Tab 1."""
+    name = "browser"
+
+    def fetch(self, driver, wait, list_url=None):
+        return scrape_l1_incidents_detailed(driver, wait, list_url)
+
+    def keys(self, driver, wait, list_url):
+        return fetch_keys_in_page(driver, wait, list_url)
+
+    def attach_session(self, driver):
+        pass
+
+    def close(self):
+        pass
+
+class InPageTicketSource:
+    """
+    Keeps the New-state list loaded in Tab 1 and refreshes only the data: an
+    in-page fetch of a list's JSONv2 export, diffed inside the browser, so
+    just the changed rows cross WebDriver. One page serves every queue's
+    list. Loads the list page when Tab 1 is not on it (new login, recycled
+    browser) and falls back to a full scrape for the cycle when the export
+    can't be read.
+    """
+    name = "inpage"
+
+    def __init__(self):
+        self.driver = None
+        self.rows = {}  # export URL -> {ticket: dict}, mirrors the copies kept in the page
+        self.failing = set()
+
+    @metrics.timed("inpage_fetch")
+    def fetch(self, driver, wait, list_url=None):
+        list_url = list_url or config.URL_NEW_STATE_LIST
+        json_url = jsonv2_url(list_url, displayvalue="true")  # Same origin as the page: session cookie + g_ck
+        if driver is not self.driver: self.driver, self.rows = driver, {}  # Restarted or recycled browser
+        driver.switch_to.window(driver.window_handles[0])
+        try:
+            result = self._refresh(driver, wait, json_url)
+        except Exception as e:
+            if json_url not in self.failing:
+                log(f"      ⚠️ In-page refresh failed ({str(e).splitlines()[0] if str(e) else e.__class__.__name__}), "
+                    f"reloading the list instead")
+            self.failing.add(json_url)
+            self.rows.clear()  # The scrape below replaces the page and every copy in it
+            return scrape_l1_incidents_detailed(driver, wait, list_url)
+        if json_url in self.failing:
+            log("      ✅ In-page refresh working again")
+            self.failing.discard(json_url)
+
+        rows = {} if result["full"] else self.rows.get(json_url, {})
+        for number in result["removed"]: rows.pop(number, None)
+        for number, desc, assigned, reopen, updated in result["changed"]:
+            try: reopen_count = int(reopen or 0)
+            except: reopen_count = 0
+            rows[number] = {"ticket": number, "desc": desc or "No Description", "assigned": assigned,
+                            "reopen": reopen_count, "updated": updated}
+        self.rows[json_url] = rows
+        return list(rows.values())
+
+    def _refresh(self, driver, wait, json_url):
+        result = driver.execute_async_script(INPAGE_REFRESH_JS, json_url, json_url not in self.rows) or {}
+        if result.get("reload"):
+            load_list_page(driver, wait)
+            self.rows.clear()
+            result = driver.execute_async_script(INPAGE_REFRESH_JS, json_url, True) or {}
+        if "changed" not in result:
+            raise RuntimeError(result.get("error") or "list page not loaded")
+        return result
+
+    def keys(self, driver, wait, list_url):
+        return fetch_keys_in_page(driver, wait, list_url)
+
+    def attach_session(self, driver):
+        pass
+
+    def close(self):
+        pass
+
+class RestTicketSource:
+    """
+    Reads the New-state list (or any queue's list) from /api/now/table/<table>.
+    Keeps one keep-alive connection per thread, shared by every queue, and
+    returns the same dicts as scrape_l1_incidents_detailed.
+    """
+    name = "rest"
+    FIELDS = "number,short_description,reopen_count,assigned_to,state,sys_updated_on"
+
+    def __init__(self, base_url, query, user=None, password=None,
+                 page_size=config.REST_PAGE_SIZE, timeout=config.REST_TIMEOUT):
+        parsed = urlsplit(base_url)
+        self.scheme = parsed.scheme or "https"
+        self.host = parsed.netloc
+        self.api_root = parsed.path.rstrip("/") + "/api/now/table/"
+        self.query = query
+        self.page_size = page_size
+        self.timeout = timeout
+
+        self.headers = {"Accept": "application/json", "Connection": "keep-alive"}
+        if user and password:
+            token = base64.b64encode(f"{user}:{password}".encode("utf-8")).decode("ascii")
+            self.headers["Authorization"] = f"Basic {token}"
+
+        self._local = threading.local()  # Connection pool: one persistent connection per thread
+        self._conns = []
+        self._conns_lock = threading.Lock()
+
+    def attach_session(self, driver):
+        """Authenticates with the browser's session cookies and CSRF token instead of basic auth."""
+        cookies = "; ".join(f"{c['name']}={c['value']}" for c in driver.get_cookies())
+        self.headers.pop("Authorization", None)
+        self.headers["Cookie"] = cookies
+        try:
+            token = driver.execute_script("return window.g_ck || '';")
+            if token: self.headers["X-UserToken"] = token
+        except: pass
+
+    def _connection(self):
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn_cls = http.client.HTTPSConnection if self.scheme == "https" else http.client.HTTPConnection
+            conn = conn_cls(self.host, timeout=self.timeout)
+            self._local.conn = conn
+            with self._conns_lock: self._conns.append(conn)
+        return conn
+
+    def _drop_connection(self):
+        conn = getattr(self._local, "conn", None)
+        if conn is not None:
+            conn.close()
+            self._local.conn = None
+
+    def _get_json(self, path):
+        # Retry once on a fresh connection if the server closed the idle one
+        for attempt in (1, 2):
+            conn = self._connection()
+            try:
+                conn.request("GET", path, headers=self.headers)
+                resp = conn.getresponse()
+                body = resp.read()
+            except (http.client.HTTPException, OSError):
+                self._drop_connection()
+                if attempt == 2: raise
+                continue
+            if resp.status != 200:
+                raise RuntimeError(f"Table API returned HTTP {resp.status}")
+            return json.loads(body.decode("utf-8"))
+
+    def _records(self, table, query, fields):
+        """All records on the list, page by page."""
+        offset = 0
+        while True:
+            params = urlencode({
+                "sysparm_query": query,
+                "sysparm_fields": fields,
+                "sysparm_display_value": "true",
+                "sysparm_exclude_reference_link": "true",
+                "sysparm_limit": self.page_size,
+                "sysparm_offset": offset,
+            })
+            records = self._get_json(f"{self.api_root}{table}?{params}").get("result", [])
+            yield from records
+            if len(records) < self.page_size: break
+            offset += self.page_size
+
+    @metrics.timed("rest_fetch")
+    def fetch(self, driver=None, wait=None, list_url=None):
+        table, query = (list_url_table(list_url), list_url_query(list_url)) if list_url else ("incident", self.query)
+        scraped_tickets = []
+        try:
+            for rec in self._records(table, query, self.FIELDS):
+                item = table_record_to_ticket(rec)
+                if item: scraped_tickets.append(item)
+        except Exception as e:
+            log(f"      ⚠️ Error reading Table API: {e}")
+            return None
+        return unique_tickets(scraped_tickets)
+
+    @metrics.timed("queue_keys")
+    def keys(self, driver, wait, list_url):
+        """sys_ids on a list (count-only queues)."""
+        return [rec.get("sys_id", "") for rec in self._records(list_url_table(list_url), list_url_query(list_url), "sys_id")]
+
+    def close(self):
+        with self._conns_lock:
+            for conn in self._conns: conn.close()
+            self._conns.clear()
+        self._local = threading.local()
+
+def table_record_to_ticket(rec):
+    """Maps a Table API record (display values) to the scraper's ticket dict."""
+    def display(field):
+        val = rec.get(field) or ""
+        if isinstance(val, dict): val = val.get("display_value") or ""
+        return str(val).strip()
+
+    t_num = display("number")
+    if not t_num.startswith("INC"): return None
+
+    try: reopen_count = int(display("reopen_count") or 0)
+    except: reopen_count = 0
+
+    return {
+        "ticket": t_num, "desc": display("short_description") or "No Description",
+        "assigned": display("assigned_to"), "reopen": reopen_count,
+        "updated": display("sys_updated_on")
+    }
+
+def list_url_query(list_url):
+    """Extracts the encoded query (sysparm_query) from a list URL."""
+    return parse_qs(urlsplit(list_url).query).get("sysparm_query", [""])[0]
+
+def list_url_table(list_url):
+    """The table behind a list URL (.../sc_req_item_list.do -> sc_req_item)."""
+    page = urlsplit(list_url).path.rsplit("/", 1)[-1]
+    return page[:-len("_list.do")] if page.endswith("_list.do") else "incident"
+
+def make_ticket_source():
+    """Builds the ticket source selected by TICKET_SOURCE."""
+    if config.TICKET_SOURCE == "rest":
+        if config.REST_AUTH == "session":
+            return RestTicketSource(config.BASE_URL, list_url_query(config.URL_NEW_STATE_LIST))
+        return RestTicketSource(config.BASE_URL, list_url_query(config.URL_NEW_STATE_LIST), config.USER, config.PASSWORD)
+    if config.TICKET_SOURCE == "inpage":
+        return InPageTicketSource()
+    return BrowserTicketSource()
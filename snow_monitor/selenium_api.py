@@ -0,0 +1,33 @@
+"""
+Selenium names used by the package, imported on first use.
+
+Modules do `from . import selenium_api as sel` and write `sel.By.ID`, so the
+log viewer, config, L2 store and the tools load without paying for (or
+even having) Selenium installed.
+"""
+import importlib
+
+# name -> (module, attribute or None for the module itself)
+_NAMES = {
+    "webdriver": ("selenium.webdriver", None),
+    "By": ("selenium.webdriver.common.by", "By"),
+    "Options": ("selenium.webdriver.chrome.options", "Options"),
+    "Service": ("selenium.webdriver.chrome.service", "Service"),
+    "WebDriverWait": ("selenium.webdriver.support.ui", "WebDriverWait"),
+    "EC": ("selenium.webdriver.support.expected_conditions", None),
+    "WebDriverException": ("selenium.common.exceptions", "WebDriverException"),
+    "StaleElementReferenceException": ("selenium.common.exceptions", "StaleElementReferenceException"),
+    "ElementClickInterceptedException": ("selenium.common.exceptions", "ElementClickInterceptedException"),
+    "TimeoutException": ("selenium.common.exceptions", "TimeoutException"),
+}
+
+
+def __getattr__(name):
+    try:
+        module_name, attr = _NAMES[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+    module = importlib.import_module(module_name)
+    value = module if attr is None else getattr(module, attr)
+    globals()[name] = value  # Later lookups are plain module attributes
+    return value
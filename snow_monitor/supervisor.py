@@ -0,0 +1,137 @@
+"""
+Planned browser recycling for long shifts.
+"""
+import time
+import statistics
+import threading
+from collections import deque
+
+from . import config
+from .browser import initialize_driver
+from .logs import log
+from .metrics import metrics
+
+
+# ===================================================================
+# --- BROWSER SUPERVISOR ---
+# ===================================================================
+def chrome_rss_mb(driver):
+    """Resident memory of the Chrome processes under chromedriver, in MB (None without psutil)."""
+    try: import psutil
+    except ImportError: return None
+    try:
+        total = 0
+        for proc in psutil.Process(driver.service.process.pid).children(recursive=True):
+            try: total += proc.memory_info().rss
+            except psutil.Error: pass
+        return total / (1024 * 1024)
+    except (psutil.Error, AttributeError):
+        return None
+
+def _quit(driver):
+    try: driver.quit()
+    except: pass
+
+class BrowserSupervisor:
+    """
+    Replaces the main browser before it gets slow: after RECYCLE_MAX_CYCLES
+    cycles, above RECYCLE_MAX_RSS_MB of Chrome memory, or when the list scrape
+    has slowed to RECYCLE_LATENCY_FACTOR times its speed after launch. The
+    replacement is launched and logged in on a background thread while the
+    old browser keeps polling, and swapped in between two cycles.
+    """
+    RETRY_AFTER_CYCLES = 50  # Wait this long after a replacement failed to start
+    MIN_SLOWDOWN = 0.5       # Seconds: smaller scrape slowdowns are noise, whatever the factor
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.spare = None    # (driver, wait) logged in and ready to swap in
+        self.warming = False
+        self.closed = False
+        self.reason = None
+        self.recycles = 0
+        self.adopt()
+
+    def adopt(self):
+        """Starts tracking a freshly launched browser."""
+        with self.lock:
+            self.cycles = 0
+            self.started = time.time()
+            self.baseline = []  # Scrape seconds of the first RECYCLE_LATENCY_WINDOW cycles
+            self.recent = deque(maxlen=config.RECYCLE_LATENCY_WINDOW)
+            self.rss = None
+            self.hold_until = 0
+
+    def end_cycle(self, driver, scrape_secs=None):
+        """Records a finished cycle; starts warming a replacement once a threshold is crossed."""
+        rss = chrome_rss_mb(driver) if config.RECYCLE_MAX_RSS_MB else None
+        with self.lock:
+            self.cycles += 1
+            self.rss = rss
+            if scrape_secs is not None:
+                if len(self.baseline) < config.RECYCLE_LATENCY_WINDOW: self.baseline.append(scrape_secs)
+                else: self.recent.append(scrape_secs)
+            if self.warming or self.spare or self.cycles < self.hold_until: return
+            reason = self._threshold_crossed()
+            if not reason: return
+            self.warming, self.reason = True, reason
+        log(f"    🔁 Browser recycle due ({reason}): starting a replacement, polling continues")
+        threading.Thread(target=self._launch, name="browser-warmup", daemon=True).start()
+
+    def _threshold_crossed(self):
+        if config.RECYCLE_MAX_CYCLES and self.cycles >= config.RECYCLE_MAX_CYCLES:
+            return f"{self.cycles} cycles"
+        if config.RECYCLE_MAX_RSS_MB and self.rss and self.rss >= config.RECYCLE_MAX_RSS_MB:
+            return f"Chrome using {self.rss:.0f} MB"
+        if config.RECYCLE_LATENCY_FACTOR and self.recent and len(self.recent) == self.recent.maxlen:
+            before, now = statistics.median(self.baseline), statistics.median(self.recent)
+            if now >= before * config.RECYCLE_LATENCY_FACTOR and now - before >= self.MIN_SLOWDOWN:
+                return f"list scrape {before:.1f}s -> {now:.1f}s"
+        return None
+
+    def _launch(self):
+        # No profile dir: the running browser holds it. The saved cookies usually skip SSO
+        try:
+            spare = initialize_driver(use_profile=False)
+        except Exception as e:
+            log(f"    ❌ Replacement browser failed to start, keeping the current one: {e}")
+            spare = None
+        with self.lock:
+            self.warming = False
+            if spare and self.closed:
+                _quit(spare[0])
+            elif spare:
+                self.spare = spare
+            else:
+                self.hold_until = self.cycles + self.RETRY_AFTER_CYCLES
+
+    def swap(self, driver):
+        """Between cycles: returns the warmed-up (driver, wait) and retires `driver`; None if no spare is ready."""
+        with self.lock:
+            spare, self.spare = self.spare, None
+            cycles = self.cycles
+        if spare is None: return None
+        threading.Thread(target=_quit, args=(driver,), name="browser-retire", daemon=True).start()
+        self.recycles += 1
+        metrics.incr("recycles")
+        log(f"    ♻️  Browser recycled ({self.reason}) after {cycles} cycles, old one closing in the background")
+        self.adopt()
+        return spare
+
+    def stats(self):
+        """Current browser health for /api/stats."""
+        with self.lock:
+            stats = {"cycles": self.cycles, "uptime_min": round((time.time() - self.started) / 60, 1),
+                     "recycles": self.recycles, "warming": self.warming}
+            if self.rss is not None: stats["rss_mb"] = round(self.rss)
+            if self.baseline: stats["scrape_baseline"] = round(statistics.median(self.baseline), 2)
+            if self.recent: stats["scrape_recent"] = round(statistics.median(self.recent), 2)
+        return stats
+
+    def close(self):
+        with self.lock:
+            self.closed = True
+            spare, self.spare = self.spare, None
+        if spare: _quit(spare[0])
+
+browser_supervisor = BrowserSupervisor()
@@ -0,0 +1,388 @@
+"""
+Mobile log viewer: static page, /api/logs, /api/stream (SSE), /api/stats, /api/queues and /metrics.
+"""
+import json
+import gzip
+import socket
+import hashlib
+import threading
+from urllib.parse import urlsplit, parse_qs
+from http.server import ThreadingHTTPServer, SimpleHTTPRequestHandler
+
+from . import config
+from .logs import log_manager
+from .metrics import metrics
+from .queues import queue_scheduler
+from .scheduler import poll_scheduler
+from .supervisor import browser_supervisor
+
+
+# ===================================================================
+# --- WEB SERVER FOR MOBILE ---
+# ===================================================================
+VIEWER_HTML = '''
+<!DOCTYPE html>
+<html>
+<head>
+    <meta charset="UTF-8">
+    <meta name="viewport" content="width=device-width, initial-scale=1.0">
+    <title>Live Script Monitor</title>
+    <style>
+        * { margin: 0; padding: 0; box-sizing: border-box; }
+        body {
+            font-family: 'Courier New', monospace;
+            background: #0a0e27;
+            color: #00ff88;
+            padding: 15px;
+            height: 100vh;
+            overflow: hidden;
+            display: flex;
+            flex-direction: column;
+        }
+        .header {
+            text-align: center;
+            margin-bottom: 15px;
+            font-weight: bold;
+            font-size: 16px;
+            color: #ff6b6b;
+            border-bottom: 2px solid #00ff88;
+            padding-bottom: 10px;
+        }
+        .status {
+            font-size: 12px;
+            color: #00ccff;
+            margin-bottom: 10px;
+            text-align: center;
+        }
+        .queues {
+            display: none;
+            font-size: 12px;
+            color: #00ccff;
+            margin-bottom: 10px;
+            text-align: center;
+        }
+        .queue { margin: 0 6px; white-space: nowrap; }
+        .queue b { color: #ffffff; }
+        .logs-container {
+            flex: 1;
+            overflow-y: auto;
+            border: 2px solid #00ff88;
+            background: #0d1117;
+            padding: 12px;
+            border-radius: 5px;
+            font-size: 12px;
+            line-height: 1.6;
+        }
+        .log-line {
+            margin: 3px 0;
+            white-space: pre-wrap;
+            word-break: break-word;
+        }
+        .error { color: #ff4444; }
+        .success { color: #44ff44; }
+        .warning { color: #ffaa00; }
+        .info { color: #4488ff; }
+        .action { color: #ff88ff; }
+
+        .logs-container::-webkit-scrollbar {
+            width: 8px;
+        }
+        .logs-container::-webkit-scrollbar-track {
+            background: #0d1117;
+        }
+        .logs-container::-webkit-scrollbar-thumb {
+            background: #00ff88;
+            border-radius: 4px;
+        }
+    </style>
+</head>
+<body>
+    <div class="header">🔴 LIVE SCRIPT MONITOR 🔴</div>
+    <div class="status">Status: <span id="status">Connecting...</span></div>
+    <div class="queues" id="queues"></div>
+    <div class="logs-container" id="logs">Loading logs...</div>
+
+    <script>
+        let lastSeq = 0;
+        const MAX_LINES = __MAX_LINES__;
+
+        function colorize(text) {
+            if (text.includes('❌') || text.includes('Error') || text.includes('Failed')) {
+                return `<span class="error">${escapeHtml(text)}</span>`;
+            }
+            if (text.includes('✅') || text.includes('Successful')) {
+                return `<span class="success">${escapeHtml(text)}</span>`;
+            }
+            if (text.includes('⚠️') || text.includes('Warning')) {
+                return `<span class="warning">${escapeHtml(text)}</span>`;
+            }
+            if (text.includes('🚨') || text.includes('ACTION REQUIRED')) {
+                return `<span class="action">${escapeHtml(text)}</span>`;
+            }
+            return `<span class="info">${escapeHtml(text)}</span>`;
+        }
+
+        function escapeHtml(text) {
+            const div = document.createElement('div');
+            div.textContent = text;
+            return div.innerHTML;
+        }
+
+        function setStatus(text, color) {
+            document.getElementById('status').innerText = text;
+            document.getElementById('status').style.color = color;
+        }
+
+        function applyLogs(data) {
+            const container = document.getElementById('logs');
+            if (data.reset) container.innerHTML = '';
+            lastSeq = data.seq;
+
+            const lines = data.logs.filter(l => l.trim());
+            if (lines.length) {
+                const frag = document.createDocumentFragment();
+                lines.forEach(line => {
+                    const div = document.createElement('div');
+                    div.className = 'log-line';
+                    div.innerHTML = colorize(line);
+                    frag.appendChild(div);
+                });
+                container.appendChild(frag);
+
+                // Keep the page as light as the server-side buffer
+                while (container.childElementCount > MAX_LINES) {
+                    container.removeChild(container.firstElementChild);
+                }
+
+                setTimeout(() => {
+                    container.scrollTop = container.scrollHeight;
+                }, 10);
+            }
+        }
+
+        // --- Fallback: poll /api/logs (old browsers, or when the stream is blocked) ---
+        let pollTimer = null;
+
+        function fetchLogs() {
+            fetch('/api/logs?since=' + lastSeq + '&t=' + Date.now())
+                .then(r => r.json())
+                .then(data => {
+                    setStatus('✅ Connected', '#00ff88');
+                    applyLogs(data);
+                })
+                .catch(err => setStatus('❌ Disconnected', '#ff4444'));
+        }
+
+        function startPolling() {
+            if (pollTimer) return;
+            fetchLogs();
+            pollTimer = setInterval(fetchLogs, 1000);
+        }
+
+        // --- Per-queue counts ---
+        function fetchQueues() {
+            fetch('/api/queues?t=' + Date.now())
+                .then(r => r.json())
+                .then(data => {
+                    const counted = data.queues.filter(q => q.count !== null);
+                    const el = document.getElementById('queues');
+                    el.style.display = counted.length ? 'block' : 'none';
+                    el.innerHTML = counted.map(q =>
+                        `<span class="queue${q.error ? ' error' : ''}">${escapeHtml(q.name)}: <b>${q.count}</b>` +
+                        (q.arrived ? ` <span class="success">+${q.arrived}</span>` : '') + '</span>').join(' ');
+                })
+                .catch(err => {});
+        }
+        fetchQueues();
+        setInterval(fetchQueues, 5000);
+
+        // --- Push: Server-Sent Events (reconnects resume via Last-Event-ID) ---
+        if (window.EventSource) {
+            const source = new EventSource('/api/stream');
+            source.onmessage = (e) => {
+                setStatus('✅ Live', '#00ff88');
+                applyLogs(JSON.parse(e.data));
+            };
+            source.onerror = () => {
+                if (source.readyState === EventSource.CLOSED) {
+                    startPolling();
+                } else {
+                    setStatus('❌ Reconnecting...', '#ff4444');
+                }
+            };
+        } else {
+            startPolling();
+        }
+    </script>
+</body>
+</html>
+'''
+VIEWER_PAGE = VIEWER_HTML.replace('__MAX_LINES__', str(config.LOG_BUFFER_SIZE)).encode('utf-8')
+VIEWER_PAGE_GZ = gzip.compress(VIEWER_PAGE, compresslevel=9)
+VIEWER_PAGE_ETAG = '"' + hashlib.sha1(VIEWER_PAGE).hexdigest()[:16] + '"'
+
+class MobileLogHandler(SimpleHTTPRequestHandler):
+    """HTTP handler to serve logs to mobile devices."""
+    protocol_version = "HTTP/1.1"      # Keep-alive for the polling fallback
+    timeout = config.WEB_KEEPALIVE_TIMEOUT    # Free the worker when a keep-alive connection goes idle
+    disable_nagle_algorithm = True     # Headers and body are separate writes; don't wait on delayed ACKs
+
+    def do_GET(self):
+        path = urlsplit(self.path).path
+        if path == '/' or path == '':
+            # Static page: encoded and gzipped once at import, revalidated with an ETag
+            if self.headers.get('If-None-Match') == VIEWER_PAGE_ETAG:
+                self.send_response(304)
+                self.send_header('ETag', VIEWER_PAGE_ETAG)
+                self.send_header('Content-Length', '0')
+                self.end_headers()
+                return
+            self.send_bytes(VIEWER_PAGE, 'text/html; charset=utf-8', gzipped=VIEWER_PAGE_GZ,
+                            headers={'Cache-Control': 'no-cache', 'ETag': VIEWER_PAGE_ETAG})
+
+        elif path == '/api/logs':
+            # Only lines newer than ?since=N (the last sequence number the viewer has)
+            try: since = int(parse_qs(urlsplit(self.path).query).get("since", ["0"])[0])
+            except ValueError: since = 0
+
+            last_seq, reset, lines = log_manager.get_since(since)
+            response = json.dumps({"seq": last_seq, "reset": reset, "logs": lines})
+            self.send_bytes(response.encode('utf-8'), 'application/json; charset=utf-8')
+        elif path == '/api/stream':
+            self.stream_logs()
+        elif path == '/api/stats':
+            response = json.dumps({"poll": poll_scheduler.stats(), "browser": browser_supervisor.stats(),
+                                   "queues": queue_scheduler.stats()})
+            self.send_bytes(response.encode('utf-8'), 'application/json; charset=utf-8')
+        elif path == '/api/queues':
+            response = json.dumps({"queues": queue_scheduler.stats()})
+            self.send_bytes(response.encode('utf-8'), 'application/json; charset=utf-8')
+        elif path == '/metrics':
+            self.send_metrics()
+        else:
+            self.send_bytes(b'', 'text/plain', status=404)
+
+    def send_bytes(self, body, content_type, gzipped=None, status=200, headers=None):
+        """Sends a complete response with Content-Length (keep-alive), gzipped when the client accepts it."""
+        encoding = None
+        if len(body) >= config.GZIP_MIN_BYTES and 'gzip' in self.headers.get('Accept-Encoding', ''):
+            body = gzipped if gzipped is not None else gzip.compress(body, compresslevel=5)
+            encoding = 'gzip'
+
+        self.send_response(status)
+        self.send_header('Content-type', content_type)
+        self.send_header('Content-Length', str(len(body)))
+        for key, val in (headers or {'Cache-Control': 'no-cache, no-store, must-revalidate'}).items():
+            self.send_header(key, val)
+        if encoding:
+            self.send_header('Content-Encoding', encoding)
+            self.send_header('Vary', 'Accept-Encoding')
+        self.end_headers()
+        self.wfile.write(body)
+
+    def send_metrics(self):
+        """JSON by default; Prometheus text for ?format=prometheus or a scraper's Accept header."""
+        fmt = parse_qs(urlsplit(self.path).query).get("format", [""])[0]
+        accept = self.headers.get('Accept', '')
+        poll = poll_scheduler.stats()
+        if fmt == "prometheus" or (not fmt and ("openmetrics" in accept or accept.startswith("text/plain"))):
+            gauges = {f"poll_{key}_seconds": poll[key] for key in ("interval", "avg_period", "avg_detection_latency")
+                      if key in poll}
+            browser = browser_supervisor.stats()
+            if "rss_mb" in browser: gauges["browser_rss_megabytes"] = browser["rss_mb"]
+            gauges.update(queue_scheduler.gauges())
+            self.send_bytes(metrics.prometheus(gauges).encode('utf-8'), 'text/plain; version=0.0.4; charset=utf-8')
+        else:
+            response = json.dumps(dict(metrics.snapshot(), poll=poll))
+            self.send_bytes(response.encode('utf-8'), 'application/json; charset=utf-8')
+
+    def stream_logs(self):
+        """Server-Sent Events: pushes new log lines as soon as LiveLogManager.add() runs."""
+        # Resume point: Last-Event-ID on browser reconnects, ?since=N otherwise
+        try:
+            since = int(self.headers.get('Last-Event-ID') or
+                        parse_qs(urlsplit(self.path).query).get("since", ["0"])[0])
+        except ValueError:
+            since = 0
+
+        self.send_response(200)
+        self.send_header('Content-type', 'text/event-stream; charset=utf-8')
+        self.send_header('Cache-Control', 'no-cache')
+        self.send_header('X-Accel-Buffering', 'no')
+        self.send_header('Connection', 'close')  # Open-ended body: no Content-Length
+        self.end_headers()
+        self.close_connection = True
+
+        try:
+            self.wfile.write(b"retry: 3000\n\n")
+            self.wfile.flush()
+            while True:
+                last_seq, reset, lines = log_manager.wait_since(since, config.SSE_HEARTBEAT)
+                if last_seq == since and not reset:
+                    self.wfile.write(b": ping\n\n")  # Heartbeat keeps proxies from closing idle streams
+                else:
+                    payload = json.dumps({"seq": last_seq, "reset": reset, "logs": lines})
+                    self.wfile.write(f"id: {last_seq}\ndata: {payload}\n\n".encode('utf-8'))
+                    since = last_seq
+                self.wfile.flush()
+        except OSError:
+            pass  # Viewer went away (or stalled past WEB_KEEPALIVE_TIMEOUT)
+
+    def log_message(self, format, *args):
+        pass  # Suppress server logs
+
+def get_local_ip():
+    """Get your laptop's local IP address"""
+    try:
+        s = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+        s.connect(("8.8.8.8", 80))
+        ip = s.getsockname()[0]
+        s.close()
+        return ip
+    except:
+        return "localhost"
+
+class BoundedThreadingHTTPServer(ThreadingHTTPServer):
+    """ThreadingHTTPServer with at most `max_workers` connections served at once; extra ones wait in the backlog."""
+    daemon_threads = True
+    request_queue_size = 64
+
+    def __init__(self, server_address, handler_class, max_workers=config.WEB_SERVER_MAX_WORKERS):
+        self.workers = threading.BoundedSemaphore(max_workers)
+        super().__init__(server_address, handler_class)
+
+    def process_request(self, request, client_address):
+        self.workers.acquire()
+        try:
+            super().process_request(request, client_address)
+        except:
+            self.workers.release()
+            raise
+
+    def process_request_thread(self, request, client_address):
+        try:
+            super().process_request_thread(request, client_address)
+        finally:
+            self.workers.release()
+
+def start_web_server():
+    """Start web server for mobile log viewing in background thread."""
+    def run_server():
+        # Bounded thread pool: a slow phone only ties up its own worker
+        server = BoundedThreadingHTTPServer(('0.0.0.0', config.WEB_SERVER_PORT), MobileLogHandler)
+        ip = get_local_ip()
+
+        # Also log to file for mobile viewer
+        log_manager.add("")
+        log_manager.add("=" * config.LINE_LENGTH)
+        log_manager.add("📱 WEB SERVER STARTED - MOBILE LOG VIEWER")
+        log_manager.add("=" * config.LINE_LENGTH)
+        log_manager.add(f"   👉 Local Network: http://{ip}:{config.WEB_SERVER_PORT}")
+        log_manager.add(f"   💡 Ensure mobile & laptop are on SAME WiFi")
+        log_manager.add("=" * config.LINE_LENGTH)
+        log_manager.add("")
+
+        server.serve_forever()
+
+    thread = threading.Thread(target=run_server, daemon=True)
+    thread.start()
@@ -0,0 +1,80 @@
+"""
+Console prompt read through PosixKeys on a real pseudo-terminal.
+
+Each case forks a child on a pty (cbreak mode, select() waits), types keys
+into the master side once the countdown prompt is drawn, and reads back
+what get_input_with_timeout returned.
+
+    python -m unittest discover tests
+"""
+import os
+import sys
+import tempfile
+import time
+import unittest
+
+try:
+    import pty
+except ImportError:  # Windows
+    pty = None
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def prompt_in_pty(keys, timeout):
+    """Runs get_input_with_timeout in a child on a pty, types keys after the prompt; returns its result."""
+    result_r, result_w = os.pipe()
+    pid, master = pty.fork()
+    if pid == 0:
+        code = 1
+        try:
+            os.close(result_r)
+            # The pty is on fds 0-2; rebind in case a test runner swapped sys.stdin/stdout for capture
+            sys.stdin, sys.stdout = open(0, "r", closefd=False), open(1, "w", closefd=False)
+            sys.path.insert(0, ROOT)
+            from snow_monitor.logs import log_manager
+            tmp = tempfile.mkdtemp(prefix="snow_test_")
+            log_manager.update_paths(os.path.join(tmp, "Log.txt"), os.path.join(tmp, "Live.txt"))
+            from snow_monitor.console import get_input_with_timeout
+            os.write(result_w, get_input_with_timeout("Choice?", timeout=timeout).encode())
+            code = 0
+        finally:
+            os._exit(code)
+
+    os.close(result_w)
+    output = b""
+    typed = False
+    deadline = time.monotonic() + timeout + 10
+    while time.monotonic() < deadline:
+        try: data = os.read(master, 1024)
+        except OSError: break  # Child exited, pty closed
+        if not data: break
+        output += data
+        if not typed and b"Clock:" in output:
+            os.write(master, keys)
+            typed = True
+    os.waitpid(pid, 0)
+    os.close(master)
+    with os.fdopen(result_r, "rb") as f:
+        return f.read().decode()
+
+
+@unittest.skipIf(pty is None, "needs a POSIX pty")
+class PosixKeysTest(unittest.TestCase):
+    def test_digits_and_enter(self):
+        self.assertEqual(prompt_in_pty(b"12\r", timeout=10), "12")
+
+    def test_delete_edits_input(self):
+        self.assertEqual(prompt_in_pty(b"12\x7f3\r", timeout=10), "13")
+
+    def test_backspace_edits_input(self):
+        self.assertEqual(prompt_in_pty(b"45\b\b7\n", timeout=10), "7")
+
+    def test_timeout_skips(self):
+        start = time.monotonic()
+        self.assertEqual(prompt_in_pty(b"", timeout=2), "S")
+        self.assertGreaterEqual(time.monotonic() - start, 1.5)
+
+
+if __name__ == "__main__":
+    unittest.main()
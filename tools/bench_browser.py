@@ -0,0 +1,140 @@
+"""
+Benchmark: "full" vs "lean" BROWSER_PROFILE over a long simulated run.
+
+Starts snow_stub.py with static assets (stylesheet, web font, images) and
+ticket churn, logs one Chrome in with each profile, then runs both side by
+side for --cycles polling cycles: the incident list scrape in Tab 1 and a
+ticket form load in Tab 2, the same steps and waits as the monitor. Chrome
+RSS is the whole process tree under chromedriver (needs `pip install
+psutil`; the column shows n/a without it).
+
+    python tools/bench_browser.py --cycles 600 --interval 1 --report-every 50
+"""
+import argparse
+import contextlib
+import importlib.util
+import io
+import os
+import statistics
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from snow_monitor import config  # noqa: E402
+from snow_monitor import selenium_api as sel  # noqa: E402
+from snow_monitor.browser import initialize_driver  # noqa: E402
+from snow_monitor.logs import log_manager  # noqa: E402
+from snow_monitor.scraper import scrape_l1_incidents_detailed  # noqa: E402
+from snow_monitor.supervisor import chrome_rss_mb  # noqa: E402
+from snow_stub import SnowStub, make_incidents  # noqa: E402
+
+PROFILES = ["full", "lean"]
+
+
+def load_form(driver, wait, url):
+    """Opens a ticket form in Tab 2 like process_ticket_in_tab2 does."""
+    driver.switch_to.window(driver.window_handles[1])
+    driver.get(url)
+    try: wait.until(sel.EC.frame_to_be_available_and_switch_to_it((sel.By.ID, "gsft_main")))
+    except: pass
+    wait.until(sel.EC.presence_of_element_located((sel.By.ID, "sys_readonly.incident.number")))
+    driver.switch_to.default_content()
+
+
+def run_cycle(driver, wait, stub, number):
+    """One polling cycle. Returns (list ms, form ms, assets fetched)."""
+    hits = stub.asset_hits
+    start = time.perf_counter()
+    scrape_l1_incidents_detailed(driver, wait)
+    list_ms = (time.perf_counter() - start) * 1000
+    start = time.perf_counter()
+    load_form(driver, wait, stub.incident_url(number))
+    form_ms = (time.perf_counter() - start) * 1000
+    return list_ms, form_ms, stub.asset_hits - hits
+
+
+def fmt(value, spec=">7.0f"):
+    return f"{value:{spec}}" if value is not None else f"{'n/a':>7}"
+
+
+def median_or_none(values):
+    values = [v for v in values if v is not None]
+    return statistics.median(values) if values else None
+
+
+def p95(values):
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(0.95 * len(ordered)))]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--cycles", type=int, default=300)
+    parser.add_argument("--interval", type=float, default=1.0, help="Seconds between cycles")
+    parser.add_argument("--report-every", type=int, default=25, help="Cycles per table row")
+    parser.add_argument("--rows", type=int, default=50, help="Tickets in the queue at start")
+    parser.add_argument("--churn", type=float, default=30.0, help="Tickets arriving and resolved per minute")
+    parser.add_argument("--latency", type=float, default=0.02, help="Stub response delay in seconds")
+    args = parser.parse_args()
+
+    tmp = tempfile.mkdtemp(prefix="snow_bench_")
+    log_manager.update_paths(os.path.join(tmp, "Log.txt"), os.path.join(tmp, "Live.txt"))
+    stub = SnowStub(make_incidents(args.rows), latency=args.latency, login_delays_ms=(50, 50, 50),
+                    arrivals_per_min=args.churn, resolves_per_min=args.churn, assets=True).start()
+    config.BASE_URL = stub.base_url
+    config.LOGIN_URL = stub.login_url
+    config.URL_NEW_STATE_LIST = stub.list_url
+    config.USER, config.PASSWORD = "bench", "bench"
+    config.PERSIST_SESSION = False
+    config.HEADLESS = True
+
+    drivers = {}
+    results = {p: [] for p in PROFILES}  # profile -> [(list ms, form ms, assets, rss MB)]
+    try:
+        with contextlib.redirect_stdout(io.StringIO()):
+            for profile in PROFILES:
+                config.BROWSER_PROFILE = profile
+                drivers[profile] = initialize_driver(use_profile=False)
+
+        print(f"{args.cycles} cycles, {args.rows} tickets + {args.churn:g}/min churn, stub latency "
+              f"{args.latency * 1000:.0f} ms" + ("" if importlib.util.find_spec("psutil") else "  (pip install psutil for RSS)"))
+        print(f"{'cycles':>9} | {'list load (ms)':^17} | {'form load (ms)':^17} | {'Chrome RSS (MB)':^17}")
+        print(f"{'':>9} | " + " | ".join(f"{'full':>7}   {'lean':>7}" for _ in range(3)))
+        print("-" * 70)
+        for cycle in range(1, args.cycles + 1):
+            queue = stub.new_incidents()
+            number = queue[cycle % len(queue)]["number"] if queue else stub.incidents[0]["number"]
+            for profile in PROFILES:  # Same cycle, same queue, one after the other
+                driver, wait = drivers[profile]
+                results[profile].append(run_cycle(driver, wait, stub, number) + (chrome_rss_mb(driver),))
+
+            if cycle % args.report_every == 0 or cycle == args.cycles:
+                first = (cycle - 1) // args.report_every * args.report_every
+                cols = []
+                for idx in (0, 1, 3):  # list ms, form ms, RSS
+                    values = {p: median_or_none([r[idx] for r in results[p][first:cycle]]) for p in PROFILES}
+                    cols.append(f"{fmt(values['full'])}   {fmt(values['lean'])}")
+                print(f"{first + 1:>4}-{cycle:<4} | " + " | ".join(cols))
+            time.sleep(args.interval)
+    finally:
+        for driver, _ in drivers.values():
+            try: driver.quit()
+            except: pass
+        stub.stop()
+
+    print()
+    for profile in PROFILES:
+        rows = results[profile]
+        if not rows: continue
+        lists, forms = [r[0] for r in rows], [r[1] for r in rows]
+        rss = [r[3] for r in rows if r[3] is not None]
+        growth = f", RSS {rss[0]:.0f} -> {rss[-1]:.0f} MB (peak {max(rss):.0f})" if rss else ""
+        print(f"  {profile:<5} list p50 {statistics.median(lists):5.0f} ms p95 {p95(lists):5.0f} ms | "
+              f"form p50 {statistics.median(forms):5.0f} ms p95 {p95(forms):5.0f} ms | "
+              f"assets fetched {sum(r[2] for r in rows)}{growth}")
+
+
+if __name__ == "__main__":
+    main()
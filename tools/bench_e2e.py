@@ -0,0 +1,179 @@
+"""
+End-to-end benchmark: the monitor's own functions against the simulator.
+
+Starts snow_stub.py with a New-state queue and optional churn, logs in, then
+runs the monitor's own cycle (main.check_browser + main.run_cycle: queue
+scheduler, watermarks, operator desk, --workers browser pool, browser
+supervisor, adaptive poll scheduling) for --duration seconds. A scripted
+operator answers every prompt after --think seconds: the learned pattern if
+one is suggested, otherwise WIP.
+
+Reports tickets updated per minute, detection latency (ticket created ->
+first returned by a poll), update latency (created -> saved out of New)
+and the monitor's own /metrics timers.
+
+    python tools/bench_e2e.py --rows 20 --arrivals 6 --duration 120 --latency 0.05
+"""
+import argparse
+import contextlib
+import io
+import os
+import statistics
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from snow_monitor import config, processor  # noqa: E402
+from snow_monitor.logs import log_manager  # noqa: E402
+from snow_monitor.main import check_browser, run_cycle, start_browser  # noqa: E402
+from snow_monitor.memory import L2Store, WatermarkStore  # noqa: E402
+from snow_monitor.metrics import metrics  # noqa: E402
+from snow_monitor.processor import BrowserWorkerPool, OperatorDesk  # noqa: E402
+from snow_monitor.queues import queue_scheduler  # noqa: E402
+from snow_monitor.scheduler import poll_scheduler  # noqa: E402
+from snow_monitor.scraper import make_ticket_source  # noqa: E402
+from snow_monitor.supervisor import browser_supervisor  # noqa: E402
+from snow_stub import SnowStub, make_incidents  # noqa: E402
+
+REPORT_TIMERS = ["cycle", "scrape", "inpage_fetch", "rest_fetch", "process_ticket", "open_and_update", "update_logic",
+                 "update.save", "process.page_load", "initialize_driver"]
+
+
+def scripted_operator(think):
+    """Stands in for ask_operator: answers after `think` seconds."""
+    def ask(ticket, shift_users, needs_assignee, suggestion=None):
+        time.sleep(think)
+        value, name = (suggestion['value'], suggestion['name']) if suggestion else ('4', 'WIP')
+        return {'value': value, 'name': name, 'assignee': shift_users[0] if needs_assignee else None}
+    return metrics.timed("operator_prompt")(ask)
+
+
+def percentiles(values):
+    if not values: return "n/a"
+    ordered = sorted(values)
+    p95 = ordered[min(len(ordered) - 1, int(0.95 * len(ordered)))]
+    return f"p50 {statistics.median(ordered):6.2f}s | p95 {p95:6.2f}s | max {ordered[-1]:6.2f}s  (n={len(ordered)})"
+
+
+class FirstSeen:
+    """Wraps the ticket source and notes when each ticket was first returned by a poll."""
+    def __init__(self, source):
+        self.source = source
+        self.name = source.name
+        self.first_seen = {}
+
+    def fetch(self, driver, wait, list_url=None):
+        tickets = self.source.fetch(driver, wait, list_url)
+        now = time.time()
+        for t in tickets or []: self.first_seen.setdefault(t['ticket'], now)
+        return tickets
+
+    def __getattr__(self, name):
+        return getattr(self.source, name)
+
+
+def run_monitor(stub, args, tmp):
+    """Runs the monitor's own cycle (main.run_cycle) until the deadline. Returns {ticket: epoch first seen}."""
+    shift_users = ["Default User"]
+    l2_memory = L2Store(os.path.join(tmp, "L2Memory.db"))
+    for inc in stub.incidents[:int(len(stub.incidents) * args.known)]:
+        l2_memory.upsert(inc["number"], "4", "WIP", inc["short_description"])
+
+    ticket_source = FirstSeen(make_ticket_source())
+    driver, wait = start_browser(ticket_source, use_profile=False)
+    watermarks = WatermarkStore(os.path.join(tmp, "Watermarks.json"))
+    operator_desk = OperatorDesk(shift_users) if config.DECOUPLED_PROMPTS else None
+    pool = BrowserWorkerPool(args.workers).start() if args.workers > 0 else None
+    queue_scheduler.load()
+
+    deadline = time.time() + args.duration
+    try:
+        while time.time() < deadline:
+            session = check_browser(driver, wait, ticket_source)
+            driver, wait = session or start_browser(ticket_source, use_profile=False)
+            pause = run_cycle(driver, wait, ticket_source, l2_memory, shift_users, watermarks, operator_desk, pool)
+            time.sleep(min(pause, max(0.0, deadline - time.time())))
+    finally:
+        browser_supervisor.close()
+        if pool: pool.close()
+        ticket_source.close()
+        l2_memory.close()
+        driver.quit()
+    return ticket_source.first_seen
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--rows", type=int, default=20, help="Tickets in the queue at start")
+    parser.add_argument("--arrivals", type=float, default=6.0, help="New tickets per minute")
+    parser.add_argument("--resolves", type=float, default=0.0, help="Tickets resolved by others per minute")
+    parser.add_argument("--latency", type=float, default=0.05, help="Stub response delay in seconds")
+    parser.add_argument("--save-errors", type=float, default=0.0, help="Fraction of form saves that fail")
+    parser.add_argument("--duration", type=float, default=120.0, help="Seconds of polling")
+    parser.add_argument("--poll", type=float, default=config.POLL_INTERVAL, help="Base poll interval")
+    parser.add_argument("--think", type=float, default=2.0, help="Scripted operator answer time in seconds")
+    parser.add_argument("--known", type=float, default=0.25, help="Fraction of the start queue already in L2")
+    parser.add_argument("--source", choices=["browser", "inpage", "rest"], default=config.TICKET_SOURCE)
+    parser.add_argument("--patterns", choices=["off", "suggest", "auto"], default=config.L2_PATTERN_MODE)
+    parser.add_argument("--sequential-prompts", action="store_true", help="DECOUPLED_PROMPTS = False")
+    parser.add_argument("--workers", type=int, default=config.WORKER_POOL_SIZE, help="WORKER_POOL_SIZE")
+    parser.add_argument("--verbose", action="store_true", help="Show the monitor's console output")
+    args = parser.parse_args()
+
+    tmp = tempfile.mkdtemp(prefix="snow_bench_")
+    log_manager.update_paths(os.path.join(tmp, "Log.txt"), os.path.join(tmp, "Live.txt"))
+    stub = SnowStub(make_incidents(args.rows), latency=args.latency, login_delays_ms=(50, 50, 50),
+                    arrivals_per_min=args.arrivals, resolves_per_min=args.resolves,
+                    save_error_rate=args.save_errors).start()
+
+    config.BASE_URL = stub.base_url
+    config.LOGIN_URL = stub.login_url
+    config.URL_NEW_STATE_LIST = stub.list_url
+    config.USER, config.PASSWORD = "bench", "bench"
+    config.TICKET_SOURCE, config.REST_AUTH = args.source, "basic"
+    config.L2_PATTERN_MODE = args.patterns
+    config.DECOUPLED_PROMPTS = not args.sequential_prompts
+    config.PERSIST_SESSION = False
+    poll_scheduler.base = args.poll
+    processor.ask_operator = scripted_operator(args.think)
+    processor.play_notification = lambda: None
+
+    start = time.time()
+    output = contextlib.nullcontext() if args.verbose else contextlib.redirect_stdout(io.StringIO())
+    try:
+        with output:
+            first_seen = run_monitor(stub, args, tmp)
+    finally:
+        stub.stop()
+    elapsed = time.time() - start
+
+    # Latencies only for tickets that arrived after login, so startup time doesn't count as detection delay
+    login_secs = metrics.snapshot()["timings"].get("initialize_driver", {}).get("sum", 0.0)
+    monitoring_since = start + login_secs
+    arrivals = [n for n, created in stub.created.items() if created >= monitoring_since]
+    detection = [first_seen[n] - stub.created[n] for n in arrivals if n in first_seen]
+    update = [stub.saved[n][0] - stub.created[n] for n in arrivals if n in stub.saved]
+    monitoring_minutes = max(1e-9, (elapsed - login_secs) / 60)
+
+    print(f"source {args.source}, {args.rows} queued + {args.arrivals}/min arriving, stub latency "
+          f"{args.latency * 1000:.0f} ms, operator {args.think:.1f}s, patterns {args.patterns}")
+    print(f"  updated:           {len(stub.saved)} tickets in {elapsed - login_secs:.0f}s "
+          f"({len(stub.saved) / monitoring_minutes:.1f} tickets/min), {len(stub.new_incidents())} still New")
+    print(f"  detection latency: {percentiles(detection)}")
+    print(f"  update latency:    {percentiles(update)}")
+    print()
+    print(f"  {'timer':<20} {'count':>6} {'p50 (ms)':>10} {'p90 (ms)':>10} {'max (ms)':>10}")
+    timings = metrics.snapshot()["timings"]
+    for name in REPORT_TIMERS:
+        entry = timings.get(name)
+        if not entry or "p50" not in entry: continue
+        print(f"  {name:<20} {entry['count']:>6} {entry['p50'] * 1000:>10.0f} {entry['p90'] * 1000:>10.0f} "
+              f"{entry['max'] * 1000:>10.0f}")
+    counters = metrics.snapshot()["counters"]
+    print("  counters: " + ", ".join(f"{k} {v}" for k, v in counters.items()))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,52 @@
+"""
+Benchmark: import time of the snow_monitor modules, each in a fresh interpreter.
+
+Selenium and playsound are loaded on first use, so the viewer and the
+tools don't pay for them; the last row shows what that first use costs.
+
+    python tools/bench_import.py --runs 5
+"""
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+TARGETS = [
+    ("snow_monitor (package only)", "import snow_monitor"),
+    ("snow_monitor.memory", "import snow_monitor.memory"),
+    ("snow_monitor.web (viewer)", "import snow_monitor.web"),
+    ("snow_monitor.main (everything)", "import snow_monitor.main"),
+    ("+ Selenium on first use", "import snow_monitor.main; from snow_monitor import selenium_api as sel; "
+                                "sel.WebDriverWait; sel.EC; sel.webdriver"),
+]
+
+SNIPPET = ("import sys, time; sys.path.insert(0, {root!r}); t = time.perf_counter(); {stmt}; "
+           "print((time.perf_counter() - t) * 1000); "
+           "print(int(any(m.startswith('selenium') for m in sys.modules)))")
+
+
+def time_import(stmt):
+    out = subprocess.run([sys.executable, "-c", SNIPPET.format(root=ROOT, stmt=stmt)],
+                         capture_output=True, text=True, check=True).stdout.split()
+    return float(out[0]), out[1] == "1"
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--runs", type=int, default=5)
+    args = parser.parse_args()
+
+    print(f"{'import':<32} | {'median (ms)':>11} | {'max (ms)':>9} | selenium loaded")
+    print("-" * 76)
+    for label, stmt in TARGETS:
+        results = [time_import(stmt) for _ in range(args.runs)]
+        timings = [ms for ms, _ in results]
+        print(f"{label:<32} | {statistics.median(timings):>11.1f} | {max(timings):>9.1f} | "
+              f"{'yes' if results[-1][1] else 'no'}")
+
+
+if __name__ == "__main__":
+    main()
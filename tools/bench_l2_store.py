@@ -0,0 +1,79 @@
+"""
+Benchmark: L2 memory startup and lookup, legacy Reopen.txt parse vs the
+SQLite L2Store, at growing file sizes.
+
+    python tools/bench_l2_store.py --sizes 1000 10000 100000
+"""
+import argparse
+import os
+import random
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from snow_monitor.logs import log_manager  # noqa: E402
+from snow_monitor.memory import L2Store  # noqa: E402
+
+STATES = [("Pending Vendor", "21"), ("Pending Tasks", "22"), ("WIP", "4")]
+
+
+def legacy_load(path):
+    """The previous load_l2_from_file: parse the whole file into a dict."""
+    memory = {}
+    with open(path, "r", encoding="utf-8") as f:
+        for line in f:
+            parts = line.strip().split('|')
+            if len(parts) >= 3:
+                memory[parts[0].strip()] = {'value': parts[2].strip(), 'name': parts[1].strip()}
+    return memory
+
+
+def write_reopen_file(path, count):
+    rnd = random.Random(count)
+    with open(path, "w", encoding="utf-8") as f:
+        for i in range(count):
+            name, val = rnd.choice(STATES)
+            f.write(f"INC{i:08d}|{name}|{val}|Monitor critical Alert - SITE{i % 97:02d}-RTR01 CPU Overload [Index:{i}]\n")
+
+
+def timed(fn):
+    start = time.perf_counter()
+    result = fn()
+    return result, (time.perf_counter() - start) * 1000
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1000, 10000, 100000])
+    parser.add_argument("--lookups", type=int, default=10000)
+    args = parser.parse_args()
+
+    tmp = tempfile.mkdtemp(prefix="snow_bench_")
+    log_manager.update_paths(os.path.join(tmp, "Log.txt"), os.path.join(tmp, "Live.txt"))
+
+    print(f"{'entries':>8} | {'file MB':>7} | {'legacy load':>11} | {'migration':>9} | "
+          f"{'store open':>10} | {'lookup':>8}")
+    print("-" * 72)
+    for count in args.sizes:
+        reopen = os.path.join(tmp, f"Reopen_{count}.txt")
+        db = os.path.join(tmp, f"L2_{count}.db")
+        write_reopen_file(reopen, count)
+
+        _, legacy_ms = timed(lambda: legacy_load(reopen))
+        store, migrate_ms = timed(lambda: L2Store(db, legacy_path=reopen, expiry_days=0))
+        assert len(store) == count and store.imported == count
+        store.close()
+        store, open_ms = timed(lambda: L2Store(db, legacy_path=reopen, expiry_days=0))
+
+        keys = [f"INC{random.randrange(count):08d}" for _ in range(args.lookups)]
+        _, lookup_ms = timed(lambda: [k in store and store[k] for k in keys])
+        store.close()
+
+        print(f"{count:>8} | {os.path.getsize(reopen) / 1e6:>7.1f} | {legacy_ms:>8.1f} ms | {migrate_ms:>6.1f} ms | "
+              f"{open_ms:>7.1f} ms | {lookup_ms * 1000 / args.lookups:>5.1f} us")
+
+
+if __name__ == "__main__":
+    main()
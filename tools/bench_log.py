@@ -0,0 +1,75 @@
+"""
+Microbenchmark: log() calls per second, per-line open/append/close vs the
+batched background writer in LiveLogManager.
+
+    python tools/bench_log.py --lines 20000 [--dir D:\\OneDrive\\Snow]
+"""
+import argparse
+import contextlib
+import os
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from snow_monitor import config  # noqa: E402
+from snow_monitor.logs import LiveLogManager, log, log_manager  # noqa: E402
+
+
+def legacy_add(log_file, live_file, message):
+    """The previous LiveLogManager.add file path: open/append/close both files per line."""
+    full_line = f"{time.strftime('[%Y-%m-%d %H:%M:%S]')} {message}"
+    for path in (log_file, live_file):
+        log_dir = os.path.dirname(path)
+        if log_dir and not os.path.exists(log_dir): os.makedirs(log_dir)
+        with open(path, "a", encoding="utf-8") as f:
+            f.write(full_line + "\n")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--lines", type=int, default=20000)
+    parser.add_argument("--dir", default=None, help="Folder to write into (e.g. a OneDrive path)")
+    args = parser.parse_args()
+
+    base = args.dir or tempfile.mkdtemp(prefix="snow_bench_")
+    message = "    🎯 Active Tickets Found: 12 - 20:00:00"
+
+    legacy_dir = os.path.join(base, "legacy")
+    start = time.perf_counter()
+    for _ in range(args.lines):
+        legacy_add(os.path.join(legacy_dir, "Log.txt"), os.path.join(legacy_dir, "Live.txt"), message)
+    legacy_rate = args.lines / (time.perf_counter() - start)
+
+    batched_dir = os.path.join(base, "batched")
+    manager = LiveLogManager(os.path.join(batched_dir, "Log.txt"),
+                                     os.path.join(batched_dir, "Live.txt"), config.LOG_BUFFER_SIZE)
+    start = time.perf_counter()
+    for _ in range(args.lines):
+        manager.add(message)
+    enqueue_time = time.perf_counter() - start
+    manager.close()
+    drain_time = time.perf_counter() - start
+
+    with open(os.path.join(batched_dir, "Log.txt"), encoding="utf-8") as f:
+        written = sum(1 for _ in f)
+    assert written == args.lines, f"writer lost lines: {written}/{args.lines}"
+
+    # log() as the monitor calls it (console output silenced)
+    log_manager.update_paths(os.path.join(base, "log", "Log.txt"), os.path.join(base, "log", "Live.txt"))
+    with open(os.devnull, "w", encoding="utf-8") as devnull, contextlib.redirect_stdout(devnull):
+        start = time.perf_counter()
+        for _ in range(args.lines):
+            log(message)
+        log_rate = args.lines / (time.perf_counter() - start)
+
+    print(f"{args.lines} lines into {base}")
+    print(f"legacy open/append/close : {legacy_rate:>10,.0f} lines/s")
+    print(f"batched add() (enqueue)  : {args.lines / enqueue_time:>10,.0f} lines/s")
+    print(f"batched incl. final fsync: {args.lines / drain_time:>10,.0f} lines/s")
+    print(f"log() incl. console print: {log_rate:>10,.0f} lines/s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,52 @@
+"""
+Times initialize_driver (Chrome launch + SSO login) against the mock login
+page in snow_stub.py. The per-step breakdown is printed by the monitor's
+own startup log line.
+
+    python tools/bench_login.py --runs 3 --form-delay 300
+"""
+import argparse
+import os
+import statistics
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from snow_monitor import config  # noqa: E402
+from snow_monitor.browser import initialize_driver  # noqa: E402
+from snow_monitor.logs import log_manager  # noqa: E402
+from snow_stub import SnowStub, make_incidents  # noqa: E402
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--runs", type=int, default=3)
+    parser.add_argument("--popup-fade", type=int, default=300, help="ms for the cookie popup to fade out")
+    parser.add_argument("--form-delay", type=int, default=300, help="ms before the corporate form shows")
+    parser.add_argument("--login-delay", type=int, default=500, help="ms before the dashboard redirect")
+    args = parser.parse_args()
+
+    tmp = tempfile.mkdtemp(prefix="snow_bench_")
+    log_manager.update_paths(os.path.join(tmp, "Log.txt"), os.path.join(tmp, "Live.txt"))
+    stub = SnowStub(make_incidents(10),
+                    login_delays_ms=(args.popup_fade, args.form_delay, args.login_delay)).start()
+    config.LOGIN_URL = stub.login_url
+    config.USER, config.PASSWORD = "bench", "bench"
+    config.PERSIST_SESSION = False  # Every run goes through SSO instead of reusing run 1's cookies
+
+    totals = []
+    for _ in range(args.runs):
+        start = time.perf_counter()
+        driver, _wait = initialize_driver()
+        totals.append(time.perf_counter() - start)
+        driver.quit()
+    stub.stop()
+
+    print(f"initialize_driver over {args.runs} runs: median {statistics.median(totals):.2f}s, "
+          f"min {min(totals):.2f}s, max {max(totals):.2f}s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,139 @@
+"""
+Benchmark: monitoring many queues from one process.
+
+Starts the stub with incidents and RITMs spread over assignment groups and
+runs --queues queues (processing incident queues plus count-only RITM
+queues) through QueueScheduler for --cycles cycles. Compares one shared
+REST source (one login, one keep-alive pool) with a separate source and
+connection per queue, the way separate copies of the script would poll.
+With --browser the in-page source is timed too, every queue served from
+one Chrome tab.
+
+    python tools/bench_queues.py --queues 12 --cycles 20 --latency 0.02 [--browser]
+"""
+import argparse
+import contextlib
+import io
+import os
+import statistics
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from snow_monitor import config  # noqa: E402
+from snow_monitor.logs import log_manager  # noqa: E402
+from snow_monitor.queues import QueueScheduler  # noqa: E402
+from snow_monitor.scraper import InPageTicketSource, RestTicketSource  # noqa: E402
+from snow_stub import GROUPS, SnowStub, make_incidents  # noqa: E402
+
+
+def queue_specs(count):
+    """Alternates processing incident queues and count-only RITM queues over the stub's groups."""
+    specs = []
+    for i in range(count):
+        group = GROUPS[i // 2 % len(GROUPS)]
+        if i % 2 == 0:
+            specs.append({"name": f"INC {group} #{i}", "query": f"state=1^assignment_group.name={group}",
+                          "priority": 1})
+        else:
+            specs.append({"name": f"RITM {group} #{i}", "table": "sc_req_item",
+                          "query": f"active=true^assignment_group.name={group}", "priority": 3})
+    return specs
+
+
+class PerQueueSources:
+    """A separate REST source (own auth, own connection) per queue, like one script per queue."""
+    name = "rest"
+
+    def __init__(self, base_url):
+        self.base_url = base_url
+        self.sources = {}
+        self.connections = 0
+
+    def _source(self, list_url):
+        if list_url not in self.sources:
+            self.sources[list_url] = RestTicketSource(self.base_url, "", "bench", "bench")
+        return self.sources[list_url]
+
+    def fetch(self, driver, wait, list_url=None):
+        return self._source(list_url).fetch(driver, wait, list_url)
+
+    def keys(self, driver, wait, list_url):
+        return self._source(list_url).keys(driver, wait, list_url)
+
+    def close(self):
+        self.connections = sum(len(src._conns) for src in self.sources.values())
+        for src in self.sources.values(): src.close()
+
+
+def time_cycles(source, specs, cycles, driver=None, wait=None):
+    scheduler = QueueScheduler()
+    with contextlib.redirect_stdout(io.StringIO()):
+        scheduler.load(specs)
+        scheduler.fetch(source, driver, wait)  # First cycle opens connections / loads the page
+        timings = []
+        for _ in range(cycles):
+            start = time.perf_counter()
+            scheduler.fetch(source, driver, wait)
+            timings.append((time.perf_counter() - start) * 1000)
+    return statistics.median(timings), max(timings), scheduler
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--queues", type=int, default=12)
+    parser.add_argument("--cycles", type=int, default=20)
+    parser.add_argument("--rows", type=int, default=200, help="Incidents in the stub")
+    parser.add_argument("--ritms", type=int, default=100, help="Requested items in the stub")
+    parser.add_argument("--latency", type=float, default=0.02, help="Stub response delay in seconds")
+    parser.add_argument("--browser", action="store_true", help="Also time the in-page source in one Chrome")
+    args = parser.parse_args()
+
+    tmp = tempfile.mkdtemp(prefix="snow_bench_")
+    log_manager.update_paths(os.path.join(tmp, "Log.txt"), os.path.join(tmp, "Live.txt"))
+    stub = SnowStub(make_incidents(args.rows), latency=args.latency, login_delays_ms=(50, 50, 50),
+                    ritms=args.ritms).start()
+    config.BASE_URL = stub.base_url
+    config.LOGIN_URL = stub.login_url
+    config.URL_NEW_STATE_LIST = stub.list_url
+    config.USER, config.PASSWORD = "bench", "bench"
+    config.PERSIST_SESSION = False
+    specs = queue_specs(args.queues)
+
+    results = {}
+    shared = RestTicketSource(stub.base_url, "", "bench", "bench")
+    median, worst, scheduler = time_cycles(shared, specs, args.cycles)
+    results["rest, one shared pool"] = (median, worst, len(shared._conns))
+    shared.close()
+
+    separate = PerQueueSources(stub.base_url)
+    median, worst, _ = time_cycles(separate, specs, args.cycles)
+    separate.close()
+    results["rest, source per queue"] = (median, worst, separate.connections)
+
+    if args.browser:
+        from snow_monitor.browser import initialize_driver
+        with contextlib.redirect_stdout(io.StringIO()):
+            driver, wait = initialize_driver(use_profile=False)
+        try:
+            median, worst, _ = time_cycles(InPageTicketSource(), specs, args.cycles, driver, wait)
+            results["inpage, one Chrome tab"] = (median, worst, "browser")
+        finally:
+            driver.quit()
+    stub.stop()
+
+    processed = sum(1 for s in specs if s.get("table", "incident") == "incident")
+    print(f"{args.queues} queues ({processed} processing, {args.queues - processed} count-only), "
+          f"{args.cycles} cycles, stub latency {args.latency * 1000:.0f} ms")
+    print(f"{'source':<24} | {'cycle p50 (ms)':>14} | {'max (ms)':>9} | connections")
+    print("-" * 66)
+    for name, (median, worst, conns) in results.items():
+        print(f"{name:<24} | {median:>14.1f} | {worst:>9.1f} | {conns}")
+    print()
+    print("  " + " | ".join(f"{q['name']} {q['count']}" for q in scheduler.stats()))
+
+
+if __name__ == "__main__":
+    main()
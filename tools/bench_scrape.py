@@ -0,0 +1,70 @@
+"""
+Benchmark: per-cell vs bulk (single execute_script) incident list extraction.
+
+Renders static copies of the incident list at several sizes and times
+`scrape_l1_incidents_detailed` with BULK_SCRAPE off and on.
+
+    python tools/bench_scrape.py --rows 10 100 1000 --cycles 5
+"""
+import argparse
+import os
+import statistics
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from snow_monitor import config  # noqa: E402
+from snow_monitor.logs import log_manager  # noqa: E402
+from snow_monitor.scraper import scrape_l1_incidents_detailed  # noqa: E402
+from snow_stub import make_incidents, render_incident_list  # noqa: E402
+from selenium import webdriver  # noqa: E402
+from selenium.webdriver.chrome.options import Options  # noqa: E402
+from selenium.webdriver.support.ui import WebDriverWait  # noqa: E402
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--rows", type=int, nargs="+", default=[10, 100, 1000])
+    parser.add_argument("--cycles", type=int, default=5)
+    args = parser.parse_args()
+
+    tmp = tempfile.mkdtemp(prefix="snow_bench_")
+    log_manager.update_paths(os.path.join(tmp, "Log.txt"), os.path.join(tmp, "Live.txt"))
+
+    opts = Options()
+    opts.add_argument("--headless=new")
+    opts.add_argument("--disable-gpu")
+    opts.add_argument("--no-sandbox")
+    driver = webdriver.Chrome(options=opts)
+    wait = WebDriverWait(driver, 20)
+
+    print(f"{'rows':>6} | {'per-cell (ms)':>14} | {'bulk (ms)':>10} | {'speedup':>7}")
+    print("-" * 48)
+    try:
+        for count in args.rows:
+            page = Path(tmp) / f"incident_list_{count}.html"
+            page.write_text(render_incident_list(make_incidents(count)), encoding="utf-8")
+            config.URL_NEW_STATE_LIST = page.as_uri()
+
+            results = {}
+            for bulk in (False, True):
+                config.BULK_SCRAPE = bulk
+                timings = []
+                for _ in range(args.cycles):
+                    start = time.perf_counter()
+                    found = scrape_l1_incidents_detailed(driver, wait)
+                    timings.append((time.perf_counter() - start) * 1000)
+                assert len(found) == count, f"expected {count} tickets, got {len(found)}"
+                results[bulk] = statistics.median(timings)
+
+            print(f"{count:>6} | {results[False]:>14.1f} | {results[True]:>10.1f} | "
+                  f"{results[False] / results[True]:>6.1f}x")
+    finally:
+        driver.quit()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,96 @@
+"""
+Benchmark: browser list scrape vs in-page refresh vs Table API ticket source.
+
+Starts the local stub instance and times one poll per cycle through each
+source. The REST source is measured with its keep-alive connection and
+with a fresh connection per poll to show what the pooling saves. The
+in-page source keeps the list loaded and only ships changed rows; --churn
+edits that many tickets between polls so the diff has something to carry.
+
+    python tools/bench_sources.py --rows 100 --cycles 20 [--no-browser]
+"""
+import argparse
+import os
+import statistics
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from snow_monitor import config  # noqa: E402
+from snow_monitor.logs import log_manager  # noqa: E402
+from snow_monitor.scraper import BrowserTicketSource, InPageTicketSource, RestTicketSource, list_url_query  # noqa: E402
+from snow_stub import SnowStub, make_incidents  # noqa: E402
+
+
+def time_cycles(fetch, cycles, expected, between=None):
+    timings = []
+    for _ in range(cycles):
+        if between: between()
+        start = time.perf_counter()
+        found = fetch()
+        timings.append((time.perf_counter() - start) * 1000)
+        assert len(found) == expected, f"expected {expected} tickets, got {len(found)}"
+    return statistics.median(timings), max(timings)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--rows", type=int, default=100)
+    parser.add_argument("--cycles", type=int, default=20)
+    parser.add_argument("--latency", type=float, default=0.0, help="Stub response delay in seconds")
+    parser.add_argument("--churn", type=int, default=2, help="Tickets edited between polls")
+    parser.add_argument("--no-browser", action="store_true", help="Only benchmark the REST source")
+    args = parser.parse_args()
+
+    tmp = tempfile.mkdtemp(prefix="snow_bench_")
+    log_manager.update_paths(os.path.join(tmp, "Log.txt"), os.path.join(tmp, "Live.txt"))
+    stub = SnowStub(make_incidents(args.rows), latency=args.latency).start()
+    config.URL_NEW_STATE_LIST = stub.list_url
+    query = list_url_query(stub.list_url)
+
+    def edit_tickets():
+        for inc in stub.incidents[:args.churn]:
+            stub.save(inc["number"], "1", f"Shift User {time.perf_counter():.6f}")
+
+    results = {}
+    rest = RestTicketSource(stub.base_url, query, "bench", "bench")
+    results["rest (keep-alive)"] = time_cycles(rest.fetch, args.cycles, args.rows)
+    rest.close()
+
+    def fetch_fresh():
+        src = RestTicketSource(stub.base_url, query, "bench", "bench")
+        try: return src.fetch()
+        finally: src.close()
+    results["rest (new connection)"] = time_cycles(fetch_fresh, args.cycles, args.rows)
+
+    if not args.no_browser:
+        from selenium import webdriver
+        from selenium.webdriver.chrome.options import Options
+        from selenium.webdriver.support.ui import WebDriverWait
+
+        opts = Options()
+        opts.add_argument("--headless=new")
+        opts.add_argument("--no-sandbox")
+        driver = webdriver.Chrome(options=opts)
+        try:
+            wait = WebDriverWait(driver, 20)
+            browser = BrowserTicketSource()
+            results["browser"] = time_cycles(lambda: browser.fetch(driver, wait), args.cycles, args.rows, edit_tickets)
+            inpage = InPageTicketSource()
+            inpage.fetch(driver, wait)  # First poll loads the list page and ships every row
+            results["inpage"] = time_cycles(lambda: inpage.fetch(driver, wait), args.cycles, args.rows, edit_tickets)
+        finally:
+            driver.quit()
+    stub.stop()
+
+    print(f"{args.rows} rows, {args.cycles} cycles")
+    print(f"{'source':<24} | {'median (ms)':>11} | {'max (ms)':>9}")
+    print("-" * 50)
+    for name, (median, worst) in results.items():
+        print(f"{name:<24} | {median:>11.1f} | {worst:>9.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,114 @@
+"""
+Load test for the mobile log viewer.
+
+Opens N concurrent keep-alive clients that poll /api/logs (and fetch the
+page now and then) and reports throughput and p50/p99 latency. Use
+--serve to start the viewer in-process with a steady stream of fake log
+lines, or point --url at a running monitor.
+
+    python tools/load_test_viewer.py --serve --clients 50 --requests 200
+    python tools/load_test_viewer.py --url http://192.168.1.20:8000 --clients 20
+"""
+import argparse
+import gzip
+import http.client
+import json
+import os
+import statistics
+import sys
+import tempfile
+import threading
+import time
+from urllib.parse import urlsplit
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+
+def start_local_viewer(port, line_rate):
+    """Starts the real viewer (snow_monitor.web) and a thread that keeps logging."""
+    from snow_monitor import config
+    from snow_monitor.logs import log_manager
+    from snow_monitor.web import start_web_server
+
+    tmp = tempfile.mkdtemp(prefix="snow_load_")
+    log_manager.update_paths(os.path.join(tmp, "Log.txt"), os.path.join(tmp, "Live.txt"))
+    config.WEB_SERVER_PORT = port
+    start_web_server()
+
+    def produce():
+        n = 0
+        while True:
+            n += 1
+            log_manager.add(f"    🎯 Active Tickets Found: {n % 20} - {time.strftime('%H:%M:%S')}")
+            time.sleep(1.0 / line_rate)
+    threading.Thread(target=produce, daemon=True).start()
+    time.sleep(0.5)
+
+
+def client(host, port, requests, gzip_ok, latencies, errors, barrier):
+    headers = {"Accept-Encoding": "gzip"} if gzip_ok else {}
+    conn = http.client.HTTPConnection(host, port, timeout=30)
+    since = 0
+    barrier.wait()
+    for i in range(requests):
+        path = "/" if i % 50 == 0 else f"/api/logs?since={since}"
+        start = time.perf_counter()
+        try:
+            conn.request("GET", path, headers=headers)
+            resp = conn.getresponse()
+            body = resp.read()
+            if resp.status not in (200, 304): raise RuntimeError(f"HTTP {resp.status}")
+            if path != "/":
+                if resp.getheader("Content-Encoding") == "gzip": body = gzip.decompress(body)
+                since = json.loads(body)["seq"]
+        except Exception as e:
+            errors.append(str(e))
+            conn.close()
+            conn = http.client.HTTPConnection(host, port, timeout=30)
+            continue
+        latencies.append((time.perf_counter() - start) * 1000)
+    conn.close()
+
+
+def percentile(values, pct):
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(len(ordered) * pct / 100))]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--url", default="http://127.0.0.1:8000")
+    parser.add_argument("--serve", action="store_true", help="Start the viewer in this process")
+    parser.add_argument("--clients", type=int, default=20)
+    parser.add_argument("--requests", type=int, default=100, help="Requests per client")
+    parser.add_argument("--line-rate", type=float, default=20.0, help="Fake log lines per second (--serve)")
+    parser.add_argument("--no-gzip", action="store_true")
+    args = parser.parse_args()
+
+    url = urlsplit(args.url)
+    host, port = url.hostname, url.port or 80
+    if args.serve:
+        start_local_viewer(port, args.line_rate)
+
+    latencies, errors = [], []
+    barrier = threading.Barrier(args.clients + 1)
+    threads = [threading.Thread(target=client, args=(host, port, args.requests, not args.no_gzip,
+                                                      latencies, errors, barrier))
+               for _ in range(args.clients)]
+    for t in threads: t.start()
+    barrier.wait()
+    start = time.perf_counter()
+    for t in threads: t.join()
+    elapsed = time.perf_counter() - start
+
+    print(f"{args.clients} clients x {args.requests} requests against {args.url}")
+    if latencies:
+        print(f"throughput : {len(latencies) / elapsed:,.0f} req/s")
+        print(f"p50        : {statistics.median(latencies):.2f} ms")
+        print(f"p99        : {percentile(latencies, 99):.2f} ms")
+        print(f"max        : {max(latencies):.2f} ms")
+    print(f"errors     : {len(errors)}" + (f" (first: {errors[0]})" if errors else ""))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,542 @@
+"""
+Offline stand-ins for the ServiceNow pages the monitor reads and writes.
+
+Serves the SSO login flow, the New-state incident list and its JSONv2
+export, the Table API and incident forms (gsft_main frame, incident.state,
+gsftSubmit) that save back into the in-memory queue. Optional churn adds
+and resolves tickets while it runs. Used by the benchmark scripts in this
+folder so the monitor can be timed without a live instance. Run it
+directly to serve a fake instance:
+
+    python tools/snow_stub.py --rows 100 --port 8080 --arrivals 6 --latency 0.05
+"""
+import argparse
+import html
+import json
+import random
+import struct
+import threading
+import time
+import zlib
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, quote, unquote, urlencode, urlsplit
+
+# Columns laid out like the real incident list (checkbox + context menu first)
+LIST_COLUMNS = ["", "", "Number", "Opened", "Short description", "Caller",
+                "Priority", "State", "Assignment group", "Assigned to", "Reopen count"]
+
+SAMPLE_ALERTS = [
+    "Monitor critical Alert - {host} CPU Overload [Index:{n}] MemoryUsed",
+    "Monitor warn Alert - {host} Tunnel Interface Flap [ID:{n}] Status",
+    "Monitor critical Alert - {host} BGP Peer Down [Peer:{n}] Session",
+    "Monitor warn Alert - {host} Disk Usage High [Vol:{n}] Capacity",
+]
+
+
+# incident.state choices on the form (value, label)
+STATES = [("1", "New"), ("2", "In Progress"), ("4", "Work in Progress"), ("21", "Pending Vendor"),
+          ("22", "Pending Tasks"), ("6", "Resolved"), ("7", "Closed"), ("8", "Canceled")]
+
+
+# Static assets like the UI pulls in on every page (served with SnowStub(assets=True))
+ASSET_TAGS = ("<link rel='stylesheet' href='/styles/glide.css?v=stub'>"
+              "<link rel='icon' href='/images/favicon.png'>")
+ROW_ICON = "<img src='/images/icon_info.png' width='16' height='16'>"
+HEADER_BANNER = "<div class='banner'><img src='/images/logo.png'></div>"
+
+
+def make_png(width, height, seed=0):
+    """A valid RGB PNG of noise (doesn't compress, so decoding costs like a real image)."""
+    rnd = random.Random(seed)
+    raw = b"".join(b"\x00" + rnd.randbytes(width * 3) for _ in range(height))
+    def chunk(kind, data):
+        return struct.pack(">I", len(data)) + kind + data + struct.pack(">I", zlib.crc32(kind + data))
+    return (b"\x89PNG\r\n\x1a\n" + chunk(b"IHDR", struct.pack(">IIBBBBB", width, height, 8, 2, 0, 0, 0))
+            + chunk(b"IDAT", zlib.compress(raw, 1)) + chunk(b"IEND", b""))
+
+
+def make_stylesheet(rules=4000):
+    """A glide.css-sized stylesheet: a web font, a background image and a few thousand rules."""
+    parts = ["@font-face { font-family: 'SourceSans'; src: url('/fonts/source-sans.woff2') format('woff2'); }",
+             "body { font-family: 'SourceSans', sans-serif; margin: 0; }",
+             ".banner { height: 48px; background: url('/images/header_bg.png'); }",
+             ".list2_body td { padding: 4px 8px; border-bottom: 1px solid #ddd; }"]
+    parts += [f".sn-c{i} .sn-w{i % 97} > span:hover {{ color: #{i % 4096:03x}; margin: {i % 7}px; }}"
+              for i in range(rules)]
+    return "\n".join(parts).encode("utf-8")
+
+
+def make_assets():
+    """path -> (content type, body) for the asset routes."""
+    return {
+        "/styles/glide.css": ("text/css", make_stylesheet()),
+        "/fonts/source-sans.woff2": ("font/woff2", random.Random(2).randbytes(80 * 1024)),
+        "/images/logo.png": ("image/png", make_png(400, 120, 3)),
+        "/images/header_bg.png": ("image/png", make_png(1920, 48, 4)),
+        "/images/icon_info.png": ("image/png", make_png(16, 16, 5)),
+        "/images/favicon.png": ("image/png", make_png(32, 32, 6)),
+    }
+
+
+# Incidents and RITMs are spread over these groups in turn, so queues can filter on assignment_group
+GROUPS = ["Network L1", "Network L2", "Firewall", "Wireless"]
+
+SAMPLE_REQUESTS = ["New VPN access for {host}", "Firewall rule change on {host}", "Port activation on {host}"]
+
+
+def make_incident(i, rnd):
+    """One fake New-state incident numbered INC9<i>."""
+    host = f"SITE{rnd.randint(1, 40):02d}-RTR{rnd.randint(1, 9):02d}"
+    return {
+        "number": f"INC9{i:07d}",
+        "short_description": rnd.choice(SAMPLE_ALERTS).format(host=host, n=rnd.randint(1, 9999)),
+        "assigned_to": rnd.choice(["", "", "Default User", "Shift User"]),
+        "reopen_count": rnd.choice([0, 0, 0, 1, 2]),
+        "state": "1",
+        "sys_updated_on": time.strftime("%Y-%m-%d %H:%M:%S"),
+        "assignment_group": GROUPS[i % len(GROUPS)],
+        "sys_id": f"sys_id_INC9{i:07d}",
+    }
+
+
+def make_ritm(i, rnd):
+    """One fake open requested item numbered RITM9<i>."""
+    return {
+        "number": f"RITM9{i:07d}",
+        "short_description": rnd.choice(SAMPLE_REQUESTS).format(host=f"SITE{rnd.randint(1, 40):02d}"),
+        "assigned_to": "",
+        "reopen_count": 0,
+        "state": "1",
+        "active": "true",
+        "sys_updated_on": time.strftime("%Y-%m-%d %H:%M:%S"),
+        "assignment_group": GROUPS[i % len(GROUPS)],
+        "sys_id": f"sys_id_RITM9{i:07d}",
+    }
+
+
+def make_ritms(count, seed=2):
+    """Generates `count` fake open requested items."""
+    rnd = random.Random(seed)
+    return [make_ritm(i, rnd) for i in range(count)]
+
+
+def matches(rec, query):
+    """Minimal encoded query: field=value and field!=value terms joined by ^ (dot-walks use the display value)."""
+    for term in query.split("^"):
+        if not term or term.startswith("ORDERBY"): continue
+        negate = "!=" in term
+        field, _, value = term.partition("!=" if negate else "=")
+        if (str(rec.get(field.split(".")[0], "")) == value) == negate: return False
+    return True
+
+
+def make_incidents(count, seed=1):
+    """Generates `count` fake New-state incidents."""
+    rnd = random.Random(seed)
+    return [make_incident(i, rnd) for i in range(count)]
+
+
+def render_incident_list(incidents, assets=False):
+    """Renders a static copy of incident_list.do with a `.list2_body` table (plus styles and icons with `assets`)."""
+    head = "".join(f"<th>{html.escape(c)}</th>" for c in LIST_COLUMNS)
+    rows = []
+    for inc in incidents:
+        cells = ["<input type='checkbox'>", ROW_ICON if assets else "&#9776;",
+                 html.escape(inc["number"]), "2025-12-10 20:00:00",
+                 html.escape(inc["short_description"]), "Monitoring", "3 - Moderate", "New",
+                 "Network L1", html.escape(inc["assigned_to"]) or "(empty)", str(inc["reopen_count"])]
+        rows.append("<tr class='list_row'>" + "".join(f"<td>{c}</td>" for c in cells) + "</tr>")
+    return (
+        "<!DOCTYPE html><html><head><meta charset='UTF-8'><title>Incidents</title>" + (ASSET_TAGS if assets else "") +
+        "<script>window.g_ck = 'stub-session-token';</script></head><body>" + (HEADER_BANNER if assets else "") +
+        "<table class='list2_table'><thead><tr>" + head + "</tr></thead>"
+        "<tbody class='list2_body'>" + "".join(rows) + "</tbody></table></body></html>"
+    )
+
+
+LOGIN_PAGE = """<!DOCTYPE html>
+<html><head><meta charset="UTF-8"><title>Login</title>
+<style>
+  #popup { position: fixed; inset: 0; background: rgba(0,0,0,.6); transition: opacity __FADE__ms; }
+  #popup.gone { opacity: 0; }
+  #corporateForm { display: none; }
+</style></head>
+<body>
+  <div id="popup"><button id="btnSetPopup">Accept</button></div>
+  <button id="corporateOpener">Corporate Login</button>
+  <div id="corporateForm">
+    <input id="UsernameInputTxtCorporate" type="text">
+    <input id="PasswordInputCorporate" type="password">
+    <button id="btnLoginCorporate">Log in</button>
+  </div>
+  <script>
+    const popup = document.getElementById('popup');
+    document.getElementById('btnSetPopup').onclick = () => {
+      popup.classList.add('gone');
+      setTimeout(() => popup.remove(), __FADE__);
+    };
+    document.getElementById('corporateOpener').onclick = () => {
+      setTimeout(() => { document.getElementById('corporateForm').style.display = 'block'; }, __FORM__);
+    };
+    document.getElementById('btnLoginCorporate').onclick = () => {
+      document.cookie = 'glide_session_store=stub; path=/';
+      setTimeout(() => { location.href = '/$pa_dashboard.do'; }, __LOGIN__);
+    };
+  </script>
+</body></html>"""
+
+DASHBOARD_PAGE = """<!DOCTYPE html>
+<html><head><meta charset="UTF-8"><title>Dashboard</title>
+<script>window.g_ck = 'stub-session-token';</script></head>
+<body><h1>Dashboard</h1></body></html>"""
+
+
+def render_login_page(fade_ms=300, form_ms=300, login_ms=500):
+    """Mock SSO login page with the element IDs initialize_driver clicks through."""
+    return (LOGIN_PAGE.replace("__FADE__", str(fade_ms)).replace("__FORM__", str(form_ms))
+            .replace("__LOGIN__", str(login_ms)))
+
+
+FORM_SHELL = """<!DOCTYPE html>
+<html><head><meta charset="UTF-8"><title>__NUMBER__ | Incident</title>__ASSETS__
+<script>window.g_ck = 'stub-session-token';</script></head>
+<body style="margin:0">
+  <iframe id="gsft_main" name="gsft_main" src="__SRC__" style="border:0;width:100%;height:100vh"></iframe>
+</body></html>"""
+
+FORM_PAGE = """<!DOCTYPE html>
+<html><head><meta charset="UTF-8"><title>__NUMBER__</title>__ASSETS__
+<script>window.g_ck = 'stub-session-token';</script></head>
+<body>
+  __BANNER__
+  __MESSAGE__
+  <form id="incident.do" method="POST" action="/incident.do">
+    <input type="hidden" name="sysparm_number" value="__NUMBER__">
+    <input id="sys_readonly.incident.number" value="__NUMBER__" readonly>
+    <input id="incident.short_description" name="incident.short_description" value="__DESC__">
+    <select id="incident.state" name="incident.state">__OPTIONS__</select>
+    <input id="sys_display.incident.assigned_to" value="__ASSIGNEE__">
+    <input id="incident.assigned_to" name="incident.assigned_to" type="hidden" value="__ASSIGNEE_ID__">
+    <button id="sysverb_update_and_stay" type="button">Save</button>
+  </form>
+  <script>
+    // Reference field: the hidden sys_id resolves a moment after the display value changes
+    const display = document.getElementById('sys_display.incident.assigned_to');
+    display.addEventListener('change', () => {
+      const hidden = document.getElementById('incident.assigned_to');
+      hidden.value = '';
+      setTimeout(() => { hidden.value = display.value ? 'sys_id_' + encodeURIComponent(display.value) : ''; },
+                 __REF_DELAY__);
+    });
+    function gsftSubmit(button) { document.getElementById('incident.do').submit(); }
+    document.getElementById('sysverb_update_and_stay').onclick = function () { gsftSubmit(this); };
+  </script>
+</body></html>"""
+
+
+def render_incident_form(inc, error=None, ref_delay_ms=100, assets=False):
+    """The incident form shown inside gsft_main (also the response to a save)."""
+    options = "".join(f"<option value='{v}'{' selected' if v == inc['state'] else ''}>{html.escape(label)}</option>"
+                      for v, label in STATES)
+    message = f"<div class='outputmsg_error'>{html.escape(error)}</div>" if error else ""
+    assignee = inc["assigned_to"]
+    return (FORM_PAGE.replace("__NUMBER__", html.escape(inc["number"]))
+            .replace("__DESC__", html.escape(inc["short_description"], quote=True))
+            .replace("__OPTIONS__", options).replace("__MESSAGE__", message)
+            .replace("__ASSIGNEE_ID__", f"sys_id_{quote(assignee)}" if assignee else "")
+            .replace("__ASSIGNEE__", html.escape(assignee, quote=True))
+            .replace("__REF_DELAY__", str(ref_delay_ms))
+            .replace("__ASSETS__", ASSET_TAGS if assets else "").replace("__BANNER__", HEADER_BANNER if assets else ""))
+
+
+def table_api_payload(incidents, fields, limit, offset):
+    """Shapes records like /api/now/table/<table> with sysparm_display_value=true."""
+    page = incidents[offset:offset + limit]
+    result = []
+    for inc in page:
+        rec = {k: str(v) for k, v in inc.items()}
+        if fields: rec = {k: rec.get(k, "") for k in fields}
+        result.append(rec)
+    return {"result": result}
+
+
+def jsonv2_payload(incidents, display_value=True):
+    """Shapes records like <table>_list.do?JSONv2 (every field, raw values unless displayvalue=true)."""
+    labels = dict(STATES)
+    records = []
+    for inc in incidents:
+        rec = {k: str(v) for k, v in inc.items()}
+        if display_value: rec["state"] = labels.get(inc["state"], inc["state"])
+        else: rec["assigned_to"] = f"sys_id_{quote(inc['assigned_to'])}" if inc["assigned_to"] else ""
+        records.append(rec)
+    return {"records": records}
+
+
+class StubHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"  # keep-alive, like the real instance
+    disable_nagle_algorithm = True  # headers and body go out as separate writes
+
+    def do_GET(self):
+        stub = self.server.stub
+        if stub.latency: time.sleep(stub.latency)
+        url = urlsplit(self.path)
+        query = parse_qs(url.query)
+
+        if url.path in stub.assets:
+            stub.asset_hits += 1
+            content_type, body = stub.assets[url.path]
+            self._send(200, content_type, body, cache=True)
+        elif url.path.startswith("/api/now/table/"):
+            stub.api_hits += 1
+            if not (self._logged_in() or self.headers.get("Authorization")):
+                self._send(401, "application/json", b'{"error": {"message": "User Not Authenticated"}}')
+                return
+            records = stub.records(url.path[len("/api/now/table/"):], query.get("sysparm_query", [""])[0])
+            fields = [f for f in query.get("sysparm_fields", [""])[0].split(",") if f]
+            limit = int(query.get("sysparm_limit", ["10000"])[0])
+            offset = int(query.get("sysparm_offset", ["0"])[0])
+            body = json.dumps(table_api_payload(records, fields, limit, offset)).encode("utf-8")
+            self._send(200, "application/json", body)
+        elif url.path == "/incident.do":
+            # sysparm_query=number=INC... ; the top-level page wraps the form in gsft_main like the UI does
+            number = query.get("sysparm_query", [""])[0].partition("number=")[2]
+            inc = stub.find(number)
+            if inc is None:
+                self._send(404, "text/plain", b"no such incident")
+            elif query.get("sysparm_frame"):
+                body = render_incident_form(inc, assets=bool(stub.assets)).encode("utf-8")
+                self._send(200, "text/html; charset=utf-8", body)
+            else:
+                src = f"/incident.do?sysparm_query=number%3D{quote(number)}&sysparm_frame=1"
+                body = (FORM_SHELL.replace("__NUMBER__", html.escape(number)).replace("__SRC__", src)
+                        .replace("__ASSETS__", ASSET_TAGS if stub.assets else ""))
+                self._send(200, "text/html; charset=utf-8", body.encode("utf-8"))
+        elif url.path == "/nav_to.do":
+            if self._logged_in():
+                self._redirect("/$pa_dashboard.do")  # Live session: straight through, like the real instance
+                return
+            body = render_login_page(*stub.login_delays_ms).encode("utf-8")
+            self._send(200, "text/html; charset=utf-8", body)
+        elif url.path == "/$pa_dashboard.do":
+            if not self._logged_in():
+                self._redirect("/nav_to.do?uri=%2F$pa_dashboard.do")
+                return
+            self._send(200, "text/html; charset=utf-8", DASHBOARD_PAGE.encode("utf-8"))
+        elif url.path.endswith("_list.do") and "JSONv2" in url.query.split("&"):
+            stub.api_hits += 1
+            records = stub.records(url.path[1:-len("_list.do")], query.get("sysparm_query", [""])[0])
+            if query.get("sysparm_action", [""])[0] == "getKeys":
+                payload = {"records": [rec["sys_id"] for rec in records]}
+            else:
+                payload = jsonv2_payload(records, query.get("displayvalue", [""])[0] == "true")
+            self._send(200, "application/json", json.dumps(payload).encode("utf-8"))
+        elif url.path.endswith("_list.do"):
+            records = stub.records(url.path[1:-len("_list.do")], query.get("sysparm_query", [""])[0])
+            body = render_incident_list(records, assets=bool(stub.assets)).encode("utf-8")
+            self._send(200, "text/html; charset=utf-8", body)
+        else:
+            self._send(404, "text/plain", b"not found")
+
+    def do_POST(self):
+        """Form save (gsftSubmit): applies state/assignee and re-renders the form."""
+        stub = self.server.stub
+        if stub.latency: time.sleep(stub.latency)
+        length = int(self.headers.get("Content-Length", "0"))
+        form = parse_qs(self.rfile.read(length).decode("utf-8"), keep_blank_values=True)
+        if urlsplit(self.path).path != "/incident.do":
+            self._send(404, "text/plain", b"not found")
+            return
+
+        number = form.get("sysparm_number", [""])[0]
+        error = None
+        if stub.save_error_rate and stub.rnd.random() < stub.save_error_rate:
+            error = "Record update failed: simulated error"
+            inc = stub.find(number)
+        else:
+            assignee_id = form.get("incident.assigned_to", [""])[0]
+            assignee = unquote(assignee_id[len("sys_id_"):]) if assignee_id.startswith("sys_id_") else None
+            inc = stub.save(number, form.get("incident.state", [""])[0], assignee)
+        if inc is None:
+            self._send(404, "text/plain", b"no such incident")
+            return
+        body = render_incident_form(inc, error, assets=bool(stub.assets)).encode("utf-8")
+        self._send(200, "text/html; charset=utf-8", body)
+
+    def _logged_in(self):
+        return "glide_session_store=" in self.headers.get("Cookie", "")
+
+    def _redirect(self, location):
+        self.send_response(302)
+        self.send_header("Location", location)
+        self.send_header("Content-Length", "0")
+        self.end_headers()
+
+    def _send(self, status, content_type, body, cache=False):
+        self.send_response(status)
+        self.send_header("Content-Type", content_type)
+        if cache: self.send_header("Cache-Control", "max-age=3600")  # Static assets are cached like on the instance
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+class SnowStub:
+    """
+    Local fake instance serving the login flow, the incident list page, the
+    Table API and incident forms. `arrivals_per_min` / `resolves_per_min`
+    add churn: new tickets appear and others are resolved by someone else.
+    `created` and `saved` record when each ticket appeared and when a form
+    save took it out of New, for latency measurements. `assets` adds the
+    stylesheet, web font and images the real pages load. `ritms` adds open
+    requested items (sc_req_item) for count-only queues. Lists, JSONv2 and
+    the Table API filter on the encoded query (see matches()).
+    """
+
+    def __init__(self, incidents, port=0, latency=0.0, login_delays_ms=(300, 300, 500),
+                 arrivals_per_min=0.0, resolves_per_min=0.0, save_error_rate=0.0, seed=1, assets=False, ritms=0):
+        self.incidents = incidents
+        self.tables = {"incident": incidents, "sc_req_item": make_ritms(ritms)}
+        self.by_number = {rec["number"]: rec for table in self.tables.values() for rec in table}
+        self.latency = latency
+        self.login_delays_ms = login_delays_ms  # popup fade, corporate form reveal, post-login redirect
+        self.arrivals_per_min = arrivals_per_min
+        self.resolves_per_min = resolves_per_min
+        self.save_error_rate = save_error_rate
+        self.rnd = random.Random(seed)
+        self.lock = threading.Lock()
+        self.api_hits = 0
+        self.assets = make_assets() if assets else {}
+        self.asset_hits = 0
+        now = time.time()
+        self.created = {inc["number"]: now for inc in incidents}  # number -> epoch it entered the queue
+        self.saved = {}     # number -> (epoch of the save that left New, new state)
+        self.resolved = {}  # number -> epoch it was resolved by churn
+        self.stopping = threading.Event()
+        self.server = ThreadingHTTPServer(("127.0.0.1", port), StubHandler)
+        self.server.daemon_threads = True
+        self.server.stub = self
+        self.thread = threading.Thread(target=self.server.serve_forever, daemon=True)
+
+    def find(self, number):
+        with self.lock:
+            return self.by_number.get(number)
+
+    def new_incidents(self):
+        with self.lock:
+            return [inc for inc in self.incidents if inc["state"] == "1"]
+
+    def records(self, table, query=""):
+        """Records of `table` matching an encoded query."""
+        with self.lock:
+            return [dict(rec) for rec in self.tables.get(table, []) if matches(rec, query)]
+
+    def add_ritm(self):
+        with self.lock:
+            ritms = self.tables["sc_req_item"]
+            ritm = make_ritm(len(ritms), self.rnd)
+            ritms.append(ritm)
+            self.by_number[ritm["number"]] = ritm
+            return ritm
+
+    def save(self, number, state, assignee=None):
+        """Applies a form save. Returns the updated incident (None if unknown)."""
+        with self.lock:
+            inc = self.by_number.get(number)
+            if inc is None: return None
+            if state: inc["state"] = state
+            if assignee: inc["assigned_to"] = assignee
+            inc["sys_updated_on"] = time.strftime("%Y-%m-%d %H:%M:%S")
+            if inc["state"] != "1" and number not in self.saved:
+                self.saved[number] = (time.time(), inc["state"])
+            return inc
+
+    def add_incident(self):
+        with self.lock:
+            inc = make_incident(len(self.incidents), self.rnd)
+            self.incidents.append(inc)
+            self.by_number[inc["number"]] = inc
+            self.created[inc["number"]] = time.time()
+            return inc
+
+    def resolve_random(self):
+        with self.lock:
+            open_incidents = [inc for inc in self.incidents if inc["state"] == "1"]
+            if not open_incidents: return None
+            inc = self.rnd.choice(open_incidents)
+            inc["state"] = "6"
+            inc["sys_updated_on"] = time.strftime("%Y-%m-%d %H:%M:%S")
+            self.resolved[inc["number"]] = time.time()
+            return inc
+
+    def _churn(self):
+        # Poisson arrivals/resolutions: exponential gaps at the configured rates
+        events = [(rate, action) for rate, action in ((self.arrivals_per_min, self.add_incident),
+                                                      (self.resolves_per_min, self.resolve_random)) if rate > 0]
+        due = [time.time() + self.rnd.expovariate(rate / 60.0) for rate, _ in events]
+        while not self.stopping.is_set():
+            idx = min(range(len(events)), key=lambda i: due[i])
+            if self.stopping.wait(max(0.0, due[idx] - time.time())): break
+            rate, action = events[idx]
+            action()
+            due[idx] = time.time() + self.rnd.expovariate(rate / 60.0)
+
+    @property
+    def base_url(self):
+        host, port = self.server.server_address[:2]
+        return f"http://{host}:{port}"
+
+    @property
+    def login_url(self):
+        return f"{self.base_url}/nav_to.do?uri=%2F$pa_dashboard.do"
+
+    @property
+    def list_url(self):
+        return f"{self.base_url}/incident_list.do?sysparm_query=state%3D1"
+
+    def queue_url(self, table, query):
+        return f"{self.base_url}/{table}_list.do?" + urlencode({"sysparm_query": query})
+
+    def incident_url(self, number):
+        return f"{self.base_url}/incident.do?sysparm_query=number={number}"
+
+    def start(self):
+        self.thread.start()
+        if self.arrivals_per_min > 0 or self.resolves_per_min > 0:
+            threading.Thread(target=self._churn, name="stub-churn", daemon=True).start()
+        return self
+
+    def stop(self):
+        self.stopping.set()
+        self.server.shutdown()
+        self.server.server_close()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Serve a fake ServiceNow instance")
+    parser.add_argument("--rows", type=int, default=50)
+    parser.add_argument("--port", type=int, default=8080)
+    parser.add_argument("--latency", type=float, default=0.0, help="Seconds added to every response")
+    parser.add_argument("--arrivals", type=float, default=0.0, help="New tickets per minute")
+    parser.add_argument("--resolves", type=float, default=0.0, help="Tickets resolved by others per minute")
+    parser.add_argument("--save-errors", type=float, default=0.0, help="Fraction of form saves that fail")
+    parser.add_argument("--assets", action="store_true", help="Pages load a stylesheet, web font and images")
+    parser.add_argument("--ritms", type=int, default=0, help="Open requested items (sc_req_item)")
+    args = parser.parse_args()
+
+    stub = SnowStub(make_incidents(args.rows), port=args.port, latency=args.latency,
+                    arrivals_per_min=args.arrivals, resolves_per_min=args.resolves,
+                    save_error_rate=args.save_errors, assets=args.assets, ritms=args.ritms).start()
+    print(f"Serving {args.rows} incidents at {stub.base_url} (Ctrl+C to stop)")
+    print(f"    login: {stub.login_url}")
+    print(f"    list:  {stub.list_url}")
+    try:
+        while True: time.sleep(1)
+    except KeyboardInterrupt:
+        stub.stop()
+
+
+if __name__ == "__main__":
+    main()